@@ -0,0 +1,98 @@
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+def write_file_atomic(file_path: str, text: Union[str, bytes]) -> None:
+    """Écrit un fichier via un fichier temporaire renommé : jamais de fichier à moitié écrit"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        binary = isinstance(text, bytes)
+        with os.fdopen(fd, 'wb' if binary else 'w', encoding=None if binary else 'utf-8') as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+class AutosaveWorker:
+    """Thread d'écriture en arrière-plan qui ne conserve que la dernière sauvegarde demandée"""
+    def __init__(self):
+        self._condition = threading.Condition()
+        # Une seule écriture en attente par clé (instantané, index, ...)
+        self._pending: Dict[str, Callable[[], None]] = {}
+        self._busy = False
+        self._stopped = False
+        # Événements d'état (état, message) à relayer par le thread Tk
+        self.events: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    @property
+    def is_idle(self) -> bool:
+        """Indique si aucune écriture n'est en cours ni en attente"""
+        with self._condition:
+            return not self._pending and not self._busy
+
+    def submit(self, job: Callable[[], None], key: str = "snapshot") -> None:
+        """Planifie une écriture ; remplace celle de même clé qui n'a pas encore commencé"""
+        with self._condition:
+            self._pending[key] = job
+            self._condition.notify_all()
+
+    def cancel_pending(self, key: Optional[str] = None) -> None:
+        """Abandonne les écritures en attente (celle en cours se termine normalement)"""
+        with self._condition:
+            if key is None:
+                self._pending.clear()
+            else:
+                self._pending.pop(key, None)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Attend la fin des écritures en attente et en cours"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Termine les écritures restantes puis arrête le thread"""
+        self.flush(timeout)
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                # Les écritures s'exécutent dans l'ordre de leur première demande
+                key = next(iter(self._pending))
+                job = self._pending.pop(key)
+                self._busy = True
+
+            self.events.put(("saving", "Sauvegarde en cours..."))
+            try:
+                job()
+                self.events.put(("saved", f"Sauvegardé à {time.strftime('%H:%M:%S')}"))
+            except Exception as e:
+                print(f"Erreur lors de la sauvegarde automatique: {e}")
+                self.events.put(("error", f"Échec de la sauvegarde: {e}"))
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
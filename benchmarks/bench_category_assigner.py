@@ -0,0 +1,44 @@
+"""Mesure l'attribution automatique des catégories (poids, âge, genre) sur une grande liste
+
+Usage : python benchmarks/bench_category_assigner.py [nb_joueurs]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from import_manager import ImportManager
+
+
+def build_roster(player_count, rng):
+    """Liste fédérale sans catégorie, avec quelques lignes incomplètes ou hors barème"""
+    roster = []
+    for i in range(player_count):
+        age = rng.randint(10, 40)
+        weight = round(rng.uniform(25, 110), 1)
+        roster.append({
+            "id": f"LIC{i:06d}", "name": f"Athlète {i}", "club": f"CLUB {i % 80}", "country": "CIV",
+            "category": "", "weight": "" if rng.random() < 0.01 else str(weight).replace(".", ","),
+            "age": str(age), "gender": rng.choice(["M", "F", "H", "f"]), "belt": "", "seed": ""
+        })
+    return roster
+
+
+def main():
+    player_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    roster = build_roster(player_count, random.Random(1))
+    manager = ImportManager()
+
+    start = time.perf_counter()
+    outside = manager.assign_categories(roster)
+    elapsed = time.perf_counter() - start
+
+    categories = {row["category"] for row in roster if row["category"]}
+    print(f"{player_count} athlètes répartis dans {len(categories)} catégories en {elapsed * 1000:.1f} ms")
+    print(f"Hors catégorie : {len(outside)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Mesure la durée du tirage séparant clubs et pays sur de nombreuses catégories
+
+Usage : python benchmarks/bench_draw.py [nb_categories] [nb_clubs]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tournament_manager import Player
+from draw_engine import seeded_draw
+
+COUNTRIES = ["CIV", "SEN", "MAR", "FRA", "KOR", "EGY", "NGR", "RSA"]
+
+
+def build_categories(category_count, club_count, rng):
+    """Catégories de 2 à 40 athlètes, quelques têtes de série par catégorie"""
+    categories = []
+    for c in range(category_count):
+        size = rng.randint(2, 40)
+        players = [Player(f"P{c}_{i}", f"Athlète {c}-{i}", f"CLUB {rng.randrange(club_count)}",
+                          rng.choice(COUNTRIES), f"CAT {c}") for i in range(size)]
+        for rank, player in enumerate(rng.sample(players, min(4, size // 4)), start=1):
+            player.seed = rank
+        categories.append(players)
+    return categories
+
+
+def first_round_clashes(leaves):
+    """Nombre de combats du premier tour entre athlètes d'un même club"""
+    return sum(1 for i in range(0, len(leaves), 2)
+               if leaves[i] and leaves[i + 1] and leaves[i].club == leaves[i + 1].club)
+
+
+def naive_draw(players, rng):
+    """Ancien tirage : mélange puis appariement des voisins"""
+    shuffled = list(players)
+    rng.shuffle(shuffled)
+    size = 1 << (len(shuffled) - 1).bit_length()
+    return shuffled + [None] * (size - len(shuffled))
+
+
+def main():
+    category_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    club_count = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    rng = random.Random(1)
+    categories = build_categories(category_count, club_count, rng)
+
+    start = time.perf_counter()
+    draws = [seeded_draw(players, random.Random(seed)) for seed, players in enumerate(categories)]
+    elapsed = time.perf_counter() - start
+
+    naive = [naive_draw(players, random.Random(seed)) for seed, players in enumerate(categories)]
+    print(f"{category_count} catégories, {sum(map(len, categories))} athlètes : tirage en {elapsed:.3f} s")
+    print(f"Combats du 1er tour entre coéquipiers : {sum(map(first_round_clashes, naive))} (mélange simple) "
+          f"-> {sum(map(first_round_clashes, draws))} (tirage séparé)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare la normalisation d'une feuille Excel (boucle iterrows ou opérations par colonne)
+et la lecture complète par pandas à la lecture en continu d'openpyxl (durée, pic mémoire)
+
+Usage : python benchmarks/bench_excel_import.py [nb_lignes] [--memoire]
+(--memoire mesure aussi le pic mémoire avec tracemalloc, ce qui ralentit fortement les lectures)
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from import_manager import ImportManager
+
+
+def build_workbook(file_path, row_count, rng):
+    """Feuille fédérale avec environ 1 % de lignes incomplètes"""
+    rows = []
+    for i in range(row_count):
+        rows.append({
+            "ID": f"LIC{i:06d}", "Name": f"Athlète {i}", "Club": f"CLUB {i % 80}", "Country": "CIV",
+            "Category": "" if rng.random() < 0.01 else f"Senior Men -{rng.choice([54, 58, 63, 68])}kg",
+            "Weight": round(rng.uniform(50, 90), 1), "Age": rng.randint(18, 35), "Gender": "M", "Belt": "Black"
+        })
+    pd.DataFrame(rows).to_excel(file_path, index=False)
+
+
+def peak_memory(read):
+    """Pic d'allocations Python pendant une lecture"""
+    tracemalloc.start()
+    try:
+        read()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def legacy_normalize(manager, df):
+    """Ancienne méthode : iterrows, pd.notna et str().strip() cellule par cellule"""
+    df = df.copy()
+    df.columns = [col.strip().lower() for col in df.columns]
+    for opt in manager.optional_fields:
+        if opt not in df.columns:
+            df[opt] = ""
+    data = []
+    for _, row in df.iterrows():
+        item = {}
+        for field in manager.required_fields + manager.optional_fields:
+            value = row[field]
+            item[field] = str(value).strip() if pd.notna(value) else ""
+        if all(item[field] for field in manager.required_fields) and len(item['id']) >= 2 and len(item['name']) >= 2:
+            data.append(item)
+    return data
+
+
+def main():
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    row_count = int(arguments[0]) if arguments else 20000
+    measure_memory = "--memoire" in sys.argv
+    manager = ImportManager()
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "licences.xlsx")
+        build_workbook(file_path, row_count, random.Random(1))
+
+        start = time.perf_counter()
+        df = pd.read_excel(file_path, sheet_name=0)
+        read_time = time.perf_counter() - start
+
+        # Lecture en continu : les lignes sont consommées sans être conservées
+        start = time.perf_counter()
+        streamed = sum(1 for _ in manager.iter_excel_rows(file_path))
+        stream_time = time.perf_counter() - start
+
+        if measure_memory:
+            read_peak = peak_memory(lambda: pd.read_excel(file_path, sheet_name=0))
+            stream_peak = peak_memory(lambda: sum(1 for _ in manager.iter_excel_rows(file_path)))
+
+    start = time.perf_counter()
+    legacy = legacy_normalize(manager, df)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    records, errors = manager.normalize_frame(df)
+    vectorized_time = time.perf_counter() - start
+
+    assert len(records) == len(legacy) and streamed == row_count
+    print(f"{row_count} lignes : pd.read_excel {read_time:.2f} s, openpyxl en continu {stream_time:.2f} s")
+    if measure_memory:
+        print(f"Pic mémoire : pd.read_excel {read_peak / 2 ** 20:.1f} Mo, "
+              f"openpyxl en continu {stream_peak / 2 ** 20:.1f} Mo")
+    print(f"Normalisation iterrows : {legacy_time * 1000:.0f} ms ; par colonne : {vectorized_time * 1000:.0f} ms")
+    print(f"{len(records)} lignes valides, {len(errors)} erreur(s) structurée(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare l'empreinte mémoire des modèles Player/Match avant et après __slots__
+
+Usage : python benchmarks/bench_models_memory.py [nb_joueurs] [nb_matchs]
+"""
+import os
+import sys
+import gc
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tournament_manager import Player, Match
+
+CATEGORIES = [f"{gender} {age} -{weight}kg" for gender in ("MEN", "WOMEN")
+              for age in ("CADETS", "JUNIORS", "SENIORS") for weight in (46, 54, 58, 63, 68, 74, 80, 87)]
+CLUBS = [f"CLUB {i}" for i in range(300)]
+COUNTRIES = ["CIV", "SEN", "MAR", "FRA", "KOR", "EGY", "NGR", "RSA"]
+
+
+class LegacyPlayer:
+    """Ancien modèle de joueur (attributs dans un __dict__ par instance)"""
+    def __init__(self, id, name, club, country, category, weight="", age=""):
+        self.id = id
+        self.name = name
+        self.club = club
+        self.country = country
+        self.category = category
+        self.weight = weight
+        self.age = age
+        self.wins = 0
+        self.losses = 0
+        self.points_scored = 0
+        self.points_received = 0
+        self.eliminated = False
+
+
+class LegacyMatch:
+    """Ancien modèle de match (gagnants des rounds dans une liste)"""
+    def __init__(self, match_id, blue_player, red_player, round_number, match_number, category):
+        self.match_id = match_id
+        self.blue_player = blue_player
+        self.red_player = red_player
+        self.round_number = round_number
+        self.match_number = match_number
+        self.category = category
+        self.winner = None
+        self.blue_score = 0
+        self.red_score = 0
+        self.blue_gam_jeom = 0
+        self.red_gam_jeom = 0
+        self.completed = False
+        self.round_winners = []
+
+
+def build(player_cls, match_cls, player_count, match_count):
+    """Construit un jeu de données réaliste (chaînes lues « depuis un fichier »)"""
+    players = []
+    for i in range(player_count):
+        # Concaténation pour obtenir des chaînes distinctes, comme après un json.load
+        category = "".join(CATEGORIES[i % len(CATEGORIES)])
+        club = "".join(CLUBS[i % len(CLUBS)])
+        country = "".join(COUNTRIES[i % len(COUNTRIES)])
+        players.append(player_cls(f"ID{i:06d}", f"Athlète {i}", club, country, category, "58", "17"))
+
+    matches = []
+    for i in range(match_count):
+        blue = players[(2 * i) % player_count]
+        red = players[(2 * i + 1) % player_count]
+        match = match_cls(f"M{i}", blue, red, 1 + i % 5, i, "".join(blue.category))
+        match.winner = "blue"
+        match.round_winners = ["blue", "red", "blue"]
+        matches.append(match)
+    return players, matches
+
+
+def measure(player_cls, match_cls, player_count, match_count):
+    """Mémoire allouée (octets) pour construire le jeu de données"""
+    gc.collect()
+    tracemalloc.start()
+    data = build(player_cls, match_cls, player_count, match_count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main():
+    player_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    match_count = int(sys.argv[2]) if len(sys.argv) > 2 else 40000
+
+    before = measure(LegacyPlayer, LegacyMatch, player_count, match_count)
+    after = measure(Player, Match, player_count, match_count)
+
+    print(f"{player_count} joueurs, {match_count} matchs")
+    print(f"Avant (classes avec __dict__) : {before / 1024 / 1024:8.2f} Mo")
+    print(f"Après (__slots__, chaînes internées, Corner) : {after / 1024 / 1024:8.2f} Mo")
+    print(f"Gain : {100 * (before - after) / before:.1f} %")
+
+
+if __name__ == "__main__":
+    main()
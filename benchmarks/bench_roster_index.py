@@ -0,0 +1,67 @@
+"""Compare le comptage des joueurs uniques par catégorie : parcours des noms ou index normalisé
+
+Usage : python benchmarks/bench_roster_index.py [nb_joueurs] [nb_categories]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tournament_manager import Player, Tournament
+
+FIRST_NAMES = ["Éric", "Aminata", "Jean-Pierre", "Moussa", "Fatou", "Kévin", "Awa", "Hélène"]
+
+
+def build_tournament(player_count, category_count, rng):
+    """Liste de joueurs avec environ 2 % de doublons écrits différemment"""
+    tournament = Tournament("Bench", "01/01/2026", "Abidjan")
+    for i in range(player_count):
+        name = f"{rng.choice(FIRST_NAMES)} NOM{i}"
+        if i and rng.random() < 0.02:
+            # Même athlète ressaisi : casse, accents et ordre des mots différents
+            original = tournament.players[f"P{rng.randrange(i)}"].name
+            name = " ".join(reversed(original.upper().replace("É", "E").split()))
+        tournament.add_player(Player(f"P{i}", name, "CLUB", "CIV", f"CAT {rng.randrange(category_count)}"))
+    return tournament
+
+
+def scan_unique_counts(tournament):
+    """Ancienne méthode du dialogue : parcours des noms exacts de chaque catégorie"""
+    counts = {}
+    for category, player_ids in tournament.categories.items():
+        seen_names = set()
+        for player_id in player_ids:
+            seen_names.add(tournament.players[player_id].name)
+        counts[category] = len(seen_names)
+    return counts
+
+
+def main():
+    player_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    category_count = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    tournament = build_tournament(player_count, category_count, random.Random(1))
+
+    start = time.perf_counter()
+    scanned = scan_unique_counts(tournament)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = tournament.roster_index
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = {category: index.unique_count(category) for category in tournament.categories}
+    query_time = time.perf_counter() - start
+
+    print(f"{player_count} joueurs, {category_count} catégories")
+    print(f"Parcours des noms : {scan_time * 1000:.1f} ms par ouverture du dialogue")
+    print(f"Index normalisé : construit une fois en {build_time * 1000:.1f} ms, "
+          f"comptage en {query_time * 1000:.2f} ms")
+    print(f"Doublons probables détectés : {len(index.duplicates())} groupe(s) ; joueurs uniques par catégorie : "
+          f"{sum(scanned.values())} (nom exact) -> {sum(indexed.values())} (nom normalisé)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import re
+import json
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Barèmes World Taekwondo : limite haute (incluse) de chaque catégorie de poids,
+# la dernière catégorie (« +limite ») accueille tous les athlètes plus lourds.
+# Les groupes sont examinés dans l'ordre : le premier dont la tranche d'âge convient l'emporte.
+WT_AGE_GROUPS: List[Dict[str, Any]] = [
+    {"name": "Cadet", "min_age": 12, "max_age": 14, "classes": {
+        "M": [33, 37, 41, 45, 49, 53, 57, 61, 65],
+        "F": [29, 33, 37, 41, 44, 47, 51, 55, 59]}},
+    {"name": "Junior", "min_age": 15, "max_age": 17, "classes": {
+        "M": [45, 48, 51, 55, 59, 63, 68, 73, 78],
+        "F": [42, 44, 46, 49, 52, 55, 59, 63, 68]}},
+    {"name": "Senior", "min_age": 18, "max_age": 99, "classes": {
+        "M": [54, 58, 63, 68, 74, 80, 87],
+        "F": [46, 49, 53, 57, 62, 67, 73]}}
+]
+
+# Première lettre de la colonne gender -> code du barème
+GENDER_CODES = {"M": "M", "H": "M", "G": "M", "F": "F", "W": "F"}
+GENDER_LABELS = {"M": "Men", "F": "Women"}
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)?")
+
+def load_age_groups(file_path: str) -> List[Dict[str, Any]]:
+    """Charge un barème JSON : {"age_groups": [{"name", "min_age", "max_age", "classes": {"M": [...], "F": [...]}}]}"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    age_groups = data["age_groups"] if isinstance(data, dict) else data
+    for group in age_groups:
+        for code, limits in group["classes"].items():
+            if list(limits) != sorted(limits):
+                raise ValueError(f"Limites non croissantes pour {group['name']} {code}")
+    return age_groups
+
+def _parse_number(value: Any) -> float:
+    """Premier nombre d'une cellule (« 67,5 kg » -> 67.5), NaN sinon"""
+    match = _NUMBER.search(str(value))
+    return float(match.group().replace(",", ".")) if match else np.nan
+
+def _by_value(column: pd.Series, convert, missing) -> np.ndarray:
+    """Applique convert une seule fois par valeur distincte de la colonne"""
+    # Une liste fédérale répète peu de poids, âges ou genres différents :
+    # les lignes ne sont que des indices dans le tableau des valeurs converties
+    codes, uniques = pd.factorize(column)
+    converted = np.array([convert(value) for value in uniques] + [missing], dtype=object)
+    return converted[codes]  # code -1 (cellule vide) -> valeur manquante
+
+def assign_categories(frame: pd.DataFrame,
+                      age_groups: List[Dict[str, Any]] = None) -> Tuple[pd.Series, pd.DataFrame]:
+    """Attribue une catégorie à chaque ligne (colonnes weight, age, gender) en une seule passe vectorisée
+
+    Retourne les catégories ("" si aucune ne convient) et le tableau des athlètes
+    hors catégorie (colonnes id, name, reason).
+    """
+    age_groups = age_groups or WT_AGE_GROUPS
+    empty = pd.Series("", index=frame.index)
+    weight = _by_value(frame.get("weight", empty), _parse_number, np.nan).astype(float)
+    age = _by_value(frame.get("age", empty), _parse_number, np.nan).astype(float)
+    gender = _by_value(frame.get("gender", empty),
+                       lambda value: GENDER_CODES.get(str(value).strip()[:1].upper(), ""), "")
+
+    categories = np.full(len(frame), "", dtype=object)
+    assigned = np.zeros(len(frame), dtype=bool)
+    valid = ~np.isnan(weight) & ~np.isnan(age) & (gender != "")
+    for group in age_groups:
+        in_group = valid & ~assigned & (age >= group["min_age"]) & (age <= group["max_age"])
+        if not in_group.any():
+            continue
+        for code, limits in group["classes"].items():
+            mask = in_group & (gender == code)
+            if not mask.any():
+                continue
+            prefix = f"{group['name']} {GENDER_LABELS.get(code, code)}"
+            labels = np.array([f"{prefix} -{limit:g}kg" for limit in limits] + [f"{prefix} +{limits[-1]:g}kg"],
+                              dtype=object)
+            # Indice de la première limite >= poids : limite haute incluse
+            categories[mask] = labels[np.searchsorted(np.asarray(limits, dtype=float), weight[mask], side="left")]
+            assigned |= mask
+
+    reasons = np.select(
+        [np.isnan(weight), np.isnan(age), gender == ""],
+        ["Poids manquant ou invalide", "Âge manquant ou invalide", "Genre manquant ou invalide"],
+        default="Aucune catégorie pour cet âge et ce genre"
+    )
+    outside = pd.DataFrame({
+        "id": frame.get("id", empty)[~assigned],
+        "name": frame.get("name", empty)[~assigned],
+        "reason": reasons[~assigned]
+    })
+    return pd.Series(categories, index=frame.index), outside
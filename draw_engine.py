@@ -0,0 +1,131 @@
+import random
+from typing import List, Dict, Optional, Sequence, Tuple
+
+def standard_seed_order(size: int) -> List[int]:
+    """Têtes de série (1 = première) de chaque emplacement d'un tableau de taille puissance de deux"""
+    # 1 et 2 ne se rencontrent qu'en finale, 1 à 4 qu'en demi-finale, etc.
+    order = [1]
+    while len(order) < size:
+        order = [seed for first in order for seed in (first, 2 * len(order) + 1 - first)]
+    return order
+
+def new_draw_seed() -> int:
+    """Graine aléatoire d'un tirage, à conserver pour pouvoir le vérifier ou le rejouer"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+def seeded_draw(players: Sequence, rng: random.Random) -> List[Optional[object]]:
+    """Place les joueurs dans un tableau puissance de deux (None = exempt)
+
+    Les têtes de série (attribut seed > 0) occupent les emplacements standard,
+    les exempts font face aux premières têtes de série, puis les autres athlètes
+    sont répartis pour éloigner ceux d'un même club, puis d'un même pays, dans
+    des moitiés, quarts, ... différents du tableau.
+    """
+    count = len(players)
+    size = 1 << (count - 1).bit_length()
+    slot_of_seed = {seed: slot for slot, seed in enumerate(standard_seed_order(size))}
+    leaves: List[Optional[object]] = [None] * size
+
+    # Arbre des sections du tableau (tas : 0 = tableau entier, feuilles = emplacements)
+    free = [0] * (2 * size - 1)
+    clubs: List[Dict[str, int]] = [{} for _ in range(size - 1)]
+    countries: List[Dict[str, int]] = [{} for _ in range(size - 1)]
+
+    def occupy(slot: int, player) -> None:
+        leaves[slot] = player
+        node = size - 1 + slot
+        free[node] = 0
+        while node:
+            node = (node - 1) // 2
+            free[node] -= 1
+            clubs[node][player.club] = clubs[node].get(player.club, 0) + 1
+            countries[node][player.country] = countries[node].get(player.country, 0) + 1
+
+    # Emplacements libres : tous sauf ceux des exempts (têtes de série au-delà du nombre de joueurs)
+    for seed in range(1, count + 1):
+        free[size - 1 + slot_of_seed[seed]] = 1
+    for node in range(size - 2, -1, -1):
+        free[node] = free[2 * node + 1] + free[2 * node + 2]
+
+    # Têtes de série dans l'ordre de leur rang
+    seeded = sorted((player for player in players if getattr(player, "seed", 0)), key=lambda p: p.seed)
+    for rank, player in enumerate(seeded, start=1):
+        occupy(slot_of_seed[rank], player)
+
+    # Les plus gros clubs d'abord : ce sont les plus difficiles à séparer
+    groups: Dict[str, list] = {}
+    for player in players:
+        if not getattr(player, "seed", 0):
+            groups.setdefault(player.club, []).append(player)
+    ordered_groups = list(groups.values())
+    rng.shuffle(ordered_groups)
+    ordered_groups.sort(key=len, reverse=True)
+
+    for group in ordered_groups:
+        rng.shuffle(group)
+        for player in group:
+            # Descendre dans la section contenant le moins de coéquipiers puis de compatriotes
+            node = 0
+            while node < size - 1:
+                left, right = 2 * node + 1, 2 * node + 2
+                if not free[left]:
+                    node = right
+                elif not free[right]:
+                    node = left
+                else:
+                    node = min((left, right), key=lambda child: (
+                        clubs[child].get(player.club, 0) if child < size - 1 else 0,
+                        countries[child].get(player.country, 0) if child < size - 1 else 0,
+                        -free[child],
+                        rng.random()
+                    ))
+            occupy(node - (size - 1), player)
+
+    return leaves
+
+def pool_order(count: int) -> List[Tuple[int, int]]:
+    """Ordre des combats d'une poule (toutes les paires) avec le moins de combats enchaînés
+
+    Recherche exacte par programmation dynamique sur les sous-ensembles de paires
+    (10 combats au plus pour une poule de 5) : le coût d'une transition vaut 1 si
+    les deux combats successifs ont un athlète en commun.
+    """
+    pairs = [(i, j) for i in range(count) for j in range(i + 1, count)]
+    total = len(pairs)
+    if total < 2:
+        return pairs
+    clash = [[int(bool(set(a) & set(b))) for b in pairs] for a in pairs]
+
+    # best[(ensemble joué, dernier combat)] = (coût, combat précédent)
+    full = (1 << total) - 1
+    best: Dict[Tuple[int, int], Tuple[int, int]] = {(1 << k, k): (0, -1) for k in range(total)}
+    for mask in range(1, full + 1):
+        for last in range(total):
+            state = best.get((mask, last))
+            if state is None:
+                continue
+            for following in range(total):
+                if mask >> following & 1:
+                    continue
+                key = (mask | 1 << following, following)
+                cost = state[0] + clash[last][following]
+                if key not in best or cost < best[key][0]:
+                    best[key] = (cost, last)
+
+    # Reconstruire la séquence depuis le meilleur dernier combat
+    last = min(range(total), key=lambda k: best[(full, k)][0])
+    order, mask = [], full
+    while last != -1:
+        order.append(pairs[last])
+        last, mask = best[(mask, last)][1], mask & ~(1 << last)
+    order.reverse()
+
+    # Alterner les coins : le bleu revient à l'athlète qui l'a eu le moins souvent
+    blue_count = [0] * count
+    oriented = []
+    for first, second in order:
+        if blue_count[second] < blue_count[first]:
+            first, second = second, first
+        blue_count[first] += 1
+        oriented.append((first, second))
+    return oriented
@@ -1,16 +1,43 @@
 import os
 import csv
+import codecs
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple, Set
+from openpyxl import load_workbook
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterator
+
+from category_assigner import WT_AGE_GROUPS, assign_categories, load_age_groups
+from virtual_treeview import VirtualTreeview
+
+# Taille de l'échantillon servant à détecter l'encodage d'un fichier CSV
+ENCODING_SAMPLE_SIZE = 64 * 1024
+# Lignes lues et validées par paquet lors d'une importation en continu
+CSV_CHUNK_SIZE = 2000
+# Au-delà de cette taille, un classeur .xlsx est lu en continu (openpyxl en lecture seule)
+# plutôt que chargé entièrement par pandas
+EXCEL_STREAMING_MIN_SIZE = 1024 * 1024
+STREAMING_EXCEL_FORMATS = ('.xlsx', '.xlsm')
 
 class ImportManager:
     """Gestionnaire d'importation de données pour le système de tournoi"""
     def __init__(self):
         self.supported_formats = ['.csv', '.xlsx', '.xls']
         self.required_fields = ['id', 'name', 'club', 'country', 'category']
-        self.optional_fields = ['weight', 'age', 'gender', 'belt']
+        self.optional_fields = ['weight', 'age', 'gender', 'belt', 'seed']
+        # Catégories calculées depuis poids, âge et genre : la colonne category devient facultative
+        self.auto_category = False
+        self.age_groups = WT_AGE_GROUPS
+    
+    @property
+    def reading_required_fields(self) -> List[str]:
+        """Champs exigés à la lecture du fichier"""
+        if self.auto_category:
+            return [field for field in self.required_fields if field != 'category']
+        return self.required_fields
     
     def validate_file_format(self, file_path: str) -> bool:
         """Vérifie si le format du fichier est supporté"""
@@ -27,6 +54,9 @@ class ImportManager:
             
             if ext.lower() == '.csv':
                 return self._read_csv(file_path)
+            elif self.use_streaming(file_path):
+                # Gros classeur : lecture en continu plutôt que chargement complet
+                return list(self.iter_excel_rows(file_path))
             elif ext.lower() in ['.xlsx', '.xls']:
                 return self._read_excel(file_path)
             
@@ -35,146 +65,274 @@ class ImportManager:
             print(f"Erreur lors de la lecture du fichier: {e}")
             return None
     
-    def _read_csv(self, file_path: str) -> List[Dict[str, Any]]:
-        """Lit un fichier CSV et retourne les données, peu importe le séparateur (virgule, point-virgule, tabulation)"""
-        import csv
-        data = []
+    def detect_encoding(self, file_path: str) -> str:
+        """Détermine l'encodage du fichier une seule fois, d'après son début"""
+        with open(file_path, 'rb') as file:
+            sample = file.read(ENCODING_SAMPLE_SIZE)
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
         try:
-            with open(file_path, 'r', encoding='utf-8-sig') as file:
-                # Lire un échantillon pour détecter le séparateur
-                sample = file.read(4096)
-                file.seek(0)
-                # Détection automatique du séparateur
-                sniffer = csv.Sniffer()
-                try:
-                    dialect = sniffer.sniff(sample, delimiters=[',', ';', '\t'])
-                except csv.Error:
-                    # Si la détection échoue, on tente tabulation puis virgule
-                    if '\t' in sample:
-                        dialect = csv.get_dialect('excel-tab')
-                    else:
-                        dialect = csv.get_dialect('excel')
-                reader = csv.DictReader(file, dialect=dialect)
-                for row in reader:
-                    # Normaliser les clés pour matcher les champs requis
-                    normalized_row = {k.strip().lower(): v for k, v in row.items()}
-                    # Vérifier que les champs requis sont présents
-                    if all(field in normalized_row for field in self.required_fields):
-                        # Remettre les clés d'origine attendues
-                        item = {}
-                        for field in self.required_fields + self.optional_fields:
-                            item[field] = normalized_row.get(field, "")
-                        data.append(item)
+            # Décodeur incrémental : un caractère coupé en fin d'échantillon n'est pas une erreur
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
         except UnicodeDecodeError:
-            with open(file_path, 'r', encoding='latin-1') as file:
-                sample = file.read(4096)
-                file.seek(0)
-                sniffer = csv.Sniffer()
+            return 'cp1252'
+    
+    def _sniff_dialect(self, sample: str):
+        """Détecte le séparateur (virgule, point-virgule, tabulation)"""
+        sniffer = csv.Sniffer()
+        try:
+            return sniffer.sniff(sample, delimiters=[',', ';', '\t'])
+        except csv.Error:
+            # Si la détection échoue, on tente tabulation puis virgule
+            if '\t' in sample:
+                return csv.get_dialect('excel-tab')
+            return csv.get_dialect('excel')
+    
+    def use_streaming(self, file_path: str) -> bool:
+        """Indique si le fichier doit être lu en continu sur un thread"""
+        _, ext = os.path.splitext(file_path)
+        ext = ext.lower()
+        if ext == '.csv':
+            return True
+        return ext in STREAMING_EXCEL_FORMATS and os.path.getsize(file_path) >= EXCEL_STREAMING_MIN_SIZE
+    
+    def iter_rows(self, file_path: str, progress: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Lit un fichier CSV ou un classeur .xlsx ligne à ligne"""
+        return (item for _, item in self._numbered_rows(file_path, progress))
+    
+    def _numbered_rows(self, file_path: str,
+                       progress: Optional[List[int]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Lignes du fichier avec leur numéro dans le fichier (l'en-tête est la ligne 1)"""
+        _, ext = os.path.splitext(file_path)
+        if ext.lower() in STREAMING_EXCEL_FORMATS:
+            return self._numbered_excel_rows(file_path, progress)
+        return self._numbered_csv_rows(file_path, progress)
+    
+    def _check_columns(self, columns) -> None:
+        """Lève ValueError si une colonne requise manque dans l'en-tête"""
+        missing = [field for field in self.reading_required_fields if field not in columns]
+        if missing:
+            raise ValueError(f"Colonnes manquantes: {', '.join(missing)}")
+    
+    def iter_csv_rows(self, file_path: str, progress: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Lit un fichier CSV ligne à ligne, peu importe le séparateur (virgule, point-virgule, tabulation)
+
+        progress, si fourni, reçoit [octets lus, taille du fichier].
+        """
+        return (item for _, item in self._numbered_csv_rows(file_path, progress))
+    
+    def _numbered_csv_rows(self, file_path: str,
+                           progress: Optional[List[int]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        encoding = self.detect_encoding(file_path)
+        if progress is not None:
+            progress[1] = os.path.getsize(file_path)
+        
+        def decoded_lines(file) -> Iterator[str]:
+            for raw in file:
+                if progress is not None:
+                    progress[0] += len(raw)
                 try:
-                    dialect = sniffer.sniff(sample, delimiters=[',', ';', '\t'])
-                except csv.Error:
-                    if '\t' in sample:
-                        dialect = csv.get_dialect('excel-tab')
-                    else:
-                        dialect = csv.get_dialect('excel')
-                reader = csv.DictReader(file, dialect=dialect)
-                for row in reader:
-                    normalized_row = {k.strip().lower(): v for k, v in row.items()}
-                    if all(field in normalized_row for field in self.required_fields):
-                        item = {}
-                        for field in self.required_fields + self.optional_fields:
-                            item[field] = normalized_row.get(field, "")
-                        data.append(item)
-        return data
-        
-    def _read_excel(self, file_path: str) -> List[Dict[str, Any]]:
-        """Lit un fichier Excel et retourne les données avec structure bien organisée"""
+                    yield raw.decode(encoding)
+                except UnicodeDecodeError:
+                    # Ligne isolée dans un autre encodage : la décoder seule, sans relire le fichier
+                    yield raw.decode('latin-1')
+        
+        with open(file_path, 'rb') as file:
+            # Lire un échantillon pour détecter le séparateur
+            dialect = self._sniff_dialect(file.read(4096).decode(encoding, errors='replace'))
+            file.seek(0)
+            reader = csv.DictReader(decoded_lines(file), dialect=dialect)
+            if reader.fieldnames is None:
+                return
+            # Normaliser les en-têtes pour matcher les champs requis
+            self._check_columns([name.strip().lower() for name in reader.fieldnames if name is not None])
+            for row in reader:
+                normalized_row = {k.strip().lower(): v for k, v in row.items() if k is not None}
+                # Remettre les clés d'origine attendues
+                item = {}
+                for field in self.required_fields + self.optional_fields:
+                    item[field] = normalized_row.get(field) or ""
+                yield reader.line_num, item
+    
+    def iter_excel_rows(self, file_path: str, progress: Optional[List[int]] = None) -> Iterator[Dict[str, Any]]:
+        """Lit la première feuille d'un classeur en lecture seule, ligne à ligne
+
+        Seules les colonnes attendues sont extraites ; les autres feuilles et les
+        styles ne sont jamais chargés. progress, si fourni, reçoit [lignes lues,
+        nombre de lignes annoncé par la feuille].
+        """
+        return (item for _, item in self._numbered_excel_rows(file_path, progress))
+    
+    def _numbered_excel_rows(self, file_path: str,
+                             progress: Optional[List[int]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
         try:
-            # Lire toutes les feuilles ou seulement la première
-            df = pd.read_excel(file_path, sheet_name=0)
-            
-            # Normaliser les noms de colonnes : minuscules et suppression espaces
-            df.columns = [col.strip().lower() for col in df.columns]
+            sheet = workbook.worksheets[0]
+            header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+            if header is None:
+                return
             
-            # Vérifier les colonnes requises (en minuscules)
-            required_lower = [f.lower() for f in self.required_fields]
-            if not all(field in df.columns for field in required_lower):
-                missing = set(required_lower) - set(df.columns)
-                print(f"Colonnes manquantes: {', '.join(missing)}")
-                return []
+            # Position de chaque colonne attendue (en-têtes en minuscules, sans espaces)
+            positions = {}
+            for position, title in enumerate(header):
+                if title is not None:
+                    positions.setdefault(str(title).strip().lower(), position)
+            self._check_columns(positions)
             
-            # Gérer les colonnes optionnelles
-            for opt in self.optional_fields:
-                opt_lower = opt.lower()
-                if opt_lower not in df.columns:
-                    df[opt_lower] = ""  # Ajouter colonne vide si manquante
+            fields = self.required_fields + self.optional_fields
+            first = min(positions[field] for field in fields if field in positions)
+            last = max(positions[field] for field in fields if field in positions)
+            columns = [(field, positions[field] - first) for field in fields if field in positions]
+            blank = dict.fromkeys(fields, "")
+            if progress is not None:
+                progress[1] = max((sheet.max_row or 1) - 1, 0)
             
-            # Convertir et formater les données avec structure bien organisée
-            data = []
-            for _, row in df.iterrows():
-                # Créer un dictionnaire avec toutes les colonnes bien structurées
-                item = {}
-                
-                # Colonnes requises
-                for field in self.required_fields:
-                    field_lower = field.lower()
-                    if field_lower in df.columns:
-                        value = row[field_lower]
-                        if pd.notna(value):
-                            item[field] = str(value).strip()
-                        else:
-                            item[field] = ""
-                    else:
-                        item[field] = ""
-                
-                # Colonnes optionnelles
-                for opt in self.optional_fields:
-                    opt_lower = opt.lower()
-                    if opt_lower in df.columns:
-                        value = row[opt_lower]
-                        if pd.notna(value):
-                            item[opt] = str(value).strip()
-                        else:
-                            item[opt] = ""
-                    else:
-                        item[opt] = ""
-                
-                # Nettoyer et valider les données
-                if self._validate_player_data(item):
-                    data.append(item)
-            
-            return data
+            rows = sheet.iter_rows(min_row=2, min_col=first + 1, max_col=last + 1, values_only=True)
+            for sheet_row, row in enumerate(rows, start=2):
+                if progress is not None:
+                    progress[0] += 1
+                item = dict(blank)
+                for field, index in columns:
+                    value = row[index] if index < len(row) else None
+                    item[field] = "" if value is None else str(value).strip()
+                # Les feuilles se terminent souvent par des lignes mises en forme mais vides
+                if any(item.values()):
+                    yield sheet_row, item
+        finally:
+            workbook.close()
+    
+    def iter_chunks(self, file_path: str, chunk_size: int = CSV_CHUNK_SIZE,
+                    cancel_event: Optional[threading.Event] = None) -> Iterator['ImportChunk']:
+        """Lit, complète et valide un fichier (CSV ou .xlsx) par paquets de chunk_size lignes"""
+        progress = [0, 0]
+        seen_ids: Set[str] = set()
+        numbers, rows = [], []
+        
+        def make_chunk() -> 'ImportChunk':
+            outside = self.assign_categories(rows) if self.auto_category else []
+            valid_rows, errors = [], []
+            # Les erreurs portent le numéro de ligne dans le fichier, en-tête compris
+            for line_number, row in zip(numbers, rows):
+                error = self._validate_row(line_number, row, seen_ids)
+                if error:
+                    errors.append(error)
+                else:
+                    valid_rows.append(row)
+            return ImportChunk(valid_rows, errors, outside, progress[0], progress[1])
+        
+        for line_number, row in self._numbered_rows(file_path, progress):
+            numbers.append(line_number)
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                yield make_chunk()
+                numbers, rows = [], []
+        if rows:
+            yield make_chunk()
+    
+    def _read_csv(self, file_path: str) -> List[Dict[str, Any]]:
+        """Lit un fichier CSV et retourne les données"""
+        return list(self.iter_csv_rows(file_path))
+        
+    def _read_excel(self, file_path: str) -> List[Dict[str, Any]]:
+        """Lit un fichier Excel et retourne les données avec structure bien organisée"""
+        try:
+            records, errors = self.read_excel(file_path)
         except Exception as e:
             print(f"Erreur lors de la lecture du fichier Excel: {e}")
             return []
+        if len(errors):
+            print(f"{len(errors)} ligne(s) Excel ignorée(s)")
+        return records
+    
+    def read_excel(self, file_path: str) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+        """Lit la première feuille d'un fichier Excel : lignes valides et tableau des erreurs"""
+        return self.normalize_frame(pd.read_excel(file_path, sheet_name=0))
+    
+    def normalize_frame(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], pd.DataFrame]:
+        """Nettoie et valide un tableau colonne par colonne (sans boucle sur les lignes)
+
+        Retourne les lignes valides et un tableau des erreurs (colonnes row, field,
+        value, reason), row étant le numéro de ligne dans la feuille.
+        """
+        # Normaliser les noms de colonnes : minuscules et suppression espaces
+        df = df.rename(columns=lambda col: str(col).strip().lower())
+        
+        # Vérifier les colonnes requises
+        missing = [field for field in self.reading_required_fields if field not in df.columns]
+        if missing:
+            print(f"Colonnes manquantes: {', '.join(missing)}")
+            return [], pd.DataFrame({"row": [None] * len(missing), "field": missing, "value": "",
+                                     "reason": [f"Colonne manquante: {field}" for field in missing]})
+        
+        # Texte nettoyé de chaque colonne attendue ("" pour une cellule vide ou une colonne absente)
+        fields = self.required_fields + self.optional_fields
+        empty = pd.Series("", index=df.index, dtype=object)
+        columns = {}
+        for field in fields:
+            if field in df.columns:
+                column = df[field]
+                columns[field] = column.where(column.notna(), "").astype(str).str.strip()
+            else:
+                columns[field] = empty
+        frame = pd.DataFrame(columns, index=df.index)
+        
+        # Règles de validation, de la plus prioritaire à la moins prioritaire
+        checks = []
+        for field in self.reading_required_fields:
+            checks.append((frame[field] == "", field, f"Champ requis manquant ou vide: {field}"))
+        checks.append((frame['id'].str.len() < 2, 'id', "ID invalide"))
+        checks.append((frame['name'].str.len() < 2, 'name', "Nom invalide"))
+        # Comme _validate_row : un ID n'est réservé que par une ligne qui a passé les règles précédentes
+        rejected = np.logical_or.reduce([mask.to_numpy() for mask, _, _ in checks])
+        checks.append((frame['id'].where(~rejected).duplicated() & ~rejected, 'id', "ID dupliqué"))
+        weight = pd.to_numeric(frame['weight'], errors='coerce')
+        checks.append((weight.isna(), 'weight', "Format de poids invalide"))
+        masks = [np.asarray(mask) for mask, _, _ in checks]
+        invalid = np.logical_or.reduce(masks)
+        
+        # Première règle non respectée par chaque ligne invalide
+        first = np.argmax(np.vstack(masks)[:, invalid], axis=0)
+        error_fields = np.array([field for _, field, _ in checks], dtype=object)[first]
+        rows = np.flatnonzero(invalid)
+        errors = pd.DataFrame({
+            "row": rows + 2,  # ligne d'en-tête puis numérotation Excel à partir de 1
+            "field": error_fields,
+            "value": [frame[field].iat[row] for field, row in zip(error_fields, rows)],
+            "reason": np.array([reason for _, _, reason in checks], dtype=object)[first]
+        })
+        
+        # Lignes valides construites depuis les tableaux NumPy (to_dict('records') boxe chaque cellule)
+        valid = ~invalid
+        frame['weight'] = weight.astype(object)
+        values = [frame[field].to_numpy(dtype=object)[valid] for field in fields]
+        records = [dict(zip(fields, row)) for row in zip(*values)]
+        return records, errors
     
-    def _validate_player_data(self, player_data: Dict[str, Any]) -> bool:
-        """Valide les données d'un joueur"""
-        # Vérifier que les champs requis ne sont pas vides
-        for field in self.required_fields:
-            if not player_data.get(field, "").strip():
-                print(f"Champ requis manquant ou vide: {field}")
-                return False
-        
-        # Valider le format de l'ID
-        player_id = player_data.get('id', '').strip()
-        if not player_id or len(player_id) < 2:
-            print(f"ID invalide: {player_id}")
-            return False
-        
-        # Valider le nom
-        name = player_data.get('name', '').strip()
-        if not name or len(name) < 2:
-            print(f"Nom invalide: {name}")
-            return False
-        
-        # Valider la catégorie
-        category = player_data.get('category', '').strip()
-        if not category:
-            print(f"Catégorie manquante pour {name}")
-            return False
-        
-        return True
+    @staticmethod
+    def format_errors(errors: pd.DataFrame) -> List[str]:
+        """Messages lisibles d'un tableau d'erreurs d'importation"""
+        return [reason if pd.isna(row) else f"Ligne {row}: {reason}"
+                for row, reason in zip(errors["row"], errors["reason"])]
+    
+    def assign_categories(self, data: List[Dict[str, Any]], overwrite: bool = False) -> List[str]:
+        """Calcule la catégorie des joueurs (poids, âge, genre) et retourne les athlètes hors catégorie"""
+        if not data:
+            return []
+        frame = pd.DataFrame.from_records(data, columns=self.required_fields + self.optional_fields)
+        categories, outside = assign_categories(frame, self.age_groups)
+        
+        # Ne remplir que les catégories vides, sauf demande de recalcul complet
+        fill = categories.to_numpy() != ""
+        if not overwrite:
+            fill &= frame['category'].fillna("").astype(str).str.strip().to_numpy() == ""
+        values = categories.to_numpy()
+        for position in fill.nonzero()[0]:
+            data[position]['category'] = values[position]
+        
+        return [f"{row.name} ({row.id}): {row.reason}" for row in outside.itertuples(index=False)]
     
     def validate_data(self, data: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
         """Valide les données importées"""
@@ -183,30 +341,83 @@ class ImportManager:
         seen_ids = set()
         
         for i, row in enumerate(data, start=1):
-            # Vérification des champs obligatoires
-            missing = [field for field in self.required_fields if field not in row or not row[field]]
-            if missing:
-                errors.append(f"Ligne {i}: Champs obligatoires manquants ({', '.join(missing)})")
-                continue
-            
-            # Vérification de l'unicité des IDs
-            player_id = row['id']
-            if player_id in seen_ids:
-                errors.append(f"Ligne {i}: ID dupliqué '{player_id}'")
-                continue
-            seen_ids.add(player_id)
-            
-            # Validation du poids
-            if 'weight' in row:
-                try:
-                    row['weight'] = float(row['weight'])
-                except (ValueError, TypeError):
-                    errors.append(f"Ligne {i}: Format de poids invalide '{row['weight']}'")
-                    continue
-            
-            valid_data.append(row)
+            error = self._validate_row(i, row, seen_ids)
+            if error:
+                errors.append(error)
+            else:
+                valid_data.append(row)
         
         return valid_data, errors
+    
+    def _validate_row(self, i: int, row: Dict[str, Any], seen_ids: Set[str]) -> Optional[str]:
+        """Valide une ligne (numéro i) et retourne le message d'erreur, ou None si elle est valide"""
+        # Vérification des champs obligatoires
+        missing = [field for field in self.required_fields if field not in row or not row[field]]
+        if missing:
+            return f"Ligne {i}: Champs obligatoires manquants ({', '.join(missing)})"
+        
+        # Mêmes règles de longueur que normalize_frame
+        if len(str(row['id']).strip()) < 2:
+            return f"Ligne {i}: ID invalide '{row['id']}'"
+        if len(str(row['name']).strip()) < 2:
+            return f"Ligne {i}: Nom invalide '{row['name']}'"
+        
+        # Vérification de l'unicité des IDs
+        player_id = row['id']
+        if player_id in seen_ids:
+            return f"Ligne {i}: ID dupliqué '{player_id}'"
+        seen_ids.add(player_id)
+        
+        # Validation du poids
+        if 'weight' in row:
+            try:
+                row['weight'] = float(row['weight'])
+            except (ValueError, TypeError):
+                return f"Ligne {i}: Format de poids invalide '{row['weight']}'"
+        
+        return None
+
+class ImportChunk:
+    """Paquet de lignes lues et validées pendant une importation en continu"""
+    __slots__ = ("rows", "errors", "outside", "done", "total")
+
+    def __init__(self, rows: List[Dict[str, Any]], errors: List[str], outside: List[str],
+                 done: int, total: int):
+        self.rows = rows
+        self.errors = errors
+        self.outside = outside  # Athlètes sans catégorie possible (catégories calculées)
+        # Avancement : octets lus pour un CSV, lignes lues pour un classeur
+        self.done = done
+        self.total = total
+
+class ImportWorker:
+    """Lecture d'un fichier (CSV ou .xlsx) en arrière-plan, paquet par paquet, annulable"""
+    def __init__(self, import_manager: ImportManager, file_path: str):
+        self.import_manager = import_manager
+        self.file_path = file_path
+        self._cancel = threading.Event()
+        # Événements à relayer par le thread Tk : ("chunk", ImportChunk), ("done", None),
+        # ("cancelled", None) ou ("error", message)
+        self.events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="import", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Demande l'arrêt de la lecture (au prochain paquet)"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Indique si l'annulation a été demandée"""
+        return self._cancel.is_set()
+
+    def _run(self) -> None:
+        try:
+            for chunk in self.import_manager.iter_chunks(self.file_path, cancel_event=self._cancel):
+                self.events.put(("chunk", chunk))
+            self.events.put(("cancelled" if self._cancel.is_set() else "done", None))
+        except Exception as e:
+            self.events.put(("error", str(e)))
 
 class ImportDialog(tk.Toplevel):
     """Boîte de dialogue pour importer des données"""
@@ -217,6 +428,11 @@ class ImportDialog(tk.Toplevel):
         self.import_manager = ImportManager()
         self.imported_data = []
         self.all_columns = []  # Stocke toutes les colonnes détectées
+        # Lecture en arrière-plan en cours (None sinon)
+        self.import_worker: Optional[ImportWorker] = None
+        self.import_errors: List[str] = []
+        self.import_outside: List[str] = []
+        self._filter_after_id = None
         
         self.title("Importation de joueurs")
         self.geometry("800x600")
@@ -261,32 +477,43 @@ class ImportDialog(tk.Toplevel):
         required_text = "Champs obligatoires: id, name, club, country, category"
         ttk.Label(file_frame, text=required_text, font=("Arial", 9, "italic")).pack(anchor=tk.W)
         
+        category_frame = ttk.Frame(file_frame)
+        category_frame.pack(fill=tk.X, pady=(5, 0))
+        self.auto_category_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(category_frame, text="Calculer les catégories manquantes (poids, âge, genre)",
+                        variable=self.auto_category_var).pack(side=tk.LEFT)
+        ttk.Button(category_frame, text="Barème...", command=self.choose_age_groups).pack(side=tk.LEFT, padx=10)
+        
         ttk.Button(file_frame, text="Importer", command=self.import_file).pack(anchor=tk.E, pady=(10, 0))
         
+        # Progression de la lecture en arrière-plan
+        progress_frame = ttk.Frame(file_frame)
+        progress_frame.pack(fill=tk.X, pady=(5, 0))
+        self.progress_var = tk.DoubleVar(value=0)
+        ttk.Progressbar(progress_frame, variable=self.progress_var, maximum=100).pack(
+            side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_import_button = ttk.Button(progress_frame, text="Arrêter", state=tk.DISABLED,
+                                               command=self.cancel_import)
+        self.cancel_import_button.pack(side=tk.LEFT, padx=(5, 0))
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(file_frame, textvariable=self.status_var, font=("Arial", 9)).pack(anchor=tk.W)
+        
         preview_frame = ttk.LabelFrame(main_frame, text="Aperçu des données", padding="10")
         preview_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        table_frame = ttk.Frame(preview_frame)
-        table_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Configuration des scrollbars
-        y_scrollbar = ttk.Scrollbar(table_frame)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        x_scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
-        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Configuration du Treeview
-        self.tree = ttk.Treeview(
-            table_frame,
-            yscrollcommand=y_scrollbar.set,
-            xscrollcommand=x_scrollbar.set,
-            show="headings"  # Afficher uniquement les en-têtes
-        )
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        # Filtre appliqué sur l'index en mémoire de l'aperçu
+        filter_frame = ttk.Frame(preview_frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(filter_frame, text="Filtrer:").pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.schedule_filter())
+        ttk.Entry(filter_frame, textvariable=self.filter_var, width=30).pack(side=tk.LEFT)
+        self.preview_count_var = tk.StringVar(value="")
+        ttk.Label(filter_frame, textvariable=self.preview_count_var, font=("Arial", 9)).pack(side=tk.RIGHT)
         
-        y_scrollbar.config(command=self.tree.yview)
-        x_scrollbar.config(command=self.tree.xview)
+        # Seules les lignes visibles sont créées dans le Treeview (tri par clic sur un en-tête)
+        self.preview = VirtualTreeview(preview_frame)
+        self.preview.pack(fill=tk.BOTH, expand=True)
         
         # Boutons de confirmation
         btn_frame = ttk.Frame(main_frame)
@@ -312,6 +539,21 @@ class ImportDialog(tk.Toplevel):
         if file_path:
             self.file_path_var.set(file_path)
     
+    def choose_age_groups(self):
+        """Charge un barème de catégories (JSON) à la place du barème World Taekwondo"""
+        file_path = filedialog.askopenfilename(
+            title="Sélectionner un barème de catégories",
+            filetypes=[("Fichiers JSON", "*.json"), ("Tous les fichiers", "*.*")]
+        )
+        if not file_path:
+            return
+        try:
+            self.import_manager.age_groups = load_age_groups(file_path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            messagebox.showerror("Erreur", f"Barème invalide: {e}", parent=self)
+            return
+        self.auto_category_var.set(True)
+    
     def import_file(self):
         """Importe les données du fichier sélectionné"""
         file_path = self.file_path_var.get()
@@ -324,13 +566,102 @@ class ImportDialog(tk.Toplevel):
             messagebox.showerror("Erreur", "Format de fichier non supporté")
             return
         
-        data = self.import_manager.read_file(file_path)
+        if self.import_worker:
+            messagebox.showinfo("Importation", "Une importation est déjà en cours", parent=self)
+            return
+        
+        self.import_manager.auto_category = self.auto_category_var.get()
+        if self.import_manager.use_streaming(file_path):
+            # Lecture en continu sur un thread : l'interface reste disponible
+            self.start_streaming_import(file_path)
+            return
+        
+        # Excel : lignes rejetées à la lecture signalées avec leur numéro dans la feuille
+        try:
+            data, excel_errors = self.import_manager.read_excel(file_path)
+        except Exception as e:
+            print(f"Erreur lors de la lecture du fichier Excel: {e}")
+            data, excel_errors = [], None
         
         if not data:
-            messagebox.showerror("Erreur", "Impossible de lire le fichier ou aucune donnée valide")
+            message = "Impossible de lire le fichier ou aucune donnée valide"
+            if excel_errors is not None and len(excel_errors):
+                message += "\n\n" + "\n".join(self.import_manager.format_errors(excel_errors)[:10])
+            messagebox.showerror("Erreur", message)
+            return
+        
+        outside = []
+        if self.import_manager.auto_category:
+            outside = self.import_manager.assign_categories(data)
+            # Sans catégorie calculable : déjà signalés parmi les athlètes hors catégorie
+            data = [row for row in data if row['category']]
+        self.finish_import(data, self.import_manager.format_errors(excel_errors), outside)
+    
+    def start_streaming_import(self, file_path: str):
+        """Lance la lecture d'un fichier en arrière-plan"""
+        self.imported_data = []
+        self.import_errors = []
+        self.import_outside = []
+        self.progress_var.set(0)
+        self.status_var.set("Lecture du fichier...")
+        self.cancel_import_button.config(state=tk.NORMAL)
+        self.import_worker = ImportWorker(self.import_manager, file_path)
+        self.after(100, self.poll_import)
+    
+    def poll_import(self):
+        """Récupère les paquets lus par le thread d'importation"""
+        worker = self.import_worker
+        if worker is None or not self.winfo_exists():
             return
         
-        valid_data, errors = self.import_manager.validate_data(data)
+        while not worker.events.empty():
+            event, payload = worker.events.get_nowait()
+            if event == "chunk":
+                self.imported_data.extend(payload.rows)
+                self.import_errors.extend(payload.errors)
+                self.import_outside.extend(payload.outside)
+                self.progress_var.set(min(100, 100 * payload.done / max(payload.total, 1)))
+                self.status_var.set(f"{len(self.imported_data)} joueurs lus, {len(self.import_errors)} erreur(s)")
+                continue
+            
+            self.import_worker = None
+            self.cancel_import_button.config(state=tk.DISABLED)
+            if event == "done":
+                self.progress_var.set(100)
+                self.finish_import(self.imported_data, self.import_errors, self.import_outside)
+            elif event == "cancelled":
+                self.imported_data = []
+                self.progress_var.set(0)
+                self.status_var.set("Importation annulée")
+                self.update_preview()
+            else:
+                self.status_var.set("")
+                messagebox.showerror("Erreur", f"Impossible de lire le fichier: {payload}", parent=self)
+            return
+        
+        self.after(100, self.poll_import)
+    
+    def cancel_import(self):
+        """Arrête la lecture en cours"""
+        if self.import_worker:
+            self.import_worker.cancel()
+            self.status_var.set("Annulation...")
+    
+    def destroy(self):
+        """Ferme la boîte de dialogue en arrêtant une lecture en cours"""
+        if self.import_worker:
+            self.import_worker.cancel()
+            self.import_worker = None
+        super().destroy()
+    
+    def finish_import(self, valid_data: List[Dict[str, Any]], errors: List[str], outside: List[str]):
+        """Signale les anomalies et affiche les joueurs valides"""
+        if outside:
+            outside_msg = "\n".join(outside[:10])
+            if len(outside) > 10:
+                outside_msg += f"\n... et {len(outside) - 10} autres"
+            messagebox.showwarning("Hors catégorie",
+                                   f"{len(outside)} athlète(s) sans catégorie possible:\n{outside_msg}")
         
         if errors:
             error_msg = "\n".join(errors[:10])
@@ -343,35 +674,38 @@ class ImportDialog(tk.Toplevel):
             return
         
         self.imported_data = valid_data
+        self.status_var.set(f"{len(valid_data)} joueurs prêts à être importés")
         self.update_preview()
     
     def update_preview(self):
         """Met à jour l'aperçu des données"""
-        # Réinitialiser le Treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        self.tree["columns"] = []
-        
         # Déterminer toutes les colonnes disponibles
-        if self.imported_data:
-            all_columns = set()
-            for row in self.imported_data:
-                all_columns.update(row.keys())
-            self.all_columns = sorted(all_columns)
-            
-            # Configurer les colonnes du Treeview
-            self.tree["columns"] = self.all_columns
-            
-            # Configurer les en-têtes
-            for col in self.all_columns:
-                self.tree.heading(col, text=col.capitalize())
-                self.tree.column(col, width=100, anchor=tk.W)
-            
-            # Ajouter les données
-            for row in self.imported_data:
-                values = [row.get(col, "") for col in self.all_columns]
-                self.tree.insert("", tk.END, values=values)
+        all_columns = set()
+        for row in self.imported_data:
+            all_columns.update(row.keys())
+        self.all_columns = sorted(all_columns)
+        
+        self.preview.set_rows(self.all_columns, self.imported_data)
+        self.preview.set_filter(self.filter_var.get())
+        self.update_preview_count()
+    
+    def schedule_filter(self):
+        """Applique le filtre après une courte pause de saisie"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(200, self.apply_filter)
+    
+    def apply_filter(self):
+        """Filtre les lignes de l'aperçu"""
+        self._filter_after_id = None
+        self.preview.set_filter(self.filter_var.get())
+        self.update_preview_count()
+    
+    def update_preview_count(self):
+        """Affiche le nombre de lignes retenues par le filtre"""
+        total = len(self.imported_data)
+        shown = self.preview.row_count
+        self.preview_count_var.set(f"{shown} lignes affichées sur {total}" if total else "")
     
     def confirm_import(self):
         """Confirme l'importation des données"""
@@ -11,6 +11,50 @@ from tkinter import Toplevel
 from tour_de_passage import afficher_pyramide
 
 from gamepad_manager import GamepadManager
+from match_checkpoint import MatchCheckpoint
+
+class PoolStandingsDialog(tk.Toplevel):
+    """Classement de chaque poule (victoires, différence de points, gam-jeom)"""
+    def __init__(self, parent, tournament):
+        super().__init__(parent)
+        self.tournament = tournament
+        self.title("Classement des poules")
+        self.geometry("700x450")
+        self.transient(parent)
+        self.grab_set()
+        
+        self.create_widgets()
+    
+    def create_widgets(self):
+        """Crée les widgets de la boîte de dialogue"""
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        table_frame = ttk.Frame(main_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        columns = ("rank", "name", "club", "played", "wins", "difference", "gam_jeom")
+        headings = ("Rang", "Nom", "Club", "Combats", "Victoires", "Diff. points", "Gam-jeom")
+        scrollbar = ttk.Scrollbar(table_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="tree headings", yscrollcommand=scrollbar.set)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.tree.yview)
+        self.tree.column("#0", width=150)
+        for column, heading in zip(columns, headings):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=70, anchor=tk.CENTER)
+        self.tree.column("name", width=150, anchor=tk.W)
+        self.tree.column("club", width=110, anchor=tk.W)
+        
+        for category in self.tournament.pool_standings:
+            node = self.tree.insert("", tk.END, text=category, open=True)
+            for rank, standing in enumerate(self.tournament.pool_ranking(category), start=1):
+                self.tree.insert(node, tk.END, values=(
+                    rank, standing.player.name, standing.player.club, standing.played,
+                    standing.wins, standing.point_difference, standing.gam_jeom
+                ))
+        
+        ttk.Button(main_frame, text="Fermer", command=self.destroy).pack(side=tk.RIGHT, pady=(10, 0))
 
 class TaekwondoInterface:
     THEMES = {
@@ -75,12 +119,17 @@ class TaekwondoInterface:
         from tournament_manager import TournamentManager
         self.tournament_manager = TournamentManager(self)
         
+        # Journal de reprise du match en cours (arrêt brutal de l'application)
+        self.match_checkpoint = MatchCheckpoint(self.tournament_manager.data_dir)
+        
         # Initialiser le gestionnaire d'affichage du tournoi
         from tournament_display import TournamentDisplay
         self.tournament_display = TournamentDisplay(self)
         
         # Mode de match (tournoi ou libre)
         self.match_mode = "libre"  # Par défaut, mode libre
+        # Tapis géré par ce poste (planning multi-tapis)
+        self.current_mat = 1
         
         # Variables d'état du match
         self.is_running = False
@@ -91,6 +140,8 @@ class TaekwondoInterface:
         self.remaining_break_time = 0
         self.round_number = 1
         self.max_rounds = 2
+        # Nombre de rounds configuré : max_rounds y revient après un round supplémentaire
+        self.base_rounds = 2
         self.blue_score = 0
         self.red_score = 0
         self.match_configured = False
@@ -150,6 +201,7 @@ class TaekwondoInterface:
         
         # Créer les frames principaux
         self.create_main_frames()
+        self.tournament_manager.on_save_status = self.update_save_status
         
         # Créer le menu principal
         self.create_main_menu()
@@ -159,6 +211,9 @@ class TaekwondoInterface:
         
         # Gestion de la fermeture
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Proposer la reprise d'un match interrompu, sinon configurer un nouveau match
+        self.root.after(0, self.offer_match_resume)
     
     def create_main_menu(self):
         """Crée le menu principal de l'application"""
@@ -178,9 +233,13 @@ class TaekwondoInterface:
         tournament_menu.add_command(label="Nouveau tournoi", command=self.create_new_tournament)
         tournament_menu.add_command(label="Charger tournoi", command=self.load_tournament)
         tournament_menu.add_command(label="Importer joueurs", command=self.import_players)
+        tournament_menu.add_command(label="Archiver tournoi", command=self.export_tournament_archive)
+        tournament_menu.add_command(label="Format de stockage...", command=self.change_storage_backend)
         tournament_menu.add_separator()
         tournament_menu.add_command(label="Générer matchs", command=self.generate_matches)
         tournament_menu.add_command(label="Prochain match", command=self.load_next_match)
+        tournament_menu.add_command(label="Planning des tapis", command=self.show_mat_schedule)
+        tournament_menu.add_command(label="Classement des poules", command=self.show_pool_standings)
         
         # Menu Outils  
         tools_menu = tk.Menu(menubar, tearoff=0)
@@ -282,6 +341,7 @@ class TaekwondoInterface:
         self.current_time = self.round_time
         self.remaining_break_time = 0
         self.round_number = 1
+        self.max_rounds = self.base_rounds
         self.blue_score = 0
         self.red_score = 0
         self.blue_gam_jeom = 0
@@ -300,6 +360,9 @@ class TaekwondoInterface:
         self.pending_blue_gam = 0
         self.pending_red_gam = 0
         
+        # Le match précédent ne sera plus repris
+        self.match_checkpoint.clear()
+        
         # Effacer le message de félicitations
         self.winner_frame.grid_remove()
         for widget in self.winner_frame.winfo_children():
@@ -370,6 +433,19 @@ class TaekwondoInterface:
                            bg=theme["header_bg"], fg=theme["fg"], bd=0, 
                            activebackground='#555555')
         help_btn.pack(side='right', padx=10, pady=5)
+        
+        # État de la sauvegarde automatique du tournoi (sans boîte modale)
+        self.save_status_label = tk.Label(self.toolbar, text="", font=('Arial', 10),
+                                          bg=theme["header_bg"], fg=theme["fg"])
+        self.save_status_label.pack(side='left', padx=10, pady=5)
+    
+    def update_save_status(self, state, message):
+        """Affiche l'état de la sauvegarde automatique dans la barre d'outils"""
+        colors = {'saving': '#FFD700', 'saved': '#4CAF50', 'error': '#F44336'}
+        icons = {'saving': '⏳', 'saved': '💾', 'error': '⚠️'}
+        if hasattr(self, 'save_status_label'):
+            self.save_status_label.config(text=f"{icons.get(state, '')} {message}",
+                                          fg=colors.get(state, self.THEMES[self.theme_mode]["fg"]))
 
     def show_configuration_dialog(self):
         """Affiche la fenêtre de configuration modernisée"""
@@ -1002,6 +1078,9 @@ class TaekwondoInterface:
                 # Changement de couleur pour les derniers instants
                 if self.current_time <= 10:
                     self.time_display.config(fg='red')
+                # Enregistrer le temps restant toutes les 5 secondes
+                if self.current_time % 5 == 0:
+                    self.checkpoint_match_state()
                 time.sleep(1)
         
         if self.current_time <= 0:
@@ -1037,6 +1116,7 @@ class TaekwondoInterface:
             self.status_label.config(text="Paused", bg='orange')
             self.show_modification_controls()  # Correction ici
             self.update_button_states()
+            self.checkpoint_match_state()
         
     def toggle_pause(self):
         """Basculer entre pause et reprise"""
@@ -1078,7 +1158,11 @@ class TaekwondoInterface:
             else:
                 # Égalité après tous les rounds - on ajoute un round supplémentaire
                 self.max_rounds += 1
+                if self.match_mode == "tournoi" and getattr(self, 'current_match_id', None):
+                    # Le tapis finira plus tard : les autres tapis reprennent ses matchs en attente
+                    self.tournament_manager.mats.extend_current(self.current_mat, self.break_time + self.round_time)
                 self.start_break()
+                self.checkpoint_match_state()
                 return
 
             # Afficher le vainqueur final
@@ -1086,6 +1170,7 @@ class TaekwondoInterface:
         else:
             # Démarrer le temps de repos avant le prochain round
             self.start_break()
+            self.checkpoint_match_state()
 
         self.update_button_states()
 
@@ -1124,6 +1209,7 @@ class TaekwondoInterface:
         
         self.update_round_winners_display()
         self.update_button_states()
+        self.checkpoint_match_state()
     
     def show_final_winner(self, winner=None):
         """Afficher le vainqueur final du match"""
@@ -1174,6 +1260,9 @@ class TaekwondoInterface:
         # Sauvegarder automatiquement le résultat du match
         self.final_winner = winner
         self.save_match_result()
+        
+        # Match terminé : plus rien à reprendre
+        self.match_checkpoint.clear()
     
     def add_score(self, fighter, points):
         """Ajouter des points à un combattant"""
@@ -1183,6 +1272,7 @@ class TaekwondoInterface:
         else:
             self.red_score += points
             self.red_score_label.config(text=str(self.red_score))
+        self.checkpoint_match_state()
         
         # Vérifier les conditions de victoire instantanée pour le round
         self.check_instant_win_round()
@@ -1253,6 +1343,7 @@ class TaekwondoInterface:
         self.pending_blue_gam = 0
         self.pending_red_gam = 0
         self.update_pending_labels()
+        self.checkpoint_match_state()
         
         # Mettre à jour les paramètres de temps
         try:
@@ -1276,6 +1367,89 @@ class TaekwondoInterface:
         self.pending_red_gam = 0
         self.update_pending_labels()
     
+    def match_checkpoint_info(self):
+        """Description du match en cours pour le journal de reprise"""
+        info = {attr: getattr(self, attr) for attr in (
+            "match_mode", "blue_name", "red_name", "blue_club", "red_club",
+            "blue_country", "red_country", "match_number", "category", "judges_count",
+            "round_time", "break_time", "base_rounds", "instant_win_gamjeom", "instant_win_point_gap",
+            "sudden_death_points"
+        )}
+        info["match_id"] = getattr(self, 'current_match_id', None)
+        info["tournament_path"] = (self.tournament_manager.get_index_path()
+                                   if self.tournament_manager.tournament else None)
+        return info
+    
+    def checkpoint_match_state(self):
+        """Ajoute l'état du match en cours au journal de reprise"""
+        if not self.match_configured or self.final_winner:
+            return
+        if not self.match_checkpoint.active:
+            self.match_checkpoint.begin(self.match_checkpoint_info())
+        self.match_checkpoint.record({
+            "blue_score": self.blue_score,
+            "red_score": self.red_score,
+            "blue_gam_jeom": self.blue_gam_jeom,
+            "red_gam_jeom": self.red_gam_jeom,
+            "round_winners": list(self.round_winners),
+            "round_number": self.round_number,
+            "max_rounds": self.max_rounds,
+            "current_time": self.current_time,
+            "is_break_time": self.is_break_time
+        })
+    
+    def offer_match_resume(self):
+        """Propose de reprendre le match interrompu lors de la dernière session
+
+        Sans match à reprendre (ou si la reprise est refusée), ouvre la configuration
+        d'un nouveau match : elle ne doit pas s'afficher pendant la question.
+        """
+        saved = self.match_checkpoint.load()
+        if not saved or not saved["state"]:
+            self.match_checkpoint.clear()
+            self.show_configuration_dialog()
+            return
+        
+        info, state = saved["match"], saved["state"]
+        if not messagebox.askyesno("Reprise du match",
+                                   f"Un match a été interrompu : {info['blue_name']} vs {info['red_name']} "
+                                   f"(round {state['round_number']}).\n\nVoulez-vous le reprendre ?"):
+            self.match_checkpoint.clear()
+            self.show_configuration_dialog()
+            return
+        
+        # Recharger le tournoi du match si nécessaire
+        tournament_path = info.pop("tournament_path")
+        match_id = info.pop("match_id")
+        if tournament_path and not self.tournament_manager.tournament:
+            self.tournament_manager.load_tournament(tournament_path)
+        if match_id and self.tournament_manager.tournament:
+            self.current_match = self.tournament_manager.tournament.matches.get(match_id)
+            self.current_match_id = match_id if self.current_match else None
+        
+        for attr, value in info.items():
+            setattr(self, attr, value)
+        self.blue_flag = self.flag_dict.get(self.blue_country, "🏳️")
+        self.red_flag = self.flag_dict.get(self.red_country, "🏳️")
+        
+        self.reset_match_data()
+        self.match_configured = True
+        self.setup_ui()
+        self.gamepad_manager.setup_judges(self.judges_count)
+        
+        # Restaurer l'état du combat (le chronomètre reste arrêté)
+        is_break_time = state.pop("is_break_time")
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self.update_display()
+        self.update_round_winners_display()
+        self.checkpoint_match_state()
+        # Arrêt pendant la pause entre deux rounds : passer directement au round suivant
+        if is_break_time:
+            self.next_round()
+        
+        self.show_notification(f"Match {self.match_number} repris", "success")
+    
     def show_settings(self):
         """Afficher les paramètres"""
         self.show_configuration_dialog()
@@ -1385,6 +1559,7 @@ class TaekwondoInterface:
                 # Incrémenter le compteur de gam-jeom du rouge
                 self.red_gam_jeom += 1
                 self.red_gam_label.config(text=str(self.red_gam_jeom))
+            self.checkpoint_match_state()
         else:
             # Points normaux
             self.add_score(player, value)
@@ -1427,6 +1602,8 @@ class TaekwondoInterface:
         if hasattr(self, 'tournament_manager') and self.tournament_manager.tournament:
             if messagebox.askyesno("Sauvegarde", "Voulez-vous sauvegarder le tournoi en cours?"):
                 self.tournament_manager.save_tournament()
+        # Terminer les sauvegardes automatiques encore en cours
+        self.tournament_manager.shutdown()
         
         # Arrêter les threads de surveillance des manettes
         self.gamepad_manager.stop_monitoring = True
@@ -1437,6 +1614,45 @@ class TaekwondoInterface:
         self.root.quit()
         self.root.destroy()
     
+    def export_tournament_archive(self):
+        """Exporte le tournoi en cours dans une archive compressée"""
+        self.tournament_manager.flush_autosave()
+        self.tournament_manager.export_archive()
+    
+    def change_storage_backend(self):
+        """Enregistre le tournoi en cours dans un autre format de stockage"""
+        if not self.tournament_manager.tournament:
+            messagebox.showerror("Erreur", "Veuillez d'abord créer ou charger un tournoi")
+            return
+        from tournament_manager import STORAGE_BACKENDS
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Format de stockage")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        frame = ttk.Frame(dialog, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        backend_var = tk.StringVar(value=self.tournament_manager.storage_backend)
+        for backend, label in STORAGE_BACKENDS.items():
+            ttk.Radiobutton(frame, text=label, value=backend, variable=backend_var).pack(anchor=tk.W, pady=2)
+        ttk.Label(frame, text="SQLite : la base est réservée au poste qui l'a ouverte",
+                  font=("Arial", 9, "italic")).pack(anchor=tk.W, pady=(5, 0))
+        
+        def on_apply():
+            backend = backend_var.get()
+            if backend != self.tournament_manager.storage_backend:
+                if not self.tournament_manager.change_storage_backend(backend):
+                    return
+                self.show_notification(f"Tournoi enregistré : {STORAGE_BACKENDS[backend]}", "success")
+            dialog.destroy()
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(btn_frame, text="Appliquer", command=on_apply).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Annuler", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        self.center_window(dialog)
+    
     def create_new_tournament(self):
         """Crée un nouveau tournoi"""
         from tournament_manager import TournamentDialog
@@ -1545,25 +1761,50 @@ class TaekwondoInterface:
         self.root.wait_window(dialog)
     
     def handle_imported_players(self, players_data):
-        """Traite les données des joueurs importés"""
+        """Applique une importation : ajouts, modifications et retraits par rapport à la liste actuelle"""
         if not players_data:
             return
             
-        count = 0
-        for data in players_data:
-            from tournament_manager import Player
-            player = Player(
-                id=data['id'],
-                name=data['name'],
-                club=data['club'],
-                country=data['country'],
-                category=data['category'],
-                weight=data.get('weight', ''),
-                age=data.get('age', '')
+        tournament = self.tournament_manager.tournament
+        diff = tournament.diff_roster(players_data)
+        
+        withdraw = True
+        if diff.withdrawn:
+            withdraw = messagebox.askyesno(
+                "Retraits",
+                f"{len(diff.withdrawn)} athlète(s) inscrit(s) ne figurent pas dans ce fichier.\n"
+                "Les retirer du tournoi ?\n\n(Non : appliquer seulement les ajouts et modifications)"
             )
-            self.tournament_manager.tournament.add_player(player)
-            count += 1
-        self.show_notification(f"{count} joueurs importés avec succès", "success")
+            if not withdraw:
+                diff.withdrawn = []
+        tournament.apply_roster_diff(diff, withdraw)
+        
+        if diff.has_changes:
+            self.show_notification(diff.summary(), "success")
+        else:
+            self.show_notification("Aucun changement dans la liste des athlètes", "info")
+        
+        # Détail des changements (hors simples ajouts) et de ceux bloqués par un tirage
+        lines = diff.details()[len(diff.added):]
+        if lines:
+            if len(lines) > 30:
+                lines = lines[:30] + [f"... et {len(lines) - 30} autre(s)"]
+            show = messagebox.showwarning if diff.locked else messagebox.showinfo
+            show("Mise à jour des inscriptions", "\n".join(lines))
+        
+        duplicates = tournament.roster_index.duplicates()
+        if duplicates:
+            self.show_notification(f"{len(duplicates)} doublon(s) probable(s) : vérifiez avant de générer les matchs", "warning")
+    
+    def show_duplicate_players(self, duplicates, parent=None):
+        """Affiche les groupes de joueurs probablement en double"""
+        players = self.tournament_manager.tournament.players
+        lines = []
+        for group in duplicates[:30]:
+            lines.append(" / ".join(f"{players[pid].name} ({pid}, {players[pid].category})" for pid in group))
+        if len(duplicates) > 30:
+            lines.append(f"... et {len(duplicates) - 30} autre(s) groupe(s)")
+        messagebox.showwarning("Doublons probables", "\n".join(lines), parent=parent or self.root)
     
     def generate_matches(self):
         """Génère les matchs pour le tournoi"""
@@ -1587,6 +1828,17 @@ class TaekwondoInterface:
         ttk.Label(dialog, text="Sélectionnez les catégories pour générer des matchs:", 
                  font=("Arial", 12, "bold")).pack(pady=10)
         
+        # Doublons probables (même nom normalisé), toutes catégories confondues
+        roster_index = self.tournament_manager.tournament.roster_index
+        duplicates = roster_index.duplicates()
+        if duplicates:
+            duplicate_frame = ttk.Frame(dialog)
+            duplicate_frame.pack(fill=tk.X, padx=20)
+            ttk.Label(duplicate_frame, text=f"⚠ {len(duplicates)} doublon(s) probable(s) dans la liste des joueurs",
+                      foreground="#B45309").pack(side=tk.LEFT)
+            ttk.Button(duplicate_frame, text="Voir",
+                       command=lambda: self.show_duplicate_players(duplicates, dialog)).pack(side=tk.LEFT, padx=10)
+        
         # Frame principale avec scrollbar
         main_frame = ttk.Frame(dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -1634,21 +1886,26 @@ class TaekwondoInterface:
             # Champ pour l'ordre de passage
             ttk.Label(category_frame, text="Ordre:").pack(side=tk.LEFT, padx=5)
             order_var = ttk.Entry(category_frame, width=5)
-            order_var.insert(0, str(i+1))  # Ordre par défaut
+            # Ordre enregistré dans le tournoi, sinon ordre par défaut
+            order_var.insert(0, str(self.tournament_manager.category_order.get(category, i+1)))
             order_var.pack(side=tk.LEFT, padx=5)
             order_entries[category] = order_var
             
-            # Nombre de joueurs dans cette catégorie (en excluant les doublons)
-            players_in_category = self.tournament_manager.tournament.categories.get(category, [])
-            unique_players = []
-            seen_names = set()
-            for player_id in players_in_category:
-                player = self.tournament_manager.tournament.players[player_id]
-                if player.name not in seen_names:
-                    unique_players.append(player)
-                    seen_names.add(player.name)
-            player_count = len(unique_players)
-            ttk.Label(category_frame, text=f"({player_count} joueurs uniques)").pack(side=tk.LEFT, padx=5)
+            # Nombre de joueurs dans cette catégorie, dont les doublons probables à vérifier
+            player_count = len(self.tournament_manager.tournament.categories.get(category, []))
+            duplicate_count = player_count - roster_index.unique_count(category)
+            count_text = f"({player_count} joueurs"
+            if duplicate_count:
+                count_text += f", {duplicate_count} doublon(s) probable(s)"
+            ttk.Label(category_frame, text=count_text + ")").pack(side=tk.LEFT, padx=5)
+        
+        # Mode du tableau : repêchages pour les médailles de bronze
+        repechage_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(dialog, text="Repêchages pour le bronze (battus des finalistes)",
+                        variable=repechage_var).pack(anchor=tk.W, padx=20)
+        pool_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(dialog, text="Poules (chacun contre chacun) pour les catégories de 3 à 5 joueurs",
+                        variable=pool_var).pack(anchor=tk.W, padx=20)
         
         # Boutons
         btn_frame = ttk.Frame(dialog)
@@ -1682,20 +1939,28 @@ class TaekwondoInterface:
             # Générer les matchs pour chaque catégorie sélectionnée
             total_matches = 0
             results = []
-            for category, order in selected_categories:
-                # Utiliser generate_first_round au lieu de generate_next_round pour le premier tour
-                matches = self.tournament_manager.tournament.generate_first_round(category)
-                if matches:
-                    total_matches += len(matches)
-                    player_count = len(self.tournament_manager.tournament.categories.get(category, []))
-                    results.append(f"{len(matches)} matchs générés pour {category} ({player_count} joueurs, ordre: {order})")
-                else:
-                    player_count = len(self.tournament_manager.tournament.categories.get(category, []))
-                    results.append(f"Aucun match généré pour {category} ({player_count} joueurs)")
+            from tournament_manager import POOL_MIN_SIZE, POOL_MAX_SIZE
+            with self.tournament_manager.tournament.journal_batch():
+                for category, order in selected_categories:
+                    tournament = self.tournament_manager.tournament
+                    matches = []
+                    # Poule pour les petites catégories si demandé, sinon tableau
+                    if pool_var.get() and POOL_MIN_SIZE <= len(tournament.eligible_players(category)) <= POOL_MAX_SIZE:
+                        matches = tournament.generate_pool(category)
+                    if not matches:
+                        # Utiliser generate_first_round au lieu de generate_next_round pour le premier tour
+                        matches = tournament.generate_first_round(category, repechage=repechage_var.get())
+                    if matches:
+                        total_matches += len(matches)
+                        player_count = len(self.tournament_manager.tournament.categories.get(category, []))
+                        results.append(f"{len(matches)} matchs générés pour {category} ({player_count} joueurs, ordre: {order})")
+                    else:
+                        player_count = len(self.tournament_manager.tournament.categories.get(category, []))
+                        results.append(f"Aucun match généré pour {category} ({player_count} joueurs)")
             
             if total_matches > 0:
-                # Sauvegarder le tournoi après génération
-                self.tournament_manager.save_tournament()
+                # Enregistrer le tirage (journalisé, sans réécriture complète)
+                self.tournament_manager.checkpoint()
                 # Afficher un résumé détaillé
                 result_text = "\n".join(results)
                 messagebox.showinfo("Génération réussie", 
@@ -1720,10 +1985,18 @@ class TaekwondoInterface:
             messagebox.showerror("Erreur", "Veuillez d'abord créer ou charger un tournoi")
             return
             
-        # Récupérer le prochain match non terminé
-        next_match = self.tournament_manager.get_next_match()
+        # Récupérer le prochain match prévu sur le tapis de ce poste
+        # Les rounds supplémentaires d'un match précédent ne comptent pas dans la durée prévue
+        self.tournament_manager.mats.set_timing(self.round_time, self.break_time, self.base_rounds)
+        next_match = self.tournament_manager.start_next_match(self.current_mat)
         if not next_match:
-            messagebox.showinfo("Information", "Tous les matchs sont terminés ou aucun match n'est disponible")
+            next_start = self.tournament_manager.mats.next_start(self.current_mat)
+            if next_start:
+                # Des matchs attendent la fin du repos de leurs athlètes
+                messagebox.showinfo("Information", "Aucun match dont les athlètes ont fini leur repos.\n"
+                                    f"Prochain match prévu à {time.strftime('%H:%M', time.localtime(next_start))}")
+            else:
+                messagebox.showinfo("Information", "Tous les matchs sont terminés ou aucun match n'est disponible")
             return
             
         # Stocker le match en cours
@@ -1776,10 +2049,12 @@ class TaekwondoInterface:
         self.red_gam_jeom = 0
         self.current_time = 180  # 3 minutes en secondes
         self.round_number = 1
+        self.max_rounds = self.base_rounds
         self.round_winners = []
         self.final_winner = None
         self.is_running = False
         self.is_paused = False
+        self.match_checkpoint.clear()
         
         # Mettre à jour l'affichage
         self.update_display()
@@ -1789,7 +2064,8 @@ class TaekwondoInterface:
             self.setup_match_interface()
             
         # Afficher un message de confirmation
-        messagebox.showinfo("Match chargé", f"Match {self.match_number} chargé: {self.blue_name} vs {self.red_name}")
+        messagebox.showinfo("Match chargé", f"Match {self.match_number} chargé sur le tapis {self.current_mat}: "
+                                            f"{self.blue_name} vs {self.red_name}")
         
         # Si la fenêtre de configuration du match n'est pas déjà affichée, l'afficher
         if not hasattr(self, 'match_config_dialog') or not hasattr(self.match_config_dialog, 'winfo_exists') or not self.match_config_dialog.winfo_exists():
@@ -1802,6 +2078,20 @@ class TaekwondoInterface:
     
 
     
+    def show_mat_schedule(self):
+        """Affiche le planning des tapis"""
+        from mat_scheduler import MatScheduleDialog
+        dialog = MatScheduleDialog(self.root, self)
+        self.center_window(dialog)
+    
+    def show_pool_standings(self):
+        """Affiche le classement des poules"""
+        if not self.tournament_manager.tournament:
+            messagebox.showerror("Erreur", "Veuillez d'abord créer ou charger un tournoi")
+            return
+        dialog = PoolStandingsDialog(self.root, self.tournament_manager.tournament)
+        self.center_window(dialog)
+    
     def show_tournament_display(self):
         """Affiche le tournoi avec le nouveau système d'affichage"""
         if not self.tournament_manager.tournament:
@@ -1875,7 +2165,7 @@ class TaekwondoInterface:
             return
             
         # Mettre à jour le résultat du match
-        self.tournament_manager.update_match_result(
+        if not self.tournament_manager.update_match_result(
             match_id=self.current_match_id,
             blue_score=self.blue_score,
             red_score=self.red_score,
@@ -1883,10 +2173,11 @@ class TaekwondoInterface:
             red_gam_jeom=self.red_gam_jeom,
             winner=self.final_winner,
             round_winners=self.round_winners
-        )
+        ):
+            return
         
-        # Sauvegarder le tournoi
-        self.tournament_manager.save_tournament()
+        # Enregistrer le résultat (ajouté au journal du tournoi)
+        self.tournament_manager.checkpoint()
         
         # Calculer les statistiques du tournoi
         if self.tournament_manager.tournament:
@@ -23,8 +23,8 @@ def launch_main_app():
     # Définir le mode tournoi par défaut au démarrage
     app.match_mode = "tournoi"
     
-    # Afficher la fenêtre de configuration avec priorité au tournoi
-    root.after(500, lambda: app.show_configuration_dialog())
+    # La fenêtre de configuration s'ouvre après la proposition de reprise d'un match
+    # (TaekwondoInterface.offer_match_resume)
     
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
     root.mainloop()
@@ -0,0 +1,305 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import List, Dict, Optional, Tuple
+
+from tournament_manager import Match
+from match_scheduler import MatchScheduler
+
+class ScheduledMatch:
+    """Match prévu sur un tapis avec ses horaires estimés"""
+    __slots__ = ("match", "mat", "start", "end")
+
+    def __init__(self, match: Match, mat: int, start: float, end: float):
+        self.match = match
+        self.mat = mat
+        self.start = start
+        self.end = end
+
+class MatScheduler:
+    """Répartition des matchs prêts sur plusieurs tapis avec temps de repos minimum"""
+    # Ordonnancement glouton : le tapis qui se libère le plus tôt reçoit le match
+    # le plus prioritaire dont les deux athlètes auront fini leur repos.
+    # L'occupation des tapis et la fin des derniers combats sont conservées
+    # (et journalisées) dans le tournoi ; seules les estimations restent ici.
+    LOOKAHEAD = 32  # nombre de matchs examinés pour remplir un créneau
+
+    def __init__(self, match_scheduler: MatchScheduler, mat_count: int = 1, min_rest: int = 600):
+        self.match_scheduler = match_scheduler
+        self.mat_count = mat_count
+        self.min_rest = min_rest  # secondes entre deux combats d'un athlète
+        # Durée d'un match : mêmes réglages que l'interface de match
+        self.round_time = 120
+        self.break_time = 30
+        self.max_rounds = 2
+        self.extra_time: Dict[int, float] = {}  # tapis -> prolongation du match en cours (round en or)
+        self.on_deck: Dict[int, List[ScheduledMatch]] = {}
+
+    @property
+    def current(self) -> Dict[int, Tuple[str, float]]:
+        """Match en cours sur chaque tapis : tapis -> (match_id, début)"""
+        tournament = self.match_scheduler.tournament
+        return tournament.mat_current if tournament else {}
+
+    @property
+    def last_bout_end(self) -> Dict[str, float]:
+        """Fin du dernier combat de chaque athlète"""
+        tournament = self.match_scheduler.tournament
+        return tournament.last_bout_end if tournament else {}
+
+    def reset(self) -> None:
+        """Oublie les estimations des tapis (nouveau tournoi)"""
+        self.extra_time.clear()
+        self.on_deck = {}
+
+    def set_timing(self, round_time: int, break_time: int, max_rounds: int) -> None:
+        """Met à jour les réglages servant à estimer la durée d'un match"""
+        self.round_time = round_time
+        self.break_time = break_time
+        self.max_rounds = max_rounds
+
+    @property
+    def match_duration(self) -> int:
+        """Durée estimée d'un match (rounds et pauses), en secondes"""
+        return self.max_rounds * self.round_time + max(self.max_rounds - 1, 0) * self.break_time
+
+    def extend_current(self, mat: int, seconds: float) -> None:
+        """Prolonge la durée prévue du match en cours sur un tapis (round supplémentaire)"""
+        if mat in self.current:
+            self.extra_time[mat] = self.extra_time.get(mat, 0) + seconds
+            self.plan()
+
+    def current_end(self, mat: int, now: float) -> float:
+        """Fin prévue du match en cours sur un tapis"""
+        match_id, start = self.current[mat]
+        end = start + self.match_duration + self.extra_time.get(mat, 0)
+        if end <= now:
+            # Match en retard : compter au moins un round de plus
+            end = now + self.round_time
+        return end
+
+    def projected_finish(self) -> Dict[int, Optional[float]]:
+        """Heure de fin prévue de chaque tapis (None s'il n'a plus rien à faire)"""
+        finish = {}
+        for mat in range(1, self.mat_count + 1):
+            queue = self.on_deck.get(mat)
+            if queue:
+                finish[mat] = queue[-1].end
+            elif mat in self.current:
+                finish[mat] = self.current_end(mat, time.time())
+            else:
+                finish[mat] = None
+        return finish
+
+    def athlete_ready(self, now: float) -> Dict[str, float]:
+        """Heure à partir de laquelle chaque athlète a fini son repos"""
+        ready = {pid: end + self.min_rest for pid, end in self.last_bout_end.items()}
+        matches = self.match_scheduler.tournament.matches
+        for mat, (match_id, start) in self.current.items():
+            match = matches.get(match_id)
+            if match:
+                end = self.current_end(mat, now)
+                for player in (match.blue_player, match.red_player):
+                    if player:
+                        ready[player.id] = end + self.min_rest
+        return ready
+
+    def plan(self, now: Optional[float] = None) -> Dict[int, List[ScheduledMatch]]:
+        """Recalcule la file d'attente (« on deck ») de chaque tapis"""
+        now = time.time() if now is None else now
+        duration = self.match_duration
+        mats = range(1, self.mat_count + 1)
+        if not self.match_scheduler.tournament:
+            self.on_deck = {mat: [] for mat in mats}
+            return self.on_deck
+
+        # Disponibilité des tapis et des athlètes
+        mat_free = {mat: now for mat in mats}
+        athlete_ready = self.athlete_ready(now)
+        busy = {match_id for match_id, start in self.current.values()}
+        for mat in self.current:
+            mat_free[mat] = max(mat_free.get(mat, now), self.current_end(mat, now))
+
+        def ready_at(match: Match) -> float:
+            return max(athlete_ready.get(match.blue_player.id, now),
+                       athlete_ready.get(match.red_player.id, now))
+
+        remaining = [match for match in self.match_scheduler.ready_matches() if match.match_id not in busy]
+        on_deck: Dict[int, List[ScheduledMatch]] = {mat: [] for mat in mats}
+        while remaining:
+            mat = min(mats, key=lambda m: (mat_free[m], m))
+            free_at = mat_free[mat]
+
+            # Premier match prioritaire dont les athlètes sont reposés, sinon le plus tôt disponible
+            window = remaining[:self.LOOKAHEAD]
+            index = next((i for i, match in enumerate(window) if ready_at(match) <= free_at), None)
+            if index is None:
+                index = min(range(len(window)), key=lambda i: ready_at(window[i]))
+            match = remaining.pop(index)
+
+            start = max(free_at, ready_at(match))
+            scheduled = ScheduledMatch(match, mat, start, start + duration)
+            on_deck[mat].append(scheduled)
+            mat_free[mat] = scheduled.end
+            for player in (match.blue_player, match.red_player):
+                athlete_ready[player.id] = scheduled.end + self.min_rest
+
+        self.on_deck = on_deck
+        return on_deck
+
+    def start_next(self, mat: int, now: Optional[float] = None) -> Optional[Match]:
+        """Lance sur un tapis le premier match prévu dont les athlètes sont reposés (None sinon)"""
+        now = time.time() if now is None else now
+        tournament = self.match_scheduler.tournament
+        # Un match lancé mais non terminé retourne dans la file
+        tournament.release_mat(mat)
+        self.extra_time.pop(mat, None)
+        on_deck = self.plan(now)
+
+        # Sa propre file d'abord, puis les matchs prévus sur les autres tapis :
+        # un tapis sans poste ne les lancerait jamais
+        candidates = list(on_deck.get(mat, []))
+        candidates += sorted((scheduled for other, queue in on_deck.items() if other != mat
+                              for scheduled in queue), key=lambda scheduled: scheduled.start)
+        athlete_ready = self.athlete_ready(now)
+        for scheduled in candidates:
+            match = scheduled.match
+            if any(athlete_ready.get(player.id, now) > now for player in (match.blue_player, match.red_player)):
+                continue
+            if tournament.mat_of(match.match_id) is not None:
+                continue
+            tournament.start_on_mat(mat, match.match_id, now)
+            self.plan(now)
+            return match
+        return None
+
+    def next_start(self, mat: int) -> Optional[float]:
+        """Début prévu du prochain match d'un tapis (selon la dernière planification)"""
+        queue = self.on_deck.get(mat)
+        return queue[0].start if queue else None
+
+    def complete(self, match_id: str, now: Optional[float] = None) -> None:
+        """Libère le tapis d'un match terminé puis rééquilibre les files de tous les tapis"""
+        now = time.time() if now is None else now
+        for mat, (current_id, _) in list(self.current.items()):
+            if current_id == match_id:
+                self.extra_time.pop(mat, None)
+        self.match_scheduler.tournament.end_bout(match_id, now)
+        
+        # Les matchs non encore appelés passent sur les tapis libres ou en avance
+        self.plan(now)
+
+class MatScheduleDialog(tk.Toplevel):
+    """Réglage des tapis et affichage des matchs à venir sur chacun"""
+    def __init__(self, parent, main_app):
+        super().__init__(parent)
+        self.parent = parent
+        self.main_app = main_app
+        self.mats = main_app.tournament_manager.mats
+        self.title("Planning des tapis")
+        self.geometry("900x550")
+        self.transient(parent)
+        self.grab_set()
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """Crée les widgets de la boîte de dialogue"""
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        settings_frame = ttk.LabelFrame(main_frame, text="Réglages", padding="10")
+        settings_frame.pack(fill=tk.X, pady=(0, 10))
+
+        self.mat_count_var = tk.IntVar(value=self.mats.mat_count)
+        self.current_mat_var = tk.IntVar(value=self.main_app.current_mat)
+        self.min_rest_var = tk.IntVar(value=self.mats.min_rest // 60)
+
+        ttk.Label(settings_frame, text="Nombre de tapis:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        ttk.Spinbox(settings_frame, from_=1, to=16, width=5,
+                    textvariable=self.mat_count_var).grid(row=0, column=1, padx=5)
+        ttk.Label(settings_frame, text="Tapis de ce poste:").grid(row=0, column=2, sticky=tk.W, padx=5)
+        ttk.Spinbox(settings_frame, from_=1, to=16, width=5,
+                    textvariable=self.current_mat_var).grid(row=0, column=3, padx=5)
+        ttk.Label(settings_frame, text="Repos minimum (min):").grid(row=0, column=4, sticky=tk.W, padx=5)
+        ttk.Spinbox(settings_frame, from_=0, to=120, width=5,
+                    textvariable=self.min_rest_var).grid(row=0, column=5, padx=5)
+        ttk.Button(settings_frame, text="Appliquer", command=self.apply).grid(row=0, column=6, padx=10)
+
+        # Fin prévue de chaque tapis
+        self.finish_frame = ttk.LabelFrame(main_frame, text="Fin prévue par tapis", padding="10")
+        self.finish_frame.pack(fill=tk.X, pady=(0, 10))
+
+        table_frame = ttk.Frame(main_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        columns = ("mat", "start", "match", "category", "blue", "red")
+        headings = ("Tapis", "Début prévu", "Match", "Catégorie", "Bleu", "Rouge")
+        scrollbar = ttk.Scrollbar(table_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", yscrollcommand=scrollbar.set)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.tree.yview)
+        for column, heading in zip(columns, headings):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=120, anchor=tk.W)
+        self.tree.column("mat", width=60)
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(btn_frame, text="Fermer", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Actualiser", command=self.refresh).pack(side=tk.RIGHT, padx=5)
+
+    def apply(self):
+        """Applique les réglages saisis"""
+        try:
+            mat_count = self.mat_count_var.get()
+            current_mat = self.current_mat_var.get()
+            min_rest = self.min_rest_var.get()
+        except tk.TclError:
+            messagebox.showerror("Erreur", "Veuillez entrer des nombres valides", parent=self)
+            return
+        if mat_count < 1 or not 1 <= current_mat <= mat_count or min_rest < 0:
+            messagebox.showerror("Erreur", "Le tapis de ce poste doit exister et le repos être positif", parent=self)
+            return
+
+        self.mats.mat_count = mat_count
+        self.mats.min_rest = min_rest * 60
+        self.main_app.current_mat = current_mat
+        self.refresh()
+
+    REFRESH_MS = 15000
+
+    def refresh(self):
+        """Recalcule et affiche les files d'attente des tapis"""
+        if not self.winfo_exists():
+            return
+        self.tree.delete(*self.tree.get_children())
+        for widget in self.finish_frame.winfo_children():
+            widget.destroy()
+        if self.main_app.tournament_manager.tournament:
+            self.mats.set_timing(self.main_app.round_time, self.main_app.break_time, self.main_app.base_rounds)
+            for mat, queue in self.mats.plan().items():
+                current = self.mats.current.get(mat)
+                if current:
+                    match = self.main_app.tournament_manager.tournament.matches[current[0]]
+                    self.insert_match(mat, "En cours", match)
+                for scheduled in queue:
+                    self.insert_match(mat, time.strftime("%H:%M", time.localtime(scheduled.start)), scheduled.match)
+
+            for column, (mat, finish) in enumerate(self.mats.projected_finish().items()):
+                text = time.strftime("%H:%M", time.localtime(finish)) if finish else "libre"
+                ttk.Label(self.finish_frame, text=f"Tapis {mat}: {text}").grid(
+                    row=column // 8, column=column % 8, sticky=tk.W, padx=10)
+
+        # Les files changent à chaque résultat : actualiser régulièrement
+        if hasattr(self, "_refresh_after_id"):
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(self.REFRESH_MS, self.refresh)
+
+    def insert_match(self, mat: int, start: str, match: Match):
+        """Ajoute une ligne au tableau"""
+        self.tree.insert("", tk.END, values=(
+            mat, start, match.match_number, match.category,
+            match.blue_player.name, match.red_player.name
+        ))
@@ -0,0 +1,75 @@
+import os
+import json
+import threading
+from typing import Dict, Any, Optional
+
+# Fichier de reprise du match en cours (placé dans le dossier des tournois)
+MATCH_CHECKPOINT_FILE_NAME = "live_match.jsonl"
+
+class MatchCheckpoint:
+    """Journal en ajout seul de l'état du match en cours, pour reprendre après un arrêt brutal"""
+    # Un enregistrement "match" décrit le combat (combattants, réglages),
+    # puis chaque action de score ajoute un petit enregistrement "state"
+    def __init__(self, directory: str):
+        self.file_path = os.path.join(directory, MATCH_CHECKPOINT_FILE_NAME)
+        self.active = False
+        # Le chronomètre écrit depuis son propre thread
+        self._lock = threading.Lock()
+
+    def begin(self, match_info: Dict[str, Any]) -> None:
+        """Démarre un nouveau journal pour le match décrit"""
+        with self._lock:
+            self._write({"type": "match", "data": match_info}, mode='w')
+            self.active = True
+
+    def record(self, state: Dict[str, Any]) -> None:
+        """Ajoute l'état courant du match au journal"""
+        with self._lock:
+            if not self.active:
+                return
+            self._write({"type": "state", "data": state}, mode='a')
+
+    def clear(self) -> None:
+        """Supprime le journal (match terminé ou abandonné)"""
+        with self._lock:
+            self.active = False
+            try:
+                os.remove(self.file_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Impossible de supprimer la reprise du match: {e}")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Lit le dernier état connu : {"match": ..., "state": ...} ou None"""
+        match_info, state = None, None
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Dernière ligne tronquée par l'arrêt brutal
+                        break
+                    if record.get("type") == "match":
+                        match_info, state = record["data"], None
+                    elif record.get("type") == "state":
+                        state = record["data"]
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Impossible de lire la reprise du match: {e}")
+            return None
+
+        if match_info is None:
+            return None
+        return {"match": match_info, "state": state}
+
+    def _write(self, record: Dict[str, Any], mode: str) -> None:
+        try:
+            with open(self.file_path, mode, encoding='utf-8') as file:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        except OSError as e:
+            print(f"Impossible d'enregistrer l'état du match: {e}")
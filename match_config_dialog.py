@@ -339,6 +339,8 @@ class MatchConfigDialog(tk.Toplevel):
                 if attr in ["round_time", "break_time", "max_rounds", "judges_count"]:
                     value = int(value)
                 setattr(self.main_app, attr, value)
+                if attr == "max_rounds":
+                    self.main_app.base_rounds = value
             
             # Récupérer et valider les valeurs des règles
             for attr, entry in self.rules_entries.items():
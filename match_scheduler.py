@@ -0,0 +1,113 @@
+import heapq
+from typing import List, Dict, Any, Optional, Tuple
+
+from tournament_manager import Match, Tournament
+
+class MatchScheduler:
+    """File de priorité des matchs prêts, tenue à jour par les événements du tournoi"""
+    # Clé de priorité : (ordre de la catégorie, tour, numéro de match).
+    # Les entrées des matchs terminés sont retirées paresseusement au sommet du tas.
+    def __init__(self, category_order: Optional[Dict[str, int]] = None):
+        self.category_order: Dict[str, int] = dict(category_order or {})
+        self.tournament: Optional[Tournament] = None
+        self._heap: List[Tuple[Any, ...]] = []
+        self._category_heaps: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._queued = set()
+        # Matchs non terminés par catégorie, dans l'ordre (tour, numéro) de création
+        self._pending: Dict[str, Dict[str, Match]] = {}
+
+    def bind(self, tournament: Optional[Tournament]) -> None:
+        """Suit les événements d'un tournoi (None pour se détacher)"""
+        if self.tournament:
+            self.tournament.remove_journal_listener(self.apply_records)
+        self.tournament = tournament
+        if tournament:
+            tournament.add_journal_listener(self.apply_records)
+        self.rebuild()
+
+    def set_category_order(self, category_order: Dict[str, int]) -> None:
+        """Change l'ordre de passage des catégories (reconstruit la file)"""
+        self.category_order = dict(category_order)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Reconstruit la file à partir de l'état complet du tournoi"""
+        self._heap, self._category_heaps, self._queued, self._pending = [], {}, set(), {}
+        if not self.tournament:
+            return
+
+        for round_number in sorted(self.tournament.rounds):
+            for match_id in self.tournament.rounds[round_number]:
+                match = self.tournament.matches[match_id]
+                if not match.completed:
+                    self._pending.setdefault(match.category, {})[match_id] = match
+                    if match.is_ready:
+                        self._queued.add(match_id)
+                        self._heap.append(self._key(match))
+                        self._category_heaps.setdefault(match.category, []).append(
+                            (match.round_number, match.match_number, match_id))
+        heapq.heapify(self._heap)
+        for heap in self._category_heaps.values():
+            heapq.heapify(heap)
+
+    def apply_records(self, records: List[Dict[str, Any]]) -> None:
+        """Met à jour la file avec un lot d'événements du tournoi"""
+        tournament = self.tournament
+        for record in records:
+            event, data = record["event"], record["data"]
+            if event == "round":
+                for match_data in data["matches"]:
+                    match = tournament.matches[match_data["match_id"]]
+                    if not match.completed:
+                        self._pending.setdefault(match.category, {})[match.match_id] = match
+                        self._push(match)
+            elif event == "result":
+                match = tournament.matches[data["match_id"]]
+                self._pending.get(match.category, {}).pop(match.match_id, None)
+                # Le vainqueur a pu compléter le match suivant du tableau
+                parent = tournament.bracket_parent(match)
+                if parent and not parent.completed:
+                    self._push(parent)
+
+    def _key(self, match: Match) -> Tuple[Any, ...]:
+        rank = self.category_order.get(match.category, float('inf'))
+        return (rank, match.round_number, match.match_number, match.category, match.match_id)
+
+    def _push(self, match: Match) -> None:
+        if not match.is_ready or match.match_id in self._queued:
+            return
+        self._queued.add(match.match_id)
+        heapq.heappush(self._heap, self._key(match))
+        heapq.heappush(self._category_heaps.setdefault(match.category, []),
+                       (match.round_number, match.match_number, match.match_id))
+
+    def _peek(self, heap: List[Tuple[Any, ...]]) -> Optional[Match]:
+        matches = self.tournament.matches
+        while heap:
+            match = matches.get(heap[0][-1])
+            if match and not match.completed:
+                return match
+            heapq.heappop(heap)
+        return None
+
+    def next_match(self, category: Optional[str] = None) -> Optional[Match]:
+        """Prochain match prêt (O(log n) amorti)"""
+        if not self.tournament:
+            return None
+        if category is None:
+            return self._peek(self._heap)
+        return self._peek(self._category_heaps.get(category, []))
+
+    def ready_matches(self) -> List[Match]:
+        """Tous les matchs prêts, dans l'ordre de priorité"""
+        if not self.tournament:
+            return []
+        matches = self.tournament.matches
+        return [matches[entry[-1]] for entry in sorted(self._heap)
+                if not matches[entry[-1]].completed]
+
+    def pending_by_category(self) -> Dict[str, List[Match]]:
+        """Matchs non terminés par catégorie, catégories dans l'ordre de passage"""
+        categories = sorted((category for category, pending in self._pending.items() if pending),
+                            key=lambda category: self.category_order.get(category, float('inf')))
+        return {category: list(self._pending[category].values()) for category in categories}
@@ -0,0 +1,69 @@
+import unicodedata
+from typing import List, Dict, Optional, Set
+
+def normalize_name(name: str) -> str:
+    """Clé de comparaison d'un nom : sans casse, accents ni espaces superflus, mots dans l'ordre alphabétique"""
+    # « Éric  DUPONT », « dupont eric » et « Dupont-Éric » donnent la même clé
+    if not name.isascii():
+        decomposed = unicodedata.normalize("NFKD", name)
+        name = "".join(char for char in decomposed if not unicodedata.combining(char))
+    words = name.casefold().replace("-", " ").replace("'", " ").split()
+    return " ".join(sorted(words))
+
+class RosterIndex:
+    """Index des joueurs par nom normalisé, pour repérer les doublons de toute la liste"""
+    # Compteurs tenus à jour à chaque ajout : le nombre de joueurs uniques
+    # d'une catégorie et la liste des doublons ne demandent aucun parcours
+    def __init__(self):
+        self._keys: Dict[str, str] = {}  # joueur -> clé du nom
+        self._categories: Dict[str, str] = {}  # joueur -> catégorie
+        self._by_key: Dict[str, Set[str]] = {}  # clé -> joueurs
+        self._category_keys: Dict[str, Dict[str, int]] = {}  # catégorie -> clé -> nombre de joueurs
+        self.duplicate_keys: Set[str] = set()
+
+    def add(self, player) -> None:
+        """Indexe un joueur (remplace l'entrée d'un joueur de même identifiant)"""
+        if player.id in self._keys:
+            self.remove(player.id)
+        key = normalize_name(player.name)
+        self._keys[player.id] = key
+        self._categories[player.id] = player.category
+        ids = self._by_key.setdefault(key, set())
+        ids.add(player.id)
+        if len(ids) > 1:
+            self.duplicate_keys.add(key)
+        counts = self._category_keys.setdefault(player.category, {})
+        counts[key] = counts.get(key, 0) + 1
+
+    def remove(self, player_id: str) -> None:
+        """Retire un joueur de l'index"""
+        key = self._keys.pop(player_id, None)
+        if key is None:
+            return
+        category = self._categories.pop(player_id)
+        ids = self._by_key[key]
+        ids.discard(player_id)
+        if len(ids) < 2:
+            self.duplicate_keys.discard(key)
+        if not ids:
+            del self._by_key[key]
+        counts = self._category_keys[category]
+        counts[key] -= 1
+        if not counts[key]:
+            del counts[key]
+
+    def unique_count(self, category: str) -> int:
+        """Nombre de joueurs distincts (noms normalisés) d'une catégorie, en O(1)"""
+        return len(self._category_keys.get(category, {}))
+
+    def key_of(self, player_id: str) -> Optional[str]:
+        """Clé normalisée du nom d'un joueur indexé"""
+        return self._keys.get(player_id)
+
+    def is_duplicate(self, player_id: str) -> bool:
+        """Indique si un autre joueur porte le même nom normalisé"""
+        return self._keys.get(player_id) in self.duplicate_keys
+
+    def duplicates(self) -> List[List[str]]:
+        """Groupes d'identifiants de joueurs probablement en double (toutes catégories)"""
+        return [sorted(self._by_key[key]) for key in sorted(self.duplicate_keys)]
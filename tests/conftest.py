@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import tournament_manager as tm
+
+
+@pytest.fixture
+def journaled(tmp_path):
+    """Tournoi vide sauvegardé et relié à son journal d'événements"""
+    path = str(tmp_path / "tournoi.json")
+    tournament = tm.Tournament("Open", "01/01/2026", "Abidjan")
+    tournament.save_to_file(path)
+    tournament.attach_journal(path)
+    return tournament, path
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Gestionnaire de tournois écrivant dans un dossier temporaire, sans boîtes de dialogue"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for name in ("showinfo", "showwarning", "showerror"):
+        monkeypatch.setattr(tm.messagebox, name, lambda *args, **kwargs: None)
+    return tm.TournamentManager(None)
+
+
+def add_players(tournament, count, category="cat", prefix="p"):
+    """Inscrit count athlètes de clubs différents dans une catégorie"""
+    players = [tm.Player(f"{prefix}{i}", f"Athlète {prefix}{i}", f"CLUB {i}", "CIV", category, 58.0, "20")
+               for i in range(count)]
+    for player in players:
+        tournament.add_player(player)
+    return players
+
+
+def win(tournament, match, corner="blue", blue_score=5, red_score=1):
+    """Enregistre la victoire d'un coin"""
+    return tournament.update_match_result(match.match_id, blue_score, red_score, 0, 0, corner, [corner])
+
+
+def play_some(tournament, category="cat", prefix="p"):
+    """Inscriptions, tirage et deux résultats"""
+    add_players(tournament, 6, category, prefix)
+    tournament.generate_first_round(category, draw_seed=4)
+    for match in [m for m in tournament.matches.values() if m.blue_player and m.red_player][:2]:
+        win(tournament, match)
+
+
+def same_state(first, second):
+    """Compare joueurs, catégories et matchs de deux tournois"""
+    return ({pid: p.to_dict() for pid, p in first.players.items()}
+            == {pid: p.to_dict() for pid, p in second.players.items()}
+            and first.categories == second.categories
+            and {mid: m.to_dict() for mid, m in first.matches.items()}
+            == {mid: m.to_dict() for mid, m in second.matches.items()})
@@ -0,0 +1,48 @@
+import pytest
+
+import tournament_manager as tm
+from tournament_archive import TournamentArchive, export_archive, import_archive
+
+from conftest import play_some, same_state
+
+
+@pytest.fixture
+def tournament():
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    play_some(tournament, "-58kg")
+    play_some(tournament, "-68kg", prefix="m")
+    return tournament
+
+
+@pytest.mark.parametrize("compression", ["lzma", "gzip"])
+def test_archive_round_trip(tmp_path, tournament, compression):
+    path = str(tmp_path / "open.tkwa")
+    export_archive(tournament, path, compression)
+    assert same_state(tournament, import_archive(path))
+
+
+def test_category_is_read_alone(tmp_path, tournament, monkeypatch):
+    path = str(tmp_path / "open.tkwa")
+    export_archive(tournament, path)
+
+    with TournamentArchive(path) as archive:
+        read = []
+        original = archive.read_section
+        monkeypatch.setattr(archive, "read_section", lambda name: read.append(name) or original(name))
+
+        assert archive.category_names() == ["-58kg", "-68kg"]
+        assert archive.summary()["players"] == 12
+        matches = archive.category_matches("-68kg")
+        assert read == ["summary", "players", "category:-68kg"]
+
+    assert {match.category for match in matches.values()} == {"-68kg"}
+    expected = {mid for mid, match in tournament.matches.items() if match.category == "-68kg"}
+    assert set(matches) == expected
+
+
+def test_other_files_are_rejected(tmp_path, tournament):
+    path = str(tmp_path / "open.json")
+    tournament.save_to_file(path)
+    with pytest.raises(ValueError):
+        TournamentArchive(path)
+    assert import_archive(path) is None
@@ -0,0 +1,94 @@
+import os
+import threading
+
+import pytest
+
+import tournament_manager as tm
+from autosave import AutosaveWorker, write_file_atomic
+
+from conftest import play_some, same_state
+
+
+def test_write_file_atomic_replaces_whole_file(tmp_path):
+    path = str(tmp_path / "tournoi.json")
+    write_file_atomic(path, "ancien")
+    write_file_atomic(path, "nouveau")
+    with open(path, encoding="utf-8") as file:
+        assert file.read() == "nouveau"
+
+    write_file_atomic(path, b"\x00\x01")
+    with open(path, "rb") as file:
+        assert file.read() == b"\x00\x01"
+
+
+def test_write_file_atomic_keeps_original_on_failure(tmp_path):
+    path = str(tmp_path / "tournoi.json")
+    write_file_atomic(path, "intact")
+    with pytest.raises(TypeError):
+        write_file_atomic(path, 42)
+    with open(path, encoding="utf-8") as file:
+        assert file.read() == "intact"
+    assert os.listdir(tmp_path) == ["tournoi.json"]
+
+
+@pytest.fixture
+def worker():
+    worker = AutosaveWorker()
+    yield worker
+    worker.stop(timeout=5)
+
+
+def test_worker_keeps_only_last_pending_job_per_key(worker):
+    started, release = threading.Event(), threading.Event()
+    done = []
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        done.append("bloquant")
+
+    worker.submit(blocking)
+    assert started.wait(5)
+    # Pendant l'écriture en cours, trois demandes se remplacent sur la même clé
+    for label in ("v1", "v2", "v3"):
+        worker.submit(lambda label=label: done.append(label))
+    worker.submit(lambda: done.append("index"), key="index")
+    assert not worker.is_idle
+
+    release.set()
+    assert worker.flush(timeout=5)
+    assert done == ["bloquant", "v3", "index"]
+    assert worker.is_idle
+
+
+def test_worker_reports_failures_and_keeps_running(worker):
+    def failing():
+        raise OSError("disque plein")
+
+    worker.submit(failing)
+    assert worker.flush(timeout=5)
+    events = []
+    while not worker.events.empty():
+        events.append(worker.events.get_nowait())
+    assert events[-1][0] == "error" and "disque plein" in events[-1][1]
+
+    done = []
+    worker.submit(lambda: done.append(True))
+    assert worker.flush(timeout=5)
+    assert done == [True]
+
+
+def test_json_round_trip(manager):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan", "json")
+    play_some(tournament)
+    manager.set_category_order({"cat": 1})
+    manager.flush_autosave()
+    assert manager.save_tournament()
+    manager.shutdown()
+
+    other = tm.TournamentManager(None)
+    loaded = other.load_tournament(manager.get_index_path())
+    assert other.storage_backend == "json"
+    assert same_state(tournament, loaded)
+    assert loaded.category_order == {"cat": 1}
+    assert other.scheduler.category_order == {"cat": 1}
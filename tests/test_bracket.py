@@ -0,0 +1,86 @@
+import tournament_manager as tm
+
+from conftest import add_players, win, same_state
+
+
+def drawn(tournament, count, **kwargs):
+    add_players(tournament, count)
+    tournament.generate_first_round("cat", draw_seed=5, **kwargs)
+    return tournament.brackets["cat"]
+
+
+def test_winner_is_seated_in_parent(journaled):
+    tournament, _ = journaled
+    bracket = drawn(tournament, 8)
+    left, right = tournament.matches[bracket[3]], tournament.matches[bracket[4]]
+    parent = tournament.matches[bracket[1]]
+
+    win(tournament, left, "blue")
+    win(tournament, right, "red", 1, 5)
+    assert parent.blue_player is left.blue_player
+    assert parent.red_player is right.red_player
+    assert left.red_player.eliminated and right.blue_player.eliminated
+
+
+def test_whole_tree_exists_at_draw(journaled):
+    tournament, path = journaled
+    bracket = drawn(tournament, 8)
+    assert len(bracket) == 7 and all(bracket)
+    for slot in range(1, 7):
+        child = tournament.matches[bracket[slot]]
+        assert tournament.bracket_parent(child) is tournament.matches[bracket[(slot - 1) // 2]]
+
+    # Le tableau se reconstruit depuis les emplacements des matchs rechargés
+    loaded = tm.Tournament.load_from_file(path)
+    assert loaded.brackets["cat"] == bracket
+
+
+def test_byes_advance_at_draw(journaled):
+    tournament, _ = journaled
+    bracket = drawn(tournament, 6)
+    seated = [tournament.matches[mid] for mid in bracket[1:3]]
+    assert any(match.blue_player or match.red_player for match in seated)
+
+
+def test_whole_bracket_produces_one_champion(journaled):
+    tournament, path = journaled
+    drawn(tournament, 8)
+    while True:
+        match = tournament.get_next_match("cat")
+        if not match:
+            break
+        win(tournament, match)
+    final = tournament.matches[tournament.brackets["cat"][0]]
+    assert final.completed
+    assert final.winner_player.wins == 3
+    assert tournament.is_category_finished("cat")
+    assert same_state(tournament, tm.Tournament.load_from_file(path))
+
+
+def test_correction_flipping_winner_reseats_parent(journaled):
+    tournament, path = journaled
+    bracket = drawn(tournament, 8)
+    leaf, parent = tournament.matches[bracket[3]], tournament.matches[bracket[1]]
+    win(tournament, leaf, "blue")
+
+    assert win(tournament, leaf, "red", 1, 5)
+    assert parent.blue_player is leaf.red_player
+    assert not leaf.red_player.eliminated and leaf.blue_player.eliminated
+    assert (leaf.blue_player.wins, leaf.blue_player.losses) == (0, 1)
+    assert (leaf.red_player.wins, leaf.red_player.losses) == (1, 0)
+    assert same_state(tournament, tm.Tournament.load_from_file(path))
+
+
+def test_correction_blocked_once_parent_is_played(journaled):
+    tournament, _ = journaled
+    bracket = drawn(tournament, 8)
+    leaf, sibling = tournament.matches[bracket[3]], tournament.matches[bracket[4]]
+    parent = tournament.matches[bracket[1]]
+    win(tournament, leaf)
+    win(tournament, sibling)
+    win(tournament, parent)
+
+    assert tournament.correction_blocked(leaf.match_id, "red")
+    assert not win(tournament, leaf, "red", 1, 5)
+    # Corriger les points sans changer de vainqueur reste possible
+    assert win(tournament, leaf, "blue", 7, 2)
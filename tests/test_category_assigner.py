@@ -0,0 +1,50 @@
+import json
+
+import pandas as pd
+import pytest
+
+from category_assigner import assign_categories, load_age_groups
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["id", "name", "weight", "age", "gender"]).astype(str)
+
+
+def test_upper_limit_is_inclusive_and_last_class_is_open():
+    categories, outside = assign_categories(frame([
+        ["1", "A", "58", "20", "M"],
+        ["2", "B", "58.1", "20", "Homme"],
+        ["3", "C", "120", "30", "m"],
+        ["4", "D", "67,5 kg", "16", "Femme"],
+        ["5", "E", "30", "13", "F"],
+    ]))
+    assert list(categories) == ["Senior Men -58kg", "Senior Men -63kg", "Senior Men +87kg",
+                                "Junior Women -68kg", "Cadet Women -33kg"]
+    assert outside.empty
+
+
+def test_rows_without_category_are_explained():
+    categories, outside = assign_categories(frame([
+        ["1", "A", "", "20", "M"],
+        ["2", "B", "60", "âge ?", "M"],
+        ["3", "C", "60", "20", "X"],
+        ["4", "D", "25", "8", "F"],
+        ["5", "E", "60", "20", "F"],
+    ]))
+    assert list(categories) == ["", "", "", "", "Senior Women -62kg"]
+    assert list(outside["id"]) == ["1", "2", "3", "4"]
+    assert list(outside["reason"]) == ["Poids manquant ou invalide", "Âge manquant ou invalide",
+                                       "Genre manquant ou invalide", "Aucune catégorie pour cet âge et ce genre"]
+
+
+def test_custom_age_groups(tmp_path):
+    path = tmp_path / "bareme.json"
+    path.write_text(json.dumps({"age_groups": [
+        {"name": "Minime", "min_age": 8, "max_age": 11, "classes": {"M": [25, 30], "F": [24, 28]}}]}))
+    categories, _ = assign_categories(frame([["1", "A", "26", "9", "M"]]), load_age_groups(str(path)))
+    assert list(categories) == ["Minime Men -30kg"]
+
+    path.write_text(json.dumps({"age_groups": [
+        {"name": "Minime", "min_age": 8, "max_age": 11, "classes": {"M": [30, 25]}}]}))
+    with pytest.raises(ValueError):
+        load_age_groups(str(path))
@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from import_manager import ImportManager, ImportWorker
+
+HEADER = "id;name;club;country;category;weight\n"
+
+
+def write_csv(tmp_path, lines, header=HEADER, encoding="utf-8"):
+    path = tmp_path / "inscrits.csv"
+    path.write_bytes((header + "".join(lines)).encode(encoding))
+    return str(path)
+
+
+def athletes(count):
+    return [f"P{i};Athlète {i};CLUB;CIV;Senior -68;6{i % 10}\n" for i in range(count)]
+
+
+def test_chunks_report_byte_progress(tmp_path):
+    path = write_csv(tmp_path, athletes(5))
+    chunks = list(ImportManager().iter_chunks(path, chunk_size=2))
+
+    assert [len(chunk.rows) for chunk in chunks] == [2, 2, 1]
+    assert all(chunk.total == chunks[0].total for chunk in chunks)
+    assert [chunk.done for chunk in chunks] == sorted(chunk.done for chunk in chunks)
+    assert chunks[-1].done == chunks[-1].total
+
+
+def test_separators_and_encodings(tmp_path):
+    lines = ["P1\tÉlodie\tCLUB\tCIV\tSenior -57\t56\n"]
+    path = write_csv(tmp_path, lines, HEADER.replace(";", "\t"), encoding="cp1252")
+    rows = list(ImportManager().iter_csv_rows(path))
+    assert rows[0]["name"] == "Élodie" and rows[0]["weight"] == "56"
+
+    path = write_csv(tmp_path, ["P1,Awa,CLUB,CIV,Senior -57,56\n"], HEADER.replace(";", ","), "utf-8-sig")
+    assert list(ImportManager().iter_csv_rows(path))[0]["id"] == "P1"
+
+
+def test_errors_report_file_lines(tmp_path):
+    path = write_csv(tmp_path, ["P1;Awa;CLUB;CIV;Senior -57;56\n",
+                                "P2;Koffi;CLUB;CIV;Senior -68;lourd\n",
+                                "P1;Awa;CLUB;CIV;Senior -57;56\n"])
+    errors = [error for chunk in ImportManager().iter_chunks(path, chunk_size=2) for error in chunk.errors]
+    assert errors == ["Ligne 3: Format de poids invalide 'lourd'", "Ligne 4: ID dupliqué 'P1'"]
+
+
+def test_missing_columns_raise(tmp_path):
+    path = write_csv(tmp_path, ["P1,Awa\n"], header="id,name\n")
+    with pytest.raises(ValueError, match="Colonnes manquantes"):
+        list(ImportManager().iter_chunks(path))
+
+
+def test_cancel_stops_at_next_chunk(tmp_path):
+    path = write_csv(tmp_path, athletes(10))
+    cancel = threading.Event()
+    chunks = []
+    for chunk in ImportManager().iter_chunks(path, chunk_size=2, cancel_event=cancel):
+        chunks.append(chunk)
+        cancel.set()
+    assert len(chunks) == 1
+
+
+def test_worker_reports_chunks_then_done(tmp_path):
+    path = write_csv(tmp_path, athletes(3))
+    worker = ImportWorker(ImportManager(), path)
+    events = [worker.events.get(timeout=5)]
+    while events[-1][0] == "chunk":
+        events.append(worker.events.get(timeout=5))
+    assert [state for state, _ in events] == ["chunk", "done"]
+    assert len(events[0][1].rows) == 3
+    assert not worker.cancelled
@@ -0,0 +1,57 @@
+import random
+from types import SimpleNamespace
+
+import tournament_manager as tm
+from draw_engine import seeded_draw, standard_seed_order
+
+from conftest import add_players
+
+
+def athletes(clubs, seeds=()):
+    """Un athlète par club donné ; les premiers reçoivent les rangs de tête de série"""
+    seeds = list(seeds) + [0] * len(clubs)
+    return [SimpleNamespace(id=f"p{i}", club=club, country="CIV", seed=seeds[i])
+            for i, club in enumerate(clubs)]
+
+
+def test_standard_seed_order():
+    assert standard_seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+
+
+def test_seeds_are_apart_and_byes_face_them():
+    players = athletes(["A", "B", "C", "D", "E", "F"], seeds=[1, 2])
+    leaves = seeded_draw(players, random.Random(0))
+    assert len(leaves) == 8
+    assert leaves.index(players[0]) < 4 <= leaves.index(players[1])
+    # Les deux exempts affrontent les deux premières têtes de série
+    for seed in players[:2]:
+        slot = leaves.index(seed)
+        assert leaves[slot ^ 1] is None
+
+
+def test_club_mates_are_separated():
+    for seed in range(20):
+        players = athletes(["A"] * 4 + ["B"] * 4)
+        leaves = seeded_draw(players, random.Random(seed))
+        # Quatre coéquipiers sur huit : un par quart, jamais face à face au premier tour
+        for first in range(0, 8, 2):
+            assert leaves[first].club != leaves[first + 1].club
+        assert {p.club for p in leaves[:4]} == {"A", "B"}
+
+
+def test_draw_seed_is_recorded_and_reproducible(journaled):
+    tournament, path = journaled
+    add_players(tournament, 7)
+    tournament.generate_first_round("cat", draw_seed=42)
+    draw = [(m.blue_player and m.blue_player.id, m.red_player and m.red_player.id)
+            for m in sorted(tournament.matches.values(), key=lambda m: m.match_id)]
+
+    assert tournament.draw_seeds == {"cat": 42}
+    loaded = tm.Tournament.load_from_file(path)
+    assert loaded.draw_seeds == {"cat": 42}
+
+    again = tm.Tournament("Open", "2026", "Abidjan")
+    add_players(again, 7)
+    again.generate_first_round("cat", draw_seed=42)
+    assert draw == [(m.blue_player and m.blue_player.id, m.red_player and m.red_player.id)
+                    for m in sorted(again.matches.values(), key=lambda m: m.match_id)]
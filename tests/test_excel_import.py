@@ -0,0 +1,53 @@
+import pandas as pd
+
+from import_manager import ImportManager
+
+
+def sheet(**columns):
+    base = {"id": ["P1", "P2"], "name": ["Awa", "Koffi"], "club": "ASEC", "country": "CIV",
+            "category": "Senior -68", "weight": [56, 67.5]}
+    base.update(columns)
+    return pd.DataFrame(base)
+
+
+def test_valid_rows_are_normalized():
+    records, errors = ImportManager().normalize_frame(sheet(**{" ID ": ["P1", "P2"]}).drop(columns="id"))
+    assert not len(errors)
+    assert records[0] == {"id": "P1", "name": "Awa", "club": "ASEC", "country": "CIV", "category": "Senior -68",
+                          "weight": 56.0, "age": "", "gender": "", "belt": "", "seed": ""}
+    assert isinstance(records[1]["weight"], float)
+
+
+def test_every_error_uses_the_sheet_row():
+    df = pd.DataFrame({
+        "id": ["P1", "X", "P1", "P3", "P1", "P4", "P5"],
+        "name": ["Awa", "Koffi", "Awa", "K", "Bintou", "Zié", "Issa"],
+        "club": ["ASEC"] * 6 + [None],
+        "country": "CIV",
+        "category": "Senior -68",
+        "weight": [56, 60, 56, 60, 61, "lourd", 70],
+    })
+    records, errors = ImportManager().normalize_frame(df)
+    assert [r["id"] for r in records] == ["P1"]
+    assert ImportManager.format_errors(errors) == [
+        "Ligne 3: ID invalide",
+        "Ligne 4: ID dupliqué",
+        "Ligne 5: Nom invalide",
+        "Ligne 6: ID dupliqué",
+        "Ligne 7: Format de poids invalide",
+        "Ligne 8: Champ requis manquant ou vide: club",
+    ]
+    assert list(errors["field"]) == ["id", "id", "name", "id", "weight", "club"]
+
+
+def test_rejected_row_does_not_reserve_its_id():
+    records, errors = ImportManager().normalize_frame(sheet(id=["P1", "P1"], name=["A", "Koffi"]))
+    assert [r["name"] for r in records] == ["Koffi"]
+    assert ImportManager.format_errors(errors) == ["Ligne 2: Nom invalide"]
+
+
+def test_missing_columns_are_reported():
+    records, errors = ImportManager().normalize_frame(pd.DataFrame({"id": ["P1"], "name": ["Awa"]}))
+    assert records == []
+    assert ImportManager.format_errors(errors) == [
+        "Colonne manquante: club", "Colonne manquante: country", "Colonne manquante: category"]
@@ -0,0 +1,68 @@
+import os
+
+import tournament_manager as tm
+from tournament_index import INDEX_FILE_NAME, TournamentIndex
+from tournament_store import SQLiteTournamentStore
+
+from conftest import play_some
+
+
+def saved_tournaments(directory):
+    """Un tournoi par format de stockage"""
+    paths = {}
+    for name in ("json", "sharded", "sqlite"):
+        tournament = tm.Tournament("Open " + name, "2026", "Abidjan")
+        play_some(tournament)
+        if name == "json":
+            paths[name] = os.path.join(directory, "open.json")
+            tournament.save_to_file(paths[name])
+        elif name == "sharded":
+            tournament.save_sharded(os.path.join(directory, "open_fragments"))
+            paths[name] = os.path.join(directory, "open_fragments", tm.SHARD_MANIFEST_NAME)
+        else:
+            paths[name] = os.path.join(directory, "open.db")
+            store = SQLiteTournamentStore(paths[name])
+            store.save_tournament(tournament)
+            store.close()
+    return paths
+
+
+def test_rebuild_reads_every_format(tmp_path):
+    paths = saved_tournaments(str(tmp_path))
+    index = TournamentIndex(str(tmp_path))
+
+    assert os.path.exists(os.path.join(str(tmp_path), INDEX_FILE_NAME))
+    assert sorted(entry["name"] for entry in index.recent()) == ["Open json", "Open sharded", "Open sqlite"]
+    entry = index.entries[os.path.abspath(paths["sqlite"])]
+    assert entry["players"] == 6 and entry["completed_matches"] == 2
+
+
+def test_recent_skips_missing_files_and_sorts_by_date(tmp_path):
+    paths = saved_tournaments(str(tmp_path))
+    index = TournamentIndex(str(tmp_path))
+    index.update(paths["json"], {"name": "Open json"})
+    os.remove(paths["sqlite"])
+
+    assert [entry["name"] for entry in index.recent()] == ["Open json", "Open sharded"]
+    assert len(index.recent(limit=1)) == 1
+
+    index.remove(paths["json"])
+    index.save()
+    assert [entry["name"] for entry in TournamentIndex(str(tmp_path)).recent()] == ["Open sharded"]
+
+
+def test_unreadable_index_is_rebuilt(tmp_path):
+    saved_tournaments(str(tmp_path))
+    with open(os.path.join(str(tmp_path), INDEX_FILE_NAME), "w", encoding="utf-8") as file:
+        file.write("{tronqué")
+    assert len(TournamentIndex(str(tmp_path)).recent()) == 3
+
+
+def test_locked_database_is_skipped_without_waiting(tmp_path):
+    paths = saved_tournaments(str(tmp_path))
+    store = SQLiteTournamentStore(paths["sqlite"], exclusive=True)
+    try:
+        names = [entry["name"] for entry in TournamentIndex(str(tmp_path)).recent()]
+    finally:
+        store.close()
+    assert sorted(names) == ["Open json", "Open sharded"]
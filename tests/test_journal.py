@@ -0,0 +1,66 @@
+import tournament_manager as tm
+
+from conftest import add_players, win, same_state
+
+
+def test_replay_restores_draw_and_results(journaled):
+    tournament, path = journaled
+    add_players(tournament, 8)
+    tournament.generate_first_round("cat", draw_seed=5)
+    for match in list(tournament.matches.values())[:3]:
+        win(tournament, match)
+    tournament.advance_round()
+
+    reloaded = tm.Tournament.load_from_file(path)
+    assert same_state(tournament, reloaded)
+    assert reloaded.current_round == tournament.current_round
+    assert reloaded.journal_seq == tournament.journal_seq
+
+
+def test_replay_after_compaction_applies_only_new_events(journaled):
+    tournament, path = journaled
+    add_players(tournament, 4)
+    tournament.generate_first_round("cat", draw_seed=1)
+    tournament.save_to_file(path)
+    first = next(iter(tournament.matches.values()))
+    win(tournament, first, "red", 1, 4)
+
+    reloaded = tm.Tournament.load_from_file(path)
+    assert reloaded.matches[first.match_id].winner_player.id == first.red_player.id
+    assert same_state(tournament, reloaded)
+
+
+def test_reopened_archive_copy_saves_to_itself(manager, tmp_path):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan", "json")
+    add_players(tournament, 1)
+    archive = str(tmp_path / "open.tkwa")
+    assert manager.export_archive(archive)
+    add_players(tournament, 1, prefix="late")
+    assert manager.save_tournament()
+    live_path = manager.get_tournament_file_path()
+
+    manager.load_tournament(archive)
+    copy_path = manager.get_tournament_file_path()
+    assert copy_path != live_path
+    manager.load_tournament(copy_path)
+    assert manager.get_tournament_file_path() == copy_path
+    assert manager.save_tournament()
+
+    assert len(tm.Tournament.load_from_file(live_path).players) == 2
+    assert len(tm.Tournament.load_from_file(copy_path).players) == 1
+
+
+def test_file_opened_elsewhere_keeps_its_path(manager, tmp_path):
+    outside = str(tmp_path / "ailleurs.json")
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    tournament.save_to_file(outside)
+
+    loaded = manager.load_tournament(outside)
+    add_players(loaded, 3)
+    loaded.journal_pending = manager.journal_compact_threshold
+    assert manager.checkpoint()
+    manager.flush_autosave()
+
+    assert manager.get_index_path() == outside
+    assert len(tm.Tournament.load_from_file(outside).players) == 3
+    assert loaded.journal_pending == 0
@@ -0,0 +1,107 @@
+import sqlite3
+import time
+
+import pytest
+
+import tournament_manager as tm
+from tournament_store import SQLiteTournamentStore
+
+from conftest import add_players, win
+
+
+def drawn(manager, count=8, mats=2, min_rest=600):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan")
+    add_players(tournament, count)
+    tournament.generate_first_round("cat", draw_seed=3)
+    manager.mats.mat_count = mats
+    manager.mats.min_rest = min_rest
+    return tournament
+
+
+def test_mat_state_survives_restart(manager):
+    tournament = drawn(manager)
+    first = manager.mats.start_next(1, 0.0)
+    second = manager.mats.start_next(2, 0.0)
+    win(tournament, first)
+    manager.mats.complete(first.match_id, 250.0)
+
+    reloaded = tm.Tournament.load_from_file(manager.get_tournament_file_path())
+    assert reloaded.mat_current == {2: (second.match_id, 0.0)}
+    assert reloaded.last_bout_end == {first.blue_player.id: 250.0, first.red_player.id: 250.0}
+
+
+def test_match_cannot_start_on_two_mats(journaled):
+    tournament, _ = journaled
+    add_players(tournament, 2)
+    tournament.generate_first_round("cat", draw_seed=3)
+    match = next(iter(tournament.matches.values()))
+    assert tournament.start_on_mat(1, match.match_id, 0.0)
+    assert not tournament.start_on_mat(2, match.match_id, 0.0)
+    assert tournament.mat_of(match.match_id) == 1
+
+
+def test_rest_is_enforced_when_starting(manager):
+    tournament = drawn(manager, count=4, mats=1)
+    for _ in range(2):
+        match = manager.mats.start_next(1, 0.0)
+        win(tournament, match)
+        manager.mats.complete(match.match_id, 100.0)
+
+    # La finale attend le repos des deux vainqueurs
+    assert manager.mats.start_next(1, 200.0) is None
+    assert manager.mats.next_start(1) == 700.0
+    assert manager.mats.start_next(1, 700.0).bracket_slot == 0
+
+
+def test_queue_moves_to_mat_that_frees_up_first(manager):
+    tournament = drawn(manager, mats=2, min_rest=0)
+    manager.mats.start_next(1, 0.0)
+    early = manager.mats.start_next(2, 0.0)
+    assert [len(queue) for queue in manager.mats.on_deck.values()] == [1, 1]
+
+    win(tournament, early)
+    manager.mats.complete(early.match_id, 60.0)
+    assert manager.mats.next_start(2) == 60.0
+    assert manager.mats.projected_finish()[2] == 60.0 + manager.mats.match_duration
+
+
+def test_extended_bout_hands_its_queue_over(manager):
+    drawn(manager, mats=2, min_rest=0)
+    now = time.time()
+    manager.mats.start_next(1, now)
+    manager.mats.start_next(2, now)
+
+    manager.mats.extend_current(1, 1000)
+    assert manager.mats.on_deck[1] == [] and len(manager.mats.on_deck[2]) == 2
+    assert manager.mats.projected_finish()[1] == pytest.approx(now + manager.mats.match_duration + 1000)
+    # Un match qui dépasse son estimation occupe encore le tapis au moins un round
+    late = now + 5000
+    assert manager.mats.current_end(2, late) == late + manager.mats.round_time
+
+
+def test_sqlite_store_is_locked_to_one_station(tmp_path):
+    path = str(tmp_path / "tournoi.db")
+    first = SQLiteTournamentStore(path, exclusive=True)
+    with pytest.raises(sqlite3.Error):
+        SQLiteTournamentStore(path, exclusive=True)
+    first.close()
+    SQLiteTournamentStore(path, exclusive=True).close()
+
+
+def test_second_station_cannot_open_shared_database(manager, tmp_path):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan", "sqlite")
+    add_players(tournament, 4)
+    tournament.generate_first_round("cat", draw_seed=1)
+    path = manager.get_index_path()
+
+    station = tm.TournamentManager(None)
+    assert station.load_tournament(path) is None
+    assert station.store is None
+
+    # Le premier poste termine les deux demi-finales : la finale garde ses deux finalistes
+    for match in [m for m in tournament.matches.values() if m.bracket_slot != 0]:
+        win(tournament, match)
+    manager.shutdown()
+    final = next(m for m in station.load_tournament(path).matches.values() if m.bracket_slot == 0)
+    assert final.blue_player and final.red_player
+    station.shutdown()
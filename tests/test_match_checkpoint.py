@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+from match_checkpoint import MatchCheckpoint
+
+
+def test_last_state_is_restored(tmp_path):
+    checkpoint = MatchCheckpoint(str(tmp_path))
+    checkpoint.begin({"blue_name": "Awa", "red_name": "Fanta"})
+    checkpoint.record({"round_number": 1, "blue_score": 2})
+    checkpoint.record({"round_number": 2, "blue_score": 5})
+
+    saved = MatchCheckpoint(str(tmp_path)).load()
+    assert saved == {"match": {"blue_name": "Awa", "red_name": "Fanta"},
+                     "state": {"round_number": 2, "blue_score": 5}}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    checkpoint = MatchCheckpoint(str(tmp_path))
+    checkpoint.begin({"blue_name": "Awa", "red_name": "Fanta"})
+    checkpoint.record({"round_number": 1})
+    with open(checkpoint.file_path, "a", encoding="utf-8") as file:
+        file.write('{"type": "state", "data": {"round_n')
+
+    assert checkpoint.load()["state"] == {"round_number": 1}
+
+
+def test_clear_removes_checkpoint(tmp_path):
+    checkpoint = MatchCheckpoint(str(tmp_path))
+    checkpoint.begin({})
+    checkpoint.clear()
+    checkpoint.record({"round_number": 1})
+    assert checkpoint.load() is None
+
+
+@pytest.mark.parametrize("saved, answer", [(False, None), (True, False)])
+def test_configuration_opens_after_resume_prompt(tmp_path, monkeypatch, saved, answer):
+    interface = pytest.importorskip("interface_taekwondo")
+    checkpoint = MatchCheckpoint(str(tmp_path))
+    if saved:
+        checkpoint.begin({"blue_name": "Awa", "red_name": "Fanta"})
+        checkpoint.record({"round_number": 2})
+    calls = []
+
+    def ask(*args, **kwargs):
+        calls.append("question")
+        return answer
+
+    monkeypatch.setattr(interface.messagebox, "askyesno", ask)
+    app = SimpleNamespace(match_checkpoint=checkpoint,
+                          show_configuration_dialog=lambda: calls.append("configuration"))
+    interface.TaekwondoInterface.offer_match_resume(app)
+    assert calls == (["question", "configuration"] if saved else ["configuration"])
+    assert checkpoint.load() is None
@@ -0,0 +1,65 @@
+import tournament_manager as tm
+from match_scheduler import MatchScheduler
+
+from conftest import add_players, win
+
+
+def two_categories(journaled, order=None):
+    tournament, _ = journaled
+    scheduler = MatchScheduler(order)
+    scheduler.bind(tournament)
+    add_players(tournament, 4, "A", "a")
+    add_players(tournament, 4, "B", "b")
+    tournament.generate_first_round("A", draw_seed=1)
+    tournament.generate_first_round("B", draw_seed=1)
+    return tournament, scheduler
+
+
+def test_lower_rounds_are_played_first(journaled):
+    tournament, scheduler = two_categories(journaled)
+    played = []
+    while True:
+        match = scheduler.next_match()
+        if not match:
+            break
+        played.append(match)
+        win(tournament, match)
+
+    assert len(played) == len(tournament.matches) == 6
+    assert [match.round_number for match in played] == [1, 1, 1, 1, 2, 2]
+
+
+def test_category_order_comes_first(journaled):
+    tournament, scheduler = two_categories(journaled, {"B": 1, "A": 2})
+    assert [match.category for match in scheduler.ready_matches()] == ["B", "B", "A", "A"]
+    assert scheduler.next_match("A").category == "A"
+
+    scheduler.set_category_order({"A": 1})
+    assert scheduler.next_match().category == "A"
+    assert list(scheduler.pending_by_category()) == ["A", "B"]
+
+
+def test_parent_is_queued_once_both_fighters_are_known(journaled):
+    tournament, scheduler = two_categories(journaled)
+    first, second = [tournament.matches[mid] for mid in tournament.brackets["A"][1:3]]
+    final = tournament.matches[tournament.brackets["A"][0]]
+
+    win(tournament, first)
+    assert final not in scheduler.ready_matches()
+    win(tournament, second)
+    assert scheduler.next_match("A") is final
+    assert len(scheduler.pending_by_category()["A"]) == 1
+
+
+def test_rebind_rebuilds_from_loaded_state(journaled):
+    tournament, scheduler = two_categories(journaled)
+    win(tournament, scheduler.next_match())
+    expected = [match.match_id for match in scheduler.ready_matches()]
+
+    loaded = tm.Tournament.load_from_file(journaled[1])
+    scheduler.bind(loaded)
+    assert [match.match_id for match in scheduler.ready_matches()] == expected
+    assert scheduler.next_match() is loaded.matches[expected[0]]
+
+    scheduler.bind(None)
+    assert scheduler.next_match() is None
@@ -0,0 +1,39 @@
+import pytest
+
+import tournament_manager as tm
+from tournament_manager import Corner, Match, Player
+
+from conftest import add_players, win
+
+
+def test_models_have_no_instance_dict():
+    player = Player("p1", "Athlète", "CLUB", "CIV", "cat")
+    match = Match("m1", player, None, 1, 1, "cat")
+    for model in (player, match):
+        assert not hasattr(model, "__dict__")
+        with pytest.raises(AttributeError):
+            model.surnom = "x"
+
+
+def test_repeated_strings_are_shared():
+    first = Player("p1", "A", "".join(["CLU", "B"]), "CIV", "".join(["-6", "8kg"]))
+    second = Player("p2", "B", "".join(["CL", "UB"]), "CIV", "".join(["-68", "kg"]))
+    assert first.club is second.club
+    assert first.category is second.category
+
+
+def test_corner_outcomes_round_trip():
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    add_players(tournament, 2)
+    tournament.generate_first_round("cat", draw_seed=1)
+    match = next(iter(tournament.matches.values()))
+    win(tournament, match, corner="red", blue_score=1, red_score=5)
+
+    assert match.winner is Corner.RED and match.winner == "red"
+    assert match.round_winners == (Corner.RED,)
+    data = match.to_dict()
+    assert data["winner"] == "red" and data["round_winners"] == ["red"]
+
+    copy = Match.from_dict(data, tournament.players)
+    assert copy.winner is Corner.RED
+    assert copy.loser_player is tournament.players[match.blue_player.id]
@@ -0,0 +1,65 @@
+import pytest
+
+import tournament_manager as tm
+from draw_engine import pool_order
+
+from conftest import add_players, win
+
+
+@pytest.mark.parametrize("count", [3, 4, 5])
+def test_pool_order_plays_every_pair_once(count):
+    order = pool_order(count)
+    assert sorted(tuple(sorted(pair)) for pair in order) == \
+        [(i, j) for i in range(count) for j in range(i + 1, count)]
+    # Minimum d'enchaînements : 2 à quatre athlètes (3 paires de combats disjoints), aucun à cinq
+    back_to_back = sum(bool(set(a) & set(b)) for a, b in zip(order, order[1:]))
+    assert back_to_back == {3: 2, 4: 2, 5: 0}[count]
+
+
+def test_pool_size_is_checked(journaled):
+    tournament, _ = journaled
+    add_players(tournament, 6)
+    assert tournament.generate_pool("cat") == []
+    assert not tournament.matches
+
+
+def test_ranking_uses_wins_then_point_difference(journaled):
+    tournament, path = journaled
+    add_players(tournament, 3)
+    matches = {frozenset((m.blue_player.id, m.red_player.id)): m
+               for m in tournament.generate_pool("cat", draw_seed=1)}
+
+    def result(winner, loser, scored, received):
+        match = matches[frozenset((winner, loser))]
+        if match.blue_player.id == winner:
+            win(tournament, match, "blue", scored, received)
+        else:
+            win(tournament, match, "red", received, scored)
+
+    # Trois athlètes à une victoire : départagés par la différence de points
+    result("p0", "p1", 10, 2)
+    result("p1", "p2", 6, 5)
+    result("p2", "p0", 4, 3)
+    ranking = tournament.pool_ranking("cat")
+    assert [standing.player.id for standing in ranking] == ["p0", "p2", "p1"]
+    assert [standing.point_difference for standing in ranking] == [7, 0, -7]
+    assert all(standing.played == 2 and standing.wins == 1 for standing in ranking)
+
+    loaded = tm.Tournament.load_from_file(path)
+    assert [s.player.id for s in loaded.pool_ranking("cat")] == ["p0", "p2", "p1"]
+    assert loaded.is_category_finished("cat")
+
+
+def test_pool_correction_undoes_wins(journaled):
+    tournament, _ = journaled
+    add_players(tournament, 4)
+    matches = tournament.generate_pool("cat")
+    match = matches[0]
+    win(tournament, match, "blue")
+    win(tournament, match, "red", 1, 5)
+    assert (match.blue_player.wins, match.blue_player.losses) == (0, 1)
+    assert (match.red_player.wins, match.red_player.losses) == (1, 0)
+
+    standings = tournament.pool_standings["cat"]
+    assert standings[match.red_player.id].wins == 1 and standings[match.blue_player.id].losses == 1
+    assert standings[match.blue_player.id].played == 1
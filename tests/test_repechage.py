@@ -0,0 +1,66 @@
+import tournament_manager as tm
+from match_scheduler import MatchScheduler
+
+from conftest import add_players, win, same_state
+
+
+def play_all(tournament):
+    """Joue tous les matchs dans l'ordre de la file (coin bleu gagnant)"""
+    scheduler = MatchScheduler()
+    scheduler.bind(tournament)
+    order = []
+    while True:
+        match = scheduler.next_match()
+        if not match:
+            break
+        order.append(match)
+        win(tournament, match)
+    return order
+
+
+def drawn(tournament, count=16):
+    add_players(tournament, count)
+    tournament.generate_first_round("cat", draw_seed=5, repechage=True)
+
+
+def test_repechage_is_scheduled_before_final(journaled):
+    tournament, _ = journaled
+    drawn(tournament)
+    order = play_all(tournament)
+
+    repechages = [index for index, match in enumerate(order) if match.repechage]
+    final = next(index for index, match in enumerate(order) if match.bracket_slot == 0)
+    assert repechages and max(repechages) < final
+
+
+def test_each_half_chains_the_finalist_losers(journaled):
+    tournament, path = journaled
+    drawn(tournament)
+    play_all(tournament)
+
+    for half in ("A", "B"):
+        chain = [tournament.matches[f"cat_REP{half}_M{index}"] for index in (1, 2)]
+        assert f"cat_REP{half}_M3" not in tournament.matches
+        assert chain[0].next_match_id == chain[1].match_id
+        # Vainqueur du premier repêchage face au battu de la demi-finale
+        assert chain[1].blue_player is chain[0].winner_player
+        assert all(match.completed for match in chain)
+
+    bronze = {tournament.matches[f"cat_REP{half}_M2"].winner_player.id for half in ("A", "B")}
+    assert len(bronze) == 2
+    assert same_state(tournament, tm.Tournament.load_from_file(path))
+
+
+def test_semifinal_winner_is_locked_once_repechage_is_drawn(journaled):
+    tournament, _ = journaled
+    drawn(tournament, 8)
+    semifinal = None
+    while semifinal is None or not semifinal.completed:
+        match = tournament.get_next_match()
+        win(tournament, match)
+        if match.bracket_slot == 1:
+            semifinal = match
+
+    assert tournament.matches["cat_REPA_M1"]
+    assert tournament.correction_blocked(semifinal.match_id, "red")
+    assert not win(tournament, semifinal, "red", 1, 5)
@@ -0,0 +1,59 @@
+import tournament_manager as tm
+
+from conftest import same_state
+
+
+def row(pid, category, weight="60", name=None):
+    return {"id": str(pid), "name": name or f"Athlète {pid}", "club": "CLUB", "country": "CIV",
+            "category": category, "weight": weight, "age": "20", "seed": ""}
+
+
+def initial_rows():
+    return [row(i, "A" if i < 6 else "B") for i in range(10)]
+
+
+def test_first_import_adds_everyone(journaled):
+    tournament, _ = journaled
+    diff = tournament.diff_roster(initial_rows())
+    assert len(diff.added) == 10 and not diff.changed and not diff.withdrawn
+    tournament.apply_roster_diff(diff)
+    assert len(tournament.categories["A"]) == 6 and len(tournament.categories["B"]) == 4
+    assert tournament.players["0"].weight == 60.0
+
+
+def test_reimport_updates_moves_and_withdraws(journaled):
+    tournament, path = journaled
+    tournament.apply_roster_diff(tournament.diff_roster(initial_rows()))
+    tournament.generate_first_round("B", draw_seed=1)
+
+    rows = initial_rows()
+    rows[0] = row(0, "C")             # changement de catégorie
+    rows[1] = row(1, "A", "61.5")     # correction de poids
+    rows[7] = row(7, "A")             # athlète déjà tiré : refusé
+    del rows[2]                       # retrait
+    rows += [row(20, "C"), row(21, "B")]  # ajout, puis ajout dans une catégorie tirée
+    diff = tournament.diff_roster(rows)
+
+    assert [p.id for p in diff.added] == ["20"]
+    assert sorted(p.id for p, _, _ in diff.changed) == ["0", "1"]
+    assert [p.id for p, _, _ in diff.moved] == ["0"]
+    assert [p.id for p in diff.withdrawn] == ["2"]
+    assert len(diff.locked) == 2
+
+    tournament.apply_roster_diff(diff)
+    assert "2" not in tournament.players
+    assert tournament.players["0"].category == "C"
+    assert tournament.categories["C"] == ["0", "20"]
+    assert tournament.players["1"].weight == 61.5
+    assert "7" in tournament.categories["B"]
+    assert "1 changement(s) de catégorie" in diff.summary()
+    assert not tournament.diff_roster(rows).has_changes
+    assert same_state(tournament, tm.Tournament.load_from_file(path))
+
+
+def test_withdrawals_can_be_declined(journaled):
+    tournament, _ = journaled
+    tournament.apply_roster_diff(tournament.diff_roster(initial_rows()))
+    diff = tournament.diff_roster(initial_rows()[:8])
+    tournament.apply_roster_diff(diff, withdraw=False)
+    assert len(tournament.players) == 10
@@ -0,0 +1,45 @@
+import tournament_manager as tm
+from roster_index import RosterIndex, normalize_name
+
+
+def player(pid, name, club="ASEC", category="cat"):
+    return tm.Player(pid, name, club, "CIV", category)
+
+
+def test_normalized_name_ignores_case_accents_and_order():
+    assert normalize_name("Éric  DUPONT") == normalize_name("dupont eric") == normalize_name("Dupont-Éric")
+    assert normalize_name("Eric Dupont") != normalize_name("Eric Dupond")
+
+
+def test_index_tracks_duplicates_and_unique_counts():
+    index = RosterIndex()
+    for p in (player("1", "Kouassi Yao"), player("2", "Yao Kouassi", "STADE"), player("3", "Awa Traoré")):
+        index.add(p)
+    assert index.duplicates() == [["1", "2"]]
+    assert index.unique_count("cat") == 2
+    assert index.is_duplicate("2") and not index.is_duplicate("3")
+
+    index.remove("2")
+    assert index.duplicates() == []
+    assert index.unique_count("cat") == 2
+
+
+def test_draw_keeps_athletes_with_swapped_names(journaled):
+    tournament, _ = journaled
+    for p in (player("1", "Kouassi Yao"), player("2", "Yao Kouassi", "STADE"),
+              player("3", "Awa Traoré", "AFRICA"), player("4", "Fanta Koné", "SOA")):
+        tournament.add_player(p)
+
+    assert [p.id for p in tournament.eligible_players("cat")] == ["1", "2", "3", "4"]
+    tournament.generate_first_round("cat", draw_seed=1)
+    drawn = {p.id for m in tournament.matches.values() for p in (m.blue_player, m.red_player) if p}
+    assert drawn == {"1", "2", "3", "4"}
+    assert tournament.roster_index.duplicates() == [["1", "2"]]
+
+
+def test_repeated_id_is_drawn_once(journaled):
+    tournament, _ = journaled
+    for p in (player("1", "Kouassi Yao"), player("2", "Awa Traoré", "STADE")):
+        tournament.add_player(p)
+    tournament.categories["cat"].append("1")
+    assert [p.id for p in tournament.eligible_players("cat")] == ["1", "2"]
@@ -0,0 +1,76 @@
+import tournament_manager as tm
+
+from conftest import add_players, win
+
+
+def legacy_round(tournament, count=4, category="cat"):
+    """Premier tour de l'ancien mode par tours (sans tableau), comme dans les anciens fichiers"""
+    players = add_players(tournament, count, category)
+    matches = [tm.Match(f"{category}_R1_M{k + 1}", players[2 * k], players[2 * k + 1], 1, k + 1, category)
+               for k in range(count // 2)]
+    for match in matches:
+        tournament._register_match(match)
+    tournament._journal_round(category, 1, matches)
+    return matches
+
+
+def final_of(tournament, category="cat"):
+    return max((m for m in tournament.matches.values() if m.category == category),
+               key=lambda m: m.round_number)
+
+
+def test_rounds_advance_per_category(journaled):
+    tournament, _ = journaled
+    first = legacy_round(tournament, 4, "A")
+    legacy_round(tournament, 4, "B")
+    for match in first:
+        win(tournament, match)
+    assert tournament.category_round("A") == 2
+    assert tournament.category_round("B") == 1
+
+
+def test_legacy_final_counts_once(journaled):
+    tournament, path = journaled
+    for match in legacy_round(tournament):
+        win(tournament, match)
+    final = final_of(tournament)
+    win(tournament, final)
+
+    assert tournament.generate_next_round("cat") == []
+    assert "cat" in tournament.finished_categories
+    champion = final.winner_player
+    assert (champion.wins, champion.losses) == (2, 0)
+    assert final.loser_player.eliminated
+    reloaded = tm.Tournament.load_from_file(path)
+    assert reloaded.players[champion.id].wins == 2
+    assert "cat" in reloaded.finished_categories
+
+
+def test_drawn_legacy_final_finishes_category(journaled):
+    tournament, path = journaled
+    for match in legacy_round(tournament):
+        win(tournament, match)
+    final = final_of(tournament)
+
+    assert tournament.update_match_result(final.match_id, 3, 3, 0, 0, "draw", ["draw"])
+    assert "cat" in tournament.finished_categories
+    assert tournament.generate_next_round("cat") == []
+    assert not final.blue_player.eliminated and not final.red_player.eliminated
+    assert tm.Tournament.load_from_file(path).matches[final.match_id].winner == final.winner
+
+
+def test_counted_legacy_final_cannot_change_winner(journaled):
+    tournament, _ = journaled
+    for match in legacy_round(tournament):
+        win(tournament, match)
+    final = final_of(tournament)
+    win(tournament, final, "blue")
+    blue, red = final.blue_player, final.red_player
+
+    assert tournament.correction_blocked(final.match_id, "red")
+    assert not win(tournament, final, "red", 1, 5)
+    tournament.generate_next_round("cat")
+    assert (blue.wins, blue.losses, blue.eliminated) == (2, 0, False)
+    assert (red.wins, red.losses, red.eliminated) == (1, 1, True)
+    # Les points restent corrigeables
+    assert win(tournament, final, "blue", 9, 1)
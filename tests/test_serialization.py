@@ -0,0 +1,64 @@
+import json
+
+import tournament_manager as tm
+
+from conftest import add_players, same_state
+
+
+def drawn_tournament():
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    add_players(tournament, 4)
+    tournament.generate_first_round("cat", draw_seed=2)
+    return tournament
+
+
+def test_matches_reference_players_by_id(tmp_path):
+    path = str(tmp_path / "tournoi.json")
+    assert drawn_tournament().save_to_file(path)
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    assert data["format_version"] == tm.TOURNAMENT_FORMAT_VERSION
+    for match_data in data["matches"].values():
+        assert "blue_player" not in match_data
+        assert match_data["blue_player_id"] in list(data["players"]) + [None]
+
+
+def test_loaded_matches_share_player_instances(tmp_path):
+    path = str(tmp_path / "tournoi.json")
+    drawn_tournament().save_to_file(path)
+
+    loaded = tm.Tournament.load_from_file(path)
+    fighters = [player for match in loaded.matches.values()
+                for player in (match.blue_player, match.red_player) if player]
+    assert len(fighters) == 4
+    for player in fighters:
+        assert player is loaded.players[player.id]
+
+
+def test_embedded_players_are_relinked_and_converted(tmp_path):
+    tournament = drawn_tournament()
+    path = str(tmp_path / "ancien.json")
+    tournament.save_to_file(path)
+
+    # Ancien format : copie complète des joueurs dans chaque match
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    for match_data in data["matches"].values():
+        for corner in ("blue", "red"):
+            player_id = match_data.pop(f"{corner}_player_id")
+            match_data[f"{corner}_player"] = data["players"][player_id] if player_id else None
+    del data["format_version"]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+
+    loaded = tm.Tournament.load_from_file(path)
+    assert same_state(tournament, loaded)
+    match = next(m for m in loaded.matches.values() if m.blue_player)
+    assert match.blue_player is loaded.players[match.blue_player.id]
+
+    converted = str(tmp_path / "converti.json")
+    assert tm.Tournament.convert_file(path, converted)
+    with open(converted, encoding="utf-8") as file:
+        assert "blue_player_id" in next(iter(json.load(file)["matches"].values()))
+    assert same_state(tournament, tm.Tournament.load_from_file(converted))
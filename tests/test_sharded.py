@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+import tournament_manager as tm
+from tournament_manager import SHARD_DIRECTORY_NAME, SHARD_MANIFEST_NAME
+
+from conftest import play_some, same_state, win
+
+
+@pytest.fixture
+def two_categories():
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    play_some(tournament, "-58kg")
+    play_some(tournament, "+80kg/Élite", prefix="e")
+    return tournament
+
+
+def shard_path(directory, category):
+    return os.path.join(directory, SHARD_DIRECTORY_NAME, tm.Tournament.shard_file_name(category))
+
+
+def test_sharded_round_trip(tmp_path, two_categories):
+    directory = str(tmp_path / "open")
+    assert two_categories.save_sharded(directory)
+    assert os.path.exists(os.path.join(directory, SHARD_MANIFEST_NAME))
+    assert os.path.exists(shard_path(directory, "+80kg/Élite"))
+    assert same_state(two_categories, tm.Tournament.load_sharded(directory))
+
+
+def test_lazy_load_keeps_other_shards(tmp_path, two_categories):
+    directory = str(tmp_path / "open")
+    two_categories.save_sharded(directory)
+
+    partial = tm.Tournament.load_sharded(directory, categories=["-58kg"])
+    assert list(partial.categories) == ["-58kg"]
+    assert list(partial.unloaded_shards) == ["+80kg/Élite"]
+    assert {p.category for p in partial.players.values()} == {"-58kg"}
+
+    # Sauvegarder la partie chargée ne perd pas les catégories non chargées
+    assert partial.save_sharded(directory)
+    assert same_state(two_categories, tm.Tournament.load_sharded(directory))
+
+
+def test_only_dirty_categories_are_rewritten(tmp_path, two_categories):
+    directory = str(tmp_path / "open")
+    two_categories.write_sharded_snapshot(two_categories.build_sharded_snapshot(), directory)
+    assert not two_categories.dirty_categories
+
+    match = next(m for m in two_categories.matches.values()
+                 if m.category == "-58kg" and m.blue_player and m.red_player and not m.completed)
+    win(two_categories, match)
+    snapshot = two_categories.build_sharded_snapshot()
+    assert [shard["category"] for shard in snapshot["shards"].values()] == ["-58kg"]
+
+    untouched = shard_path(directory, "+80kg/Élite")
+    os.utime(untouched, (0, 0))
+    two_categories.write_sharded_snapshot(snapshot, directory)
+    assert os.path.getmtime(untouched) == 0
+    assert same_state(two_categories, tm.Tournament.load_sharded(directory))
+
+
+def test_manager_round_trip(manager):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan", "sharded")
+    play_some(tournament)
+    manager.set_category_order({"cat": 1})
+    manager.flush_autosave()
+    assert manager.save_tournament()
+    manager.shutdown()
+
+    other = tm.TournamentManager(None)
+    loaded = other.load_tournament(manager.get_index_path())
+    assert other.storage_backend == "sharded"
+    assert same_state(tournament, loaded)
+    assert loaded.category_order == {"cat": 1}
+    assert other.scheduler.category_order == {"cat": 1}
@@ -0,0 +1,55 @@
+import json
+
+import tournament_manager as tm
+
+from conftest import add_players, win
+
+
+def drawn_tournament():
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    add_players(tournament, 4)
+    tournament.generate_first_round("cat", draw_seed=3)
+    return tournament
+
+
+def entries_by_id(entries):
+    return {json.loads("{" + entry + "}").popitem()[0]: entry for entry in entries}
+
+
+def test_every_assignment_bumps_version():
+    player = tm.Player("p1", "Athlète", "CLUB", "CIV", "cat")
+    version = player._version
+    player.wins += 1
+    player.eliminated = True
+    assert player._version == version + 2
+
+
+def test_snapshot_reuses_unchanged_entries():
+    tournament = drawn_tournament()
+    first = tournament.build_snapshot()
+    match = next(m for m in tournament.matches.values() if m.blue_player and m.red_player)
+    win(tournament, match)
+    second = tournament.build_snapshot()
+
+    before, after = entries_by_id(first["matches"]), entries_by_id(second["matches"])
+    changed = {mid for mid in after if after[mid] is not before[mid]}
+    # Le match joué et celui du tour suivant (vainqueur placé) ; l'autre match du tour est réutilisé
+    other = next(m for m in tournament.matches.values() if m.round_number == 1 and m is not match)
+    assert match.match_id in changed
+    assert other.match_id not in changed
+
+    players_before, players_after = entries_by_id(first["players"]), entries_by_id(second["players"])
+    changed_players = {pid for pid in players_after if players_after[pid] is not players_before[pid]}
+    assert changed_players == {match.blue_player.id, match.red_player.id}
+
+
+def test_rendered_snapshot_matches_models():
+    tournament = drawn_tournament()
+    tournament.build_snapshot()
+    tournament.add_player(tm.Player("retire", "Retiré", "CLUB", "CIV", "autre"))
+    tournament.remove_player("retire")
+
+    data = json.loads(tournament.render_snapshot(tournament.build_snapshot()))
+    assert "retire" not in data["players"]
+    assert data["players"] == {pid: p.to_dict() for pid, p in tournament.players.items()}
+    assert data["matches"] == {mid: m.to_dict() for mid, m in tournament.matches.items()}
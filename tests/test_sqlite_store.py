@@ -0,0 +1,80 @@
+import pytest
+
+import tournament_manager as tm
+from tournament_store import SQLiteTournamentStore
+
+from conftest import add_players, play_some, same_state
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Base SQLite liée à un tournoi vide"""
+    tournament = tm.Tournament("Open", "2026", "Abidjan")
+    store = SQLiteTournamentStore(str(tmp_path / "tournoi.db"))
+    store.save_tournament(tournament)
+    store.bind(tournament)
+    yield store
+    store.close()
+
+
+def reload(store):
+    other = SQLiteTournamentStore(store.db_path)
+    try:
+        return other.load_tournament()
+    finally:
+        other.close()
+
+
+def test_store_follows_journal_events(store):
+    play_some(store.tournament)
+    assert same_state(store.tournament, reload(store))
+
+
+def test_full_save_matches_incremental_updates(store, tmp_path):
+    tournament = store.tournament
+    play_some(tournament)
+    copy = SQLiteTournamentStore(str(tmp_path / "copie.db"))
+    assert copy.save_tournament(tournament)
+    assert same_state(copy.load_tournament(), reload(store))
+    copy.close()
+
+
+def test_indexed_lookups(store):
+    tournament = store.tournament
+    add_players(tournament, 4, "A")
+    add_players(tournament, 2, "B", prefix="b")
+    tournament.generate_first_round("A", draw_seed=1)
+
+    first_round = store.match_ids_for_category("A", 1)
+    assert sorted(first_round) == sorted(m.match_id for m in tournament.matches.values() if m.round_number == 1)
+    assert len(store.match_ids_for_category("A")) == 3
+    assert store.match_ids_for_category("B") == []
+    assert store.player_ids_by_club("CLUB 1") == ["p1", "b1"]
+
+
+def test_manager_round_trip(manager):
+    tournament = manager.create_new_tournament("Open", "2026", "Abidjan", "sqlite")
+    play_some(tournament)
+    manager.set_category_order({"cat": 1})
+    manager.shutdown()
+
+    other = tm.TournamentManager(None)
+    loaded = other.load_tournament(manager.get_index_path())
+    assert other.storage_backend == "sqlite"
+    assert same_state(tournament, loaded)
+    assert loaded.category_order == {"cat": 1}
+    other.shutdown()
+
+
+@pytest.mark.parametrize("start, target", [("json", "sqlite"), ("sqlite", "json"), ("sqlite", "sharded")])
+def test_change_storage_backend_keeps_tournament(manager, start, target):
+    tournament = manager.create_new_tournament("Conversion", "2026", "Abidjan", start)
+    play_some(tournament)
+    assert manager.change_storage_backend(target)
+    manager.shutdown()
+
+    other = tm.TournamentManager(None)
+    loaded = other.load_tournament(manager.get_index_path())
+    assert other.storage_backend == target
+    assert same_state(tournament, loaded)
+    other.shutdown()
@@ -0,0 +1,44 @@
+import tkinter as tk
+
+import pytest
+
+from virtual_treeview import VirtualTreeview
+
+
+def test_numbers_sort_before_text():
+    values = ["b", "10", "A", 9, "", "2.5"]
+    assert sorted(values, key=VirtualTreeview._sort_key) == ["2.5", 9, "10", "", "A", "b"]
+
+
+@pytest.fixture
+def table():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("affichage indisponible")
+    root.withdraw()
+    table = VirtualTreeview(root)
+    rows = [{"id": f"P{i}", "name": f"Athlète {i}", "weight": str(100 - i % 50)} for i in range(10000)]
+    table.set_rows(["id", "name", "weight"], rows)
+    yield table
+    root.destroy()
+
+
+def test_only_visible_rows_are_created(table):
+    assert table.row_count == 10000
+    assert len(table.tree.get_children()) == table.visible_count + table.BUFFER
+
+    table.yview("moveto", 0.5)
+    first = table.tree.get_children()[0]
+    assert table.tree.item(first, "values")[0] == "P5000"
+
+
+def test_sort_and_filter(table):
+    table.sort_by("weight")
+    assert table.rows[table.view[0]]["weight"] == "51"
+    table.sort_by("weight")
+    assert table.rows[table.view[0]]["weight"] == "100"
+
+    table.set_filter("athlète 999")
+    assert sorted(table.rows[index]["id"] for index in table.view) == ["P999"] + [f"P999{i}" for i in range(10)]
+    assert table.offset == 0
@@ -0,0 +1,84 @@
+import pytest
+
+import import_manager
+from openpyxl import Workbook
+
+from import_manager import ImportManager
+
+HEADER = ["id", "name", "club", "country", "category", "weight"]
+
+
+def write_workbook(path, rows, header=HEADER):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(header)
+    for values in rows:
+        sheet.append(values)
+    workbook.save(path)
+    return str(path)
+
+
+def streamed_errors(manager, path):
+    return [error for chunk in manager.iter_chunks(path, chunk_size=2) for error in chunk.errors]
+
+
+def test_streamed_workbook_checks_lengths_with_sheet_rows(tmp_path):
+    path = write_workbook(tmp_path / "inscrits.xlsx", [
+        ["P1", "Awa", "CLUB", "CIV", "Senior -57", 56],
+        [None] * 6,
+        ["X", "Koffi", "CLUB", "CIV", "Senior -68", 67],
+        ["P3", "K", "CLUB", "CIV", "Senior -68", 66],
+        ["P1", "Awa", "CLUB", "CIV", "Senior -57", 56],
+    ])
+    assert streamed_errors(ImportManager(), path) == [
+        "Ligne 4: ID invalide 'X'",
+        "Ligne 5: Nom invalide 'K'",
+        "Ligne 6: ID dupliqué 'P1'",
+    ]
+
+
+def test_missing_columns_raise(tmp_path):
+    path = write_workbook(tmp_path / "inscrits.xlsx", [["P1", "Awa"]], header=["id", "name"])
+    with pytest.raises(ValueError, match="Colonnes manquantes"):
+        list(ImportManager().iter_chunks(str(path)))
+
+
+def test_only_large_workbooks_are_streamed(tmp_path, monkeypatch):
+    path = write_workbook(tmp_path / "inscrits.xlsx", [["P1", "Awa", "CLUB", "CIV", "Senior -57", 56]])
+    manager = ImportManager()
+    assert not manager.use_streaming(path)
+    monkeypatch.setattr(import_manager, "EXCEL_STREAMING_MIN_SIZE", 1)
+    assert manager.use_streaming(path)
+    assert not manager.use_streaming(str(tmp_path / "inscrits.xls"))
+
+
+def test_extra_columns_and_trailing_blank_rows(tmp_path):
+    header = ["Remarque", " ID ", "Name", "club", "country", "category", "Weight", "Coach"]
+    path = write_workbook(tmp_path / "inscrits.xlsx", [
+        ["?", "P1", " Awa ", "CLUB", "CIV", "Senior -57", 56.5, "M. Kone"],
+        ["?", None, None, None, None, None, None, None],
+        [None] * 8,
+    ], header=header)
+    progress = [0, 0]
+    rows = list(ImportManager().iter_excel_rows(path, progress))
+
+    assert len(rows) == 1
+    assert rows[0]["id"] == "P1" and rows[0]["name"] == "Awa" and rows[0]["weight"] == "56.5"
+    assert rows[0]["gender"] == ""
+    assert progress == [3, 3]
+
+
+def test_streamed_and_pandas_paths_agree(tmp_path):
+    path = write_workbook(tmp_path / "inscrits.xlsx", [
+        ["P1", "Awa", "CLUB", "CIV", "Senior -57", 56],
+        ["P2", "Koffi", "CLUB", "CIV", "Senior -68", "lourd"],
+        ["P1", "Awa", "CLUB", "CIV", "Senior -57", 56],
+        ["P3", "Ali", "CLUB", "CIV", "Senior -68", 67.5],
+    ])
+    manager = ImportManager()
+    streamed = [row for chunk in manager.iter_chunks(path, chunk_size=2) for row in chunk.rows]
+    records, errors = manager.read_excel(path)
+
+    assert [row["id"] for row in streamed] == [record["id"] for record in records] == ["P1", "P3"]
+    assert list(errors["row"]) == [3, 4]
+    assert [error.split(":")[0] for error in streamed_errors(manager, path)] == ["Ligne 3", "Ligne 4"]
@@ -0,0 +1,128 @@
+import gzip
+import json
+import lzma
+import struct
+from typing import List, Dict, Any, Optional
+
+from autosave import write_file_atomic
+from tournament_manager import Player, Match, Tournament
+
+# Format d'archive : signature, longueur de la table des matières (8 octets),
+# table des matières JSON, puis une section compressée indépendante par bloc
+ARCHIVE_MAGIC = b"TKWARCH1\n"
+ARCHIVE_COMPRESSIONS = {
+    "lzma": (lzma.compress, lzma.decompress),
+    "gzip": (gzip.compress, gzip.decompress)
+}
+CATEGORY_SECTION_PREFIX = "category:"
+
+
+def export_archive(tournament: Tournament, file_path: str, compression: str = "lzma") -> None:
+    """Écrit le tournoi dans une archive compressée à sections indépendantes"""
+    compress = ARCHIVE_COMPRESSIONS[compression][0]
+
+    sections: Dict[str, Any] = {
+        "header": tournament.header_to_dict(),
+        "summary": tournament.summary(),
+        "players": {pid: player.to_dict() for pid, player in tournament.players.items()},
+        "categories": tournament.categories,
+        "rounds": tournament.rounds
+    }
+    # Les matchs d'une catégorie forment une section : on peut les lire seuls
+    matches_by_category: Dict[str, Dict[str, Any]] = {category: {} for category in tournament.categories}
+    for mid, match in tournament.matches.items():
+        matches_by_category.setdefault(match.category, {})[mid] = match.to_dict()
+    for category, matches in matches_by_category.items():
+        sections[CATEGORY_SECTION_PREFIX + category] = matches
+
+    toc: Dict[str, Any] = {"compression": compression, "sections": {}}
+    blobs = []
+    offset = 0
+    for name, content in sections.items():
+        blob = compress(json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode('utf-8'))
+        toc["sections"][name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    toc_bytes = json.dumps(toc, ensure_ascii=False).encode('utf-8')
+    write_file_atomic(file_path, b"".join([ARCHIVE_MAGIC, struct.pack(">Q", len(toc_bytes)), toc_bytes] + blobs))
+
+
+class TournamentArchive:
+    """Lecture d'une archive de tournoi : seules les sections demandées sont décompressées"""
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.file = open(file_path, 'rb')
+        try:
+            if self.file.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+                raise ValueError(f"{file_path} n'est pas une archive de tournoi")
+            (toc_length,) = struct.unpack(">Q", self.file.read(8))
+            toc = json.loads(self.file.read(toc_length).decode('utf-8'))
+        except Exception:
+            self.file.close()
+            raise
+        self.decompress = ARCHIVE_COMPRESSIONS[toc["compression"]][1]
+        self.sections: Dict[str, List[int]] = toc["sections"]
+        self.data_offset = len(ARCHIVE_MAGIC) + 8 + toc_length
+        self._players: Optional[Dict[str, Player]] = None
+
+    def close(self) -> None:
+        """Ferme le fichier de l'archive"""
+        self.file.close()
+
+    def __enter__(self) -> 'TournamentArchive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def read_section(self, name: str) -> Any:
+        """Décompresse et décode une seule section"""
+        offset, length = self.sections[name]
+        self.file.seek(self.data_offset + offset)
+        return json.loads(self.decompress(self.file.read(length)).decode('utf-8'))
+
+    def header(self) -> Dict[str, Any]:
+        """Informations générales du tournoi"""
+        return self.read_section("header")
+
+    def summary(self) -> Dict[str, Any]:
+        """Résumé (nombre de catégories, joueurs, matchs terminés)"""
+        return self.read_section("summary")
+
+    def category_names(self) -> List[str]:
+        """Catégories présentes dans l'archive (sans rien décompresser)"""
+        return [name[len(CATEGORY_SECTION_PREFIX):] for name in self.sections
+                if name.startswith(CATEGORY_SECTION_PREFIX)]
+
+    def players(self) -> Dict[str, Player]:
+        """Joueurs du tournoi (section lue une seule fois)"""
+        if self._players is None:
+            self._players = {pid: Player.from_dict(data) for pid, data in self.read_section("players").items()}
+        return self._players
+
+    def category_matches(self, category: str) -> Dict[str, Match]:
+        """Matchs d'une seule catégorie, reliés aux joueurs"""
+        players = self.players()
+        return {mid: Match.from_dict(data, players)
+                for mid, data in self.read_section(CATEGORY_SECTION_PREFIX + category).items()}
+
+    def load_tournament(self) -> Tournament:
+        """Reconstruit le tournoi complet"""
+        tournament = Tournament.from_header(self.header())
+        tournament.players = self.players()
+        tournament.categories = self.read_section("categories")
+        for category in self.category_names():
+            tournament.matches.update(self.category_matches(category))
+        tournament.rounds = {int(k): v for k, v in self.read_section("rounds").items()}
+        return tournament
+
+
+def import_archive(file_path: str) -> Optional[Tournament]:
+    """Charge un tournoi complet depuis une archive"""
+    try:
+        with TournamentArchive(file_path) as archive:
+            return archive.load_tournament()
+    except Exception as e:
+        print(f"Erreur lors de la lecture de l'archive du tournoi: {e}")
+        return None
@@ -0,0 +1,94 @@
+import os
+import json
+import glob
+import time
+import sqlite3
+from typing import List, Dict, Any, Optional
+
+from autosave import write_file_atomic
+
+# Fichier d'index placé dans le dossier des tournois
+INDEX_FILE_NAME = "index.json"
+
+class TournamentIndex:
+    """Index des tournois enregistrés (métadonnées seulement) pour un chargement instantané"""
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self.index_path = os.path.join(data_dir, INDEX_FILE_NAME)
+        self.entries: Dict[str, Dict[str, Any]] = {}  # chemin -> métadonnées
+        self.load()
+
+    def load(self) -> None:
+        """Lit l'index ; le reconstruit à partir des fichiers s'il n'existe pas encore"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as file:
+                self.entries = json.load(file)
+        except FileNotFoundError:
+            self.rebuild()
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Index des tournois illisible, reconstruction: {e}")
+            self.rebuild()
+
+    def save(self, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Écrit l'index (ou une copie de ses entrées) sur disque"""
+        entries = self.entries if entries is None else entries
+        write_file_atomic(self.index_path, json.dumps(entries, indent=4, ensure_ascii=False))
+
+    def update(self, file_path: str, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Enregistre ou met à jour les métadonnées d'un tournoi (sans écrire l'index)"""
+        entry = dict(summary)
+        entry["path"] = os.path.abspath(file_path)
+        entry["last_modified"] = time.time()
+        self.entries[entry["path"]] = entry
+        return entry
+
+    def remove(self, file_path: str) -> None:
+        """Retire un tournoi de l'index"""
+        self.entries.pop(os.path.abspath(file_path), None)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tournois encore présents sur disque, du plus récemment modifié au plus ancien"""
+        entries = [entry for entry in self.entries.values() if os.path.exists(entry["path"])]
+        entries.sort(key=lambda entry: entry["last_modified"], reverse=True)
+        return entries[:limit] if limit else entries
+
+    def rebuild(self) -> None:
+        """Reconstruit l'index en lisant une fois chaque tournoi du dossier"""
+        # Import local : tournament_manager dépend de ce module
+        from tournament_manager import Tournament, SHARD_MANIFEST_NAME
+
+        self.entries = {}
+        candidates = [path for path in glob.glob(os.path.join(self.data_dir, "*.json"))
+                      if os.path.basename(path) != INDEX_FILE_NAME]
+        candidates += glob.glob(os.path.join(self.data_dir, "*", SHARD_MANIFEST_NAME))
+        candidates += glob.glob(os.path.join(self.data_dir, "*.db"))
+
+        for path in candidates:
+            tournament = self._load_any(path, Tournament, SHARD_MANIFEST_NAME)
+            if tournament:
+                entry = self.update(path, tournament.summary())
+                entry["last_modified"] = os.path.getmtime(path)
+
+        try:
+            self.save()
+        except OSError as e:
+            print(f"Impossible d'écrire l'index des tournois: {e}")
+
+    @staticmethod
+    def _load_any(path: str, tournament_cls, manifest_name: str):
+        """Charge un tournoi quel que soit son format de stockage"""
+        if path.endswith(".db"):
+            from tournament_store import SQLiteTournamentStore
+            try:
+                # Sans attente : la base du tournoi ouvert est verrouillée et sera indexée à sa sauvegarde
+                store = SQLiteTournamentStore(path, timeout=0)
+            except sqlite3.Error as e:
+                print(f"Base de tournoi illisible {path}: {e}")
+                return None
+            try:
+                return store.load_tournament()
+            finally:
+                store.close()
+        if os.path.basename(path) == manifest_name:
+            return tournament_cls.load_sharded(os.path.dirname(path))
+        return tournament_cls.load_from_file(path)
@@ -1,21 +1,91 @@
 import os
 import csv
 import json
+import sqlite3
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import random
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import sys
+import hashlib
+import time
+import threading
+from contextlib import contextmanager
+from enum import Enum
+from typing import List, Dict, Any, Optional, Tuple, Callable
 
-class Player:
+from autosave import AutosaveWorker, write_file_atomic
+from draw_engine import seeded_draw, new_draw_seed, pool_order
+from roster_index import RosterIndex
+from tournament_index import TournamentIndex
+
+# Extension du journal d'événements associé à un instantané JSON
+JOURNAL_EXTENSION = ".journal"
+# Version du format de fichier : 2 = matchs référençant les joueurs par identifiant
+TOURNAMENT_FORMAT_VERSION = 2
+# Stockage fragmenté : un manifeste et un fichier par catégorie
+SHARD_MANIFEST_NAME = "manifest.json"
+SHARD_DIRECTORY_NAME = "categories"
+# Archive compressée des tournois terminés (voir tournament_archive.py)
+ARCHIVE_EXTENSION = ".tkwa"
+# Formats de stockage d'un tournoi proposés à la création
+STORAGE_BACKENDS = {
+    "json": "Fichier JSON + journal",
+    "sqlite": "Base SQLite indexée",
+    "sharded": "Un fichier par catégorie"
+}
+# Taille des poules (chacun contre chacun) proposées à la place d'un tableau
+POOL_MIN_SIZE = 3
+POOL_MAX_SIZE = 5
+# Champs d'inscription comparés lors d'une nouvelle importation de la liste des athlètes
+ROSTER_FIELDS = ("name", "club", "country", "category", "weight", "age", "seed")
+
+class Corner(str, Enum):
+    """Issue d'un match ou d'un round (coin vainqueur ou égalité)"""
+    BLUE = "blue"
+    RED = "red"
+    DRAW = "draw"
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional['Corner']:
+        """Convertit une valeur sérialisée ("blue", "red", "draw") en Corner"""
+        return None if value is None else cls(value)
+
+def _intern(value: Any) -> Any:
+    """Partage une seule copie des chaînes très répétées (catégories, clubs, pays)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+class TrackedModel:
+    """Base des modèles dont chaque modification incrémente un numéro de version"""
+    # Le numéro de version permet de réutiliser la forme sérialisée d'un objet
+    # tant qu'il n'a pas été modifié (voir Tournament.build_snapshot)
+    __slots__ = ("_version",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_version", self._version + 1)
+
+class Player(TrackedModel):
     """Classe représentant un joueur/combattant dans le tournoi"""
-    def __init__(self, id: str, name: str, club: str, country: str, category: str, weight: str = "", age: str = ""):
+    # Pas de __dict__ par instance : indispensable pour les archives de plusieurs
+    # dizaines de milliers d'athlètes chargées en mémoire
+    __slots__ = ("id", "name", "club", "country", "category", "weight", "age", "seed",
+                 "wins", "losses", "points_scored", "points_received", "eliminated")
+
+    def __init__(self, id: str, name: str, club: str, country: str, category: str, weight: str = "", age: str = "",
+                 seed: int = 0):
+        object.__setattr__(self, "_version", 0)
         self.id = id
         self.name = name
-        self.club = club
-        self.country = country
-        self.category = category
+        self.club = _intern(club)
+        self.country = _intern(country)
+        self.category = _intern(category)
         self.weight = weight
         self.age = age
+        self.seed = seed  # rang de tête de série (0 = non classé)
         self.wins = 0
         self.losses = 0
         self.points_scored = 0
@@ -32,6 +102,7 @@ class Player:
             "category": self.category,
             "weight": self.weight,
             "age": self.age,
+            "seed": self.seed,
             "wins": self.wins,
             "losses": self.losses,
             "points_scored": self.points_scored,
@@ -49,7 +120,8 @@ class Player:
             country=data["country"],
             category=data["category"],
             weight=data.get("weight", ""),
-            age=data.get("age", "")
+            age=data.get("age", ""),
+            seed=cls.parse_seed(data.get("seed"))
         )
         player.wins = data.get("wins", 0)
         player.losses = data.get("losses", 0)
@@ -58,47 +130,128 @@ class Player:
         player.eliminated = data.get("eliminated", False)
         return player
 
-class Match:
+    @staticmethod
+    def parse_seed(value: Any) -> int:
+        """Convertit un rang de tête de série importé (vide ou invalide = non classé)"""
+        try:
+            return max(int(float(value)), 0)
+        except (TypeError, ValueError):
+            return 0
+
+class Match(TrackedModel):
     """Classe représentant un match entre deux joueurs"""
+    __slots__ = ("match_id", "blue_player", "red_player", "round_number", "match_number",
+                 "category", "_winner", "blue_score", "red_score", "blue_gam_jeom",
+                 "red_gam_jeom", "completed", "_round_winners", "bracket_slot",
+                 "repechage", "next_match_id", "pool")
+
     def __init__(self, match_id: str, blue_player: Player, red_player: Player, 
                  round_number: int, match_number: int, category: str):
+        object.__setattr__(self, "_version", 0)
         self.match_id = match_id
         self.blue_player = blue_player
         self.red_player = red_player
         self.round_number = round_number
         self.match_number = match_number
-        self.category = category
-        self.winner = None  # Sera défini après le match ("blue" ou "red")
+        self.category = _intern(category)
+        self.winner = None  # Sera défini après le match (Corner.BLUE ou Corner.RED)
         self.blue_score = 0
         self.red_score = 0
         self.blue_gam_jeom = 0
         self.red_gam_jeom = 0
         self.completed = False
-        self.round_winners = []  # Liste des gagnants par round ("blue" ou "red")
+        self.round_winners = ()  # Issue de chaque round (Corner)
+        # Nœud du tableau à élimination directe (0 = finale, enfants 2i+1 et 2i+2)
+        self.bracket_slot: Optional[int] = None
+        # Match de repêchage : son vainqueur passe dans le coin bleu de next_match_id
+        # (le dernier match de la chaîne, sans suivant, attribue une médaille de bronze)
+        self.repechage = False
+        self.next_match_id: Optional[str] = None
+        self.pool = False  # Match de poule (chacun contre chacun)
+
+    @property
+    def winner(self) -> Optional[Corner]:
+        """Coin vainqueur du match (égal à "blue"/"red" en comparaison de chaînes)"""
+        return self._winner
+
+    @winner.setter
+    def winner(self, value: Optional[str]) -> None:
+        self._winner = Corner.parse(value)
+
+    @property
+    def is_ready(self) -> bool:
+        """Indique si les deux combattants du match sont connus"""
+        return self.blue_player is not None and self.red_player is not None
+
+    @property
+    def winner_player(self) -> Optional[Player]:
+        """Joueur vainqueur (None tant que le match n'est pas décidé)"""
+        if self.winner == Corner.BLUE:
+            return self.blue_player
+        if self.winner == Corner.RED:
+            return self.red_player
+        return None
+
+    @property
+    def loser_player(self) -> Optional[Player]:
+        """Joueur battu (None tant que le match n'est pas décidé)"""
+        if self.winner == Corner.BLUE:
+            return self.red_player
+        if self.winner == Corner.RED:
+            return self.blue_player
+        return None
+
+    @property
+    def round_winners(self) -> Tuple[Corner, ...]:
+        """Issue de chaque round joué"""
+        return self._round_winners
+
+    @round_winners.setter
+    def round_winners(self, values) -> None:
+        self._round_winners = tuple(Corner(value) for value in values)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convertit le match en dictionnaire pour la sérialisation"""
         return {
             "match_id": self.match_id,
-            "blue_player": self.blue_player.to_dict() if self.blue_player else None,
-            "red_player": self.red_player.to_dict() if self.red_player else None,
+            "blue_player_id": self.blue_player.id if self.blue_player else None,
+            "red_player_id": self.red_player.id if self.red_player else None,
             "round_number": self.round_number,
             "match_number": self.match_number,
             "category": self.category,
-            "winner": self.winner,
+            "winner": self.winner.value if self.winner else None,
             "blue_score": self.blue_score,
             "red_score": self.red_score,
             "blue_gam_jeom": self.blue_gam_jeom,
             "red_gam_jeom": self.red_gam_jeom,
             "completed": self.completed,
-            "round_winners": self.round_winners
+            "round_winners": [outcome.value for outcome in self.round_winners],
+            "bracket_slot": self.bracket_slot,
+            "repechage": self.repechage,
+            "next_match_id": self.next_match_id,
+            "pool": self.pool
         }
 
+    @staticmethod
+    def _resolve_player(data: Dict[str, Any], corner: str,
+                        players: Optional[Dict[str, Player]]) -> Optional[Player]:
+        """Retrouve le joueur d'un coin (référence par identifiant ou ancienne copie intégrée)"""
+        players = players or {}
+        player_id = data.get(f"{corner}_player_id")
+        if player_id is not None:
+            return players.get(player_id)
+        
+        # Ancien format : copie complète du joueur dans le match
+        embedded = data.get(f"{corner}_player")
+        if not embedded:
+            return None
+        return players.get(embedded["id"]) or Player.from_dict(embedded)
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Match':
-        """Crée un match à partir d'un dictionnaire"""
-        blue_player = Player.from_dict(data["blue_player"]) if data.get("blue_player") else None
-        red_player = Player.from_dict(data["red_player"]) if data.get("red_player") else None
+    def from_dict(cls, data: Dict[str, Any], players: Optional[Dict[str, Player]] = None) -> 'Match':
+        """Crée un match à partir d'un dictionnaire en le reliant aux joueurs du tournoi"""
+        blue_player = cls._resolve_player(data, "blue", players)
+        red_player = cls._resolve_player(data, "red", players)
         
         match = cls(
             match_id=data["match_id"],
@@ -115,8 +268,70 @@ class Match:
         match.red_gam_jeom = data.get("red_gam_jeom", 0)
         match.completed = data.get("completed", False)
         match.round_winners = data.get("round_winners", [])
+        match.bracket_slot = data.get("bracket_slot")
+        match.repechage = data.get("repechage", False)
+        match.next_match_id = data.get("next_match_id")
+        match.pool = data.get("pool", False)
         return match
 
+class PoolStanding:
+    """Bilan d'un athlète dans sa poule"""
+    __slots__ = ("player", "played", "wins", "losses", "points_for", "points_against", "gam_jeom")
+
+    def __init__(self, player: Player):
+        self.player = player
+        self.played = 0
+        self.wins = 0
+        self.losses = 0
+        self.points_for = 0
+        self.points_against = 0
+        self.gam_jeom = 0  # Pénalités reçues
+
+    @property
+    def point_difference(self) -> int:
+        """Différence entre points marqués et encaissés"""
+        return self.points_for - self.points_against
+
+    @property
+    def rank_key(self) -> Tuple[int, int, int]:
+        """Clé de classement : victoires, différence de points, puis le moins de gam-jeom"""
+        return (-self.wins, -self.point_difference, self.gam_jeom)
+
+class RosterDiff:
+    """Écarts entre une liste d'inscrits importée et les joueurs du tournoi"""
+    __slots__ = ("added", "changed", "moved", "withdrawn", "unchanged", "locked")
+
+    def __init__(self):
+        self.added: List[Player] = []
+        # (joueur, anciennes valeurs, nouvelles valeurs) : figé au calcul, valable après application
+        self.changed: List[Tuple[Player, Dict[str, Any], Dict[str, Any]]] = []
+        self.moved: List[Tuple[Player, Dict[str, Any], Dict[str, Any]]] = []  # changements de catégorie
+        self.withdrawn: List[Player] = []  # inscrits absents de la nouvelle liste
+        self.unchanged = 0
+        self.locked: List[str] = []  # changements impossibles : catégorie déjà tirée
+
+    @property
+    def has_changes(self) -> bool:
+        """Indique si l'importation modifie le tournoi"""
+        return bool(self.added or self.changed or self.withdrawn)
+
+    def summary(self) -> str:
+        """Résumé en une ligne"""
+        return (f"{len(self.added)} ajout(s), {len(self.changed)} modification(s) "
+                f"dont {len(self.moved)} changement(s) de catégorie, "
+                f"{len(self.withdrawn)} retrait(s), {self.unchanged} inchangé(s)")
+
+    def details(self) -> List[str]:
+        """Une ligne par athlète ajouté, modifié, retiré ou bloqué"""
+        lines = [f"+ {player.name} ({player.id}) : {player.category}" for player in self.added]
+        for player, previous, values in self.changed:
+            fields = ", ".join(f"{field} {previous[field]!r} → {values[field]!r}"
+                               for field in ROSTER_FIELDS if values[field] != previous[field])
+            lines.append(f"~ {player.name} ({player.id}) : {fields}")
+        lines.extend(f"- {player.name} ({player.id}) : {player.category}" for player in self.withdrawn)
+        lines.extend(f"! {message}" for message in self.locked)
+        return lines
+
 class Tournament:
     """Classe représentant un tournoi complet"""
     def __init__(self, name: str, date: str, location: str):
@@ -127,8 +342,254 @@ class Tournament:
         self.matches: Dict[str, Match] = {}  # match_id -> Match
         self.categories: Dict[str, List[str]] = {}  # category -> list of player_ids
         self.rounds: Dict[int, List[str]] = {}  # round_number -> list of match_ids
+        # Tableaux à élimination directe : catégorie -> match_id de chaque nœud (None pour un exempt)
+        # Reconstruit à la demande depuis bracket_slot des matchs
+        self._brackets: Optional[Dict[str, List[Optional[str]]]] = None
+        # Matchs restants par catégorie et par tour : chaque catégorie progresse seule
+        self._round_progress: Optional[Dict[str, Dict[int, int]]] = None
+        # Classements des poules : catégorie -> joueur -> bilan (reconstruit à la demande)
+        self._pool_standings: Optional[Dict[str, Dict[str, PoolStanding]]] = None
+        # Index des noms normalisés (doublons, joueurs uniques par catégorie), construit à la demande
+        self._roster_index: Optional[RosterIndex] = None
+        # Graine aléatoire de chaque tirage (catégorie -> graine), conservée pour contrôle
+        self.draw_seeds: Dict[str, int] = {}
+        # Catégories dont les battus des finalistes disputent des repêchages pour le bronze
+        self.repechage_categories = set()
+        # Catégories de l'ancien mode par tours dont la finale est comptée (bilans définitifs)
+        self.finished_categories = set()
+        # Occupation des tapis, conservée au redémarrage :
+        # tapis -> (match_id, début) et fin du dernier combat de chaque athlète
+        self.mat_current: Dict[int, Tuple[str, float]] = {}
+        self.last_bout_end: Dict[str, float] = {}
+        # Ordre de passage des catégories (catégorie -> ordre)
+        self.category_order: Dict[str, int] = {}
         self.current_round = 1
         self.tournament_id = f"{name.replace(' ', '_')}_{date.replace('/', '_')}"
+        # Journal d'événements (write-ahead) : None tant qu'aucun fichier n'est associé
+        self.journal_path: Optional[str] = None
+        self.journal_seq = 0  # Numéro du dernier événement émis
+        self.journal_pending = 0  # Événements écrits depuis le dernier instantané
+        self._journal_buffer: Optional[List[Dict[str, Any]]] = None
+        self._journal_listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+        # Protège le fichier journal entre le thread Tk et la sauvegarde automatique
+        self._journal_lock = threading.Lock()
+        # Formes sérialisées réutilisées tant que l'objet n'a pas changé :
+        # clé -> (objet, version, '"clé": {...}')
+        self._player_fragments: Dict[str, Tuple[Player, int, str]] = {}
+        self._match_fragments: Dict[str, Tuple['Match', int, str]] = {}
+        # Catégories modifiées depuis la dernière écriture de leur fichier (stockage fragmenté)
+        self.dirty_categories = set()
+        # Fragments présents sur disque mais non chargés (catégorie -> fichier)
+        self.unloaded_shards: Dict[str, str] = {}
+        self._replaying = False
+
+    @staticmethod
+    def journal_path_for(file_path: str) -> str:
+        """Retourne le chemin du journal associé à un fichier d'instantané"""
+        return os.path.splitext(file_path)[0] + JOURNAL_EXTENSION
+
+    def attach_journal(self, file_path: Optional[str]) -> None:
+        """Associe le journal d'événements à l'instantané donné (None pour le désactiver)"""
+        self.journal_path = self.journal_path_for(file_path) if file_path else None
+
+    def add_journal_listener(self, listener: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """Abonne un stockage externe aux événements du tournoi (reçus par lots)"""
+        self._journal_listeners.append(listener)
+
+    def remove_journal_listener(self, listener: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """Désabonne un stockage externe des événements du tournoi"""
+        if listener in self._journal_listeners:
+            self._journal_listeners.remove(listener)
+
+    @property
+    def is_journaling(self) -> bool:
+        """Indique si les événements du tournoi sont enregistrés quelque part"""
+        return bool(self.journal_path or self._journal_listeners)
+
+    def _journal(self, event: str, data: Dict[str, Any]) -> None:
+        """Émet un événement vers le journal et les abonnés (sans effet pendant une relecture)"""
+        if not self.is_journaling or self._replaying:
+            return
+        
+        self.journal_seq += 1
+        record = {"seq": self.journal_seq, "event": event, "data": data}
+        if self._journal_buffer is not None:
+            self._journal_buffer.append(record)
+        else:
+            self._flush_journal([record])
+
+    def _flush_journal(self, records: List[Dict[str, Any]]) -> None:
+        """Écrit des enregistrements à la fin du journal puis les transmet aux abonnés"""
+        if self.journal_path:
+            try:
+                with self._journal_lock, open(self.journal_path, 'a', encoding='utf-8') as file:
+                    for record in records:
+                        file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+                    self.journal_pending += len(records)
+            except OSError as e:
+                print(f"Erreur lors de l'écriture du journal: {e}")
+        
+        for listener in self._journal_listeners:
+            listener(records)
+
+    @contextmanager
+    def journal_batch(self):
+        """Regroupe les événements d'une opération en une seule écriture du journal"""
+        if self._journal_buffer is not None:
+            yield
+            return
+        
+        self._journal_buffer = []
+        try:
+            yield
+        finally:
+            records, self._journal_buffer = self._journal_buffer, None
+            if records:
+                self._flush_journal(records)
+
+    def replay_journal(self) -> int:
+        """Rejoue les événements du journal postérieurs au dernier instantané"""
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return 0
+        
+        applied = 0
+        self._replaying = True
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Dernier enregistrement tronqué par un arrêt brutal
+                        print("Enregistrement du journal incomplet ignoré")
+                        break
+                    
+                    if record["seq"] <= self.journal_seq:
+                        continue
+                    self._apply_journal_record(record["event"], record["data"])
+                    self.journal_seq = record["seq"]
+                    applied += 1
+        finally:
+            self._replaying = False
+        
+        self.journal_pending = applied
+        return applied
+
+    def _apply_journal_record(self, event: str, data: Dict[str, Any]) -> None:
+        """Applique un événement du journal à l'état du tournoi"""
+        if event == "add_player":
+            self.add_player(Player.from_dict(data))
+        elif event == "update_player":
+            self._update_player(self.players[data["id"]], self._roster_values(data))
+        elif event == "remove_player":
+            self.remove_player(data["id"])
+        elif event == "round":
+            # Restaurer les statistiques des joueurs telles qu'après le tirage
+            for pid, player_data in data["players"].items():
+                if pid in self.players:
+                    self._merge_player(self.players[pid], player_data)
+            
+            for match_data in data["matches"]:
+                self._register_match(Match.from_dict(match_data, self.players))
+            if "draw_seed" in data:
+                self.draw_seeds[data["category"]] = data["draw_seed"]
+            if data.get("repechage"):
+                self.repechage_categories.add(data["category"])
+            if data.get("finished"):
+                self.finished_categories.add(data["category"])
+        elif event == "result":
+            self.update_match_result(**data)
+        elif event == "current_round":
+            self.current_round = data["current_round"]
+        elif event == "mat_start":
+            self.start_on_mat(data["mat"], data["match_id"], data["start"])
+        elif event == "mat_release":
+            self.release_mat(data["mat"])
+        elif event == "mat_end":
+            self.end_bout(data["match_id"], data["end"])
+        elif event == "category_order":
+            self.set_category_order(data["category_order"])
+        else:
+            print(f"Événement de journal inconnu ignoré: {event}")
+
+    @staticmethod
+    def _merge_player(player: Player, data: Dict[str, Any]) -> None:
+        """Met à jour les statistiques d'un joueur existant depuis un dictionnaire"""
+        player.wins = data.get("wins", player.wins)
+        player.losses = data.get("losses", player.losses)
+        player.points_scored = data.get("points_scored", player.points_scored)
+        player.points_received = data.get("points_received", player.points_received)
+        player.eliminated = data.get("eliminated", player.eliminated)
+
+    def _journal_round(self, category: str, round_number: int, matches: List['Match'],
+                       draw_seed: Optional[int] = None, repechage: bool = False,
+                       finished: bool = False) -> None:
+        """Journalise un tour généré avec l'état des joueurs de la catégorie"""
+        if not self.is_journaling:
+            return
+        
+        data = {
+            "category": category,
+            "round_number": round_number,
+            "matches": [match.to_dict() for match in matches],
+            "players": {pid: self.players[pid].to_dict()
+                        for pid in self.categories.get(category, []) if pid in self.players}
+        }
+        if draw_seed is not None:
+            data["draw_seed"] = draw_seed
+        if repechage:
+            data["repechage"] = True
+        if finished:
+            data["finished"] = True
+        self._journal("round", data)
+
+    def mat_of(self, match_id: str) -> Optional[int]:
+        """Tapis sur lequel un match est en cours (None s'il n'est pas lancé)"""
+        for mat, (current_id, _) in self.mat_current.items():
+            if current_id == match_id:
+                return mat
+        return None
+
+    def start_on_mat(self, mat: int, match_id: str, start: float) -> bool:
+        """Lance un match sur un tapis (refusé s'il est déjà en cours sur un autre tapis)"""
+        other = self.mat_of(match_id)
+        if other is not None and other != mat:
+            return False
+        self.mat_current[mat] = (match_id, start)
+        self._journal("mat_start", {"mat": mat, "match_id": match_id, "start": start})
+        return True
+
+    def release_mat(self, mat: int) -> Optional[str]:
+        """Libère un tapis dont le match n'a pas été disputé (il retourne dans la file)"""
+        current = self.mat_current.pop(mat, None)
+        if current is None:
+            return None
+        self._journal("mat_release", {"mat": mat})
+        return current[0]
+
+    def end_bout(self, match_id: str, end: float) -> None:
+        """Libère le tapis d'un match terminé et démarre le repos de ses athlètes"""
+        mat = self.mat_of(match_id)
+        if mat is not None:
+            del self.mat_current[mat]
+        match = self.matches.get(match_id)
+        if match:
+            for player in (match.blue_player, match.red_player):
+                if player:
+                    self.last_bout_end[player.id] = end
+        self._journal("mat_end", {"match_id": match_id, "end": end})
+
+    def set_category_order(self, category_order: Dict[str, int]) -> None:
+        """Définit l'ordre de passage des catégories"""
+        self.category_order = dict(category_order)
+        self._journal("category_order", {"category_order": self.category_order})
+
+    def advance_round(self) -> None:
+        """Passe au tour suivant du tournoi"""
+        self.current_round += 1
+        self._journal("current_round", {"current_round": self.current_round})
 
     def add_player(self, player: Player) -> None:
         """Ajoute un joueur au tournoi"""
@@ -138,12 +599,143 @@ class Tournament:
         if player.category not in self.categories:
             self.categories[player.category] = []
         self.categories[player.category].append(player.id)
+        if self._roster_index is not None:
+            self._roster_index.add(player)
+        self.dirty_categories.add(player.category)
+        self._journal("add_player", player.to_dict())
+
+    @property
+    def roster_index(self) -> RosterIndex:
+        """Index des joueurs par nom normalisé (construit au premier accès, puis tenu à jour)"""
+        if self._roster_index is None:
+            self._roster_index = RosterIndex()
+            for player in self.players.values():
+                self._roster_index.add(player)
+        return self._roster_index
+
+    @staticmethod
+    def _roster_values(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Champs d'inscription d'une ligne importée, sous la forme stockée dans Player"""
+        # Texte sans espaces superflus, poids décimal comme à la validation de l'importation
+        values = {field: str(data.get(field, "") or "").strip() for field in ROSTER_FIELDS}
+        try:
+            values["weight"] = float(values["weight"])
+        except ValueError:
+            pass
+        values["seed"] = Player.parse_seed(data.get("seed"))
+        return values
+
+    def diff_roster(self, rows: List[Dict[str, Any]]) -> RosterDiff:
+        """Compare une liste d'inscrits importée aux joueurs du tournoi (un seul parcours)"""
+        # Un athlète déjà tiré ne peut plus changer de catégorie ni être retiré,
+        # et une catégorie tirée ne reçoit plus de nouvel athlète
+        drawn_players = set()
+        drawn_categories = set()
+        for match in self.matches.values():
+            drawn_categories.add(match.category)
+            for player in (match.blue_player, match.red_player):
+                if player:
+                    drawn_players.add(player.id)
+        
+        diff = RosterDiff()
+        seen = set()
+        for row in rows:
+            pid = str(row.get("id", "")).strip()
+            if not pid or pid in seen:
+                continue
+            seen.add(pid)
+            values = self._roster_values(row)
+            player = self.players.get(pid)
+            previous = self._roster_values(player.to_dict()) if player else None
+            
+            if player is None:
+                if values["category"] in drawn_categories:
+                    diff.locked.append(f"{values['name']} ({pid}) : catégorie {values['category']} déjà tirée")
+                else:
+                    diff.added.append(Player(id=pid, **values))
+            elif values == previous:
+                diff.unchanged += 1
+            elif values["category"] != player.category and (
+                    pid in drawn_players or values["category"] in drawn_categories):
+                diff.locked.append(f"{player.name} ({pid}) : passage de {player.category} "
+                                   f"à {values['category']} impossible après le tirage")
+            else:
+                diff.changed.append((player, previous, values))
+                if values["category"] != player.category:
+                    diff.moved.append((player, previous, values))
+        
+        for pid, player in self.players.items():
+            if pid in seen:
+                continue
+            if pid in drawn_players:
+                diff.locked.append(f"{player.name} ({pid}) : absent de la liste mais déjà tiré")
+            else:
+                diff.withdrawn.append(player)
+        return diff
+
+    def apply_roster_diff(self, diff: RosterDiff, withdraw: bool = True) -> None:
+        """Applique les ajouts, modifications et (si demandé) retraits d'une nouvelle importation"""
+        with self.journal_batch():
+            # Sortir d'abord les athlètes qui changent de catégorie ou se retirent :
+            # chaque liste de catégorie n'est reconstruite qu'une fois
+            moved = [player.id for player, previous, values in diff.moved]
+            withdrawn = [player.id for player in diff.withdrawn] if withdraw else []
+            self._detach_players(moved + withdrawn)
+            
+            for player, previous, values in diff.changed:
+                self._update_player(player, values, attached=player.id not in moved)
+                self._journal("update_player", player.to_dict())
+            for pid in withdrawn:
+                self._forget_player(pid)
+                self._journal("remove_player", {"id": pid})
+            for player in diff.added:
+                self.add_player(player)
+
+    def _detach_players(self, player_ids: List[str]) -> None:
+        """Retire des joueurs des listes de leurs catégories (les catégories vidées disparaissent)"""
+        by_category: Dict[str, set] = {}
+        for pid in player_ids:
+            by_category.setdefault(self.players[pid].category, set()).add(pid)
+        for category, pids in by_category.items():
+            remaining = [pid for pid in self.categories.get(category, []) if pid not in pids]
+            if remaining:
+                self.categories[category] = remaining
+            else:
+                self.categories.pop(category, None)
+            self.dirty_categories.add(category)
+
+    def _update_player(self, player: Player, values: Dict[str, Any], attached: bool = True) -> None:
+        """Met à jour les champs d'inscription d'un joueur et sa catégorie"""
+        if attached and values["category"] != player.category:
+            self._detach_players([player.id])
+            attached = False
+        for field in ROSTER_FIELDS:
+            if values[field] != getattr(player, field):
+                setattr(player, field, _intern(values[field]) if field in ("club", "country", "category")
+                        else values[field])
+        if not attached:
+            self.categories.setdefault(player.category, []).append(player.id)
+        if self._roster_index is not None:
+            self._roster_index.add(player)
+        self.dirty_categories.add(player.category)
+
+    def _forget_player(self, player_id: str) -> None:
+        """Supprime un joueur déjà retiré de sa catégorie"""
+        del self.players[player_id]
+        if self._roster_index is not None:
+            self._roster_index.remove(player_id)
+
+    def remove_player(self, player_id: str) -> None:
+        """Retire du tournoi un joueur qui n'a disputé aucun match"""
+        self._detach_players([player_id])
+        self._forget_player(player_id)
+        self._journal("remove_player", {"id": player_id})
 
     def import_players_from_csv(self, file_path: str) -> int:
         """Importe les joueurs depuis un fichier CSV"""
         count = 0
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with open(file_path, 'r', encoding='utf-8') as file, self.journal_batch():
                 reader = csv.DictReader(file)
                 for row in reader:
                     # Vérifier les champs obligatoires
@@ -158,7 +750,8 @@ class Tournament:
                         country=row['country'],
                         category=row['category'],
                         weight=row.get('weight', ''),
-                        age=row.get('age', '')
+                        age=row.get('age', ''),
+                        seed=Player.parse_seed(row.get('seed'))
                     )
                     self.add_player(player)
                     count += 1
@@ -167,86 +760,397 @@ class Tournament:
             print(f"Erreur lors de l'importation des joueurs: {e}")
             return 0
 
-    def generate_first_round(self, category: str) -> List[Match]:
-        """Génère les matchs du premier tour pour une catégorie donnée"""
+    def generate_first_round(self, category: str, draw_seed: Optional[int] = None,
+                             repechage: bool = False) -> List[Match]:
+        """Génère le tableau d'une catégorie (tirage rejouable à partir de draw_seed)
+
+        Avec repechage, les athlètes battus par chaque finaliste disputent ensuite
+        des repêchages pour les deux médailles de bronze.
+        """
         if category not in self.categories or not self.categories[category]:
             return []
         
-        # Récupérer les joueurs de cette catégorie
-        player_ids = self.categories[category]
-        players = [self.players[pid] for pid in player_ids if not self.players[pid].eliminated]
-        
-        # Supprimer les doublons (même joueur avec des IDs différents)
-        unique_players = []
-        seen_names = set()
-        seen_ids = set()
-        
-        for player in players:
-            # Vérifier à la fois le nom ET l'ID pour éviter les doublons
-            if player.name not in seen_names and player.id not in seen_ids:
-                unique_players.append(player)
-                seen_names.add(player.name)
-                seen_ids.add(player.id)
-            else:
-                print(f"Joueur dupliqué ignoré: {player.name} (ID: {player.id})")
-        
-        players = unique_players
+        players = self.eligible_players(category)
         
         # Vérifier qu'il y a au moins 2 joueurs différents
         if len(players) < 2:
             print(f"Pas assez de joueurs uniques dans la catégorie {category} pour créer des matchs (seulement {len(players)} joueur(s))")
             return []
         
-        # Mélanger les joueurs pour des matchs aléatoires
-        random.shuffle(players)
-        
-        # Si nombre impair, ajouter un bye
-        if len(players) % 2 != 0:
-            bye_player = players.pop()
-            bye_player.wins += 1
-            print(f"Joueur {bye_player.name} passe automatiquement au tour suivant (bye)")
-        
+        # Tirage : têtes de série aux emplacements standard, exempts face aux premières
+        # têtes de série, clubs et pays répartis dans des moitiés et quarts différents
+        if draw_seed is None:
+            draw_seed = new_draw_seed()
+        leaves = seeded_draw(players, random.Random(draw_seed))
+        size = len(leaves)
+        total_rounds = size.bit_length() - 1
+        self.draw_seeds[category] = draw_seed
+        print(f"Tirage {category}: graine {draw_seed}")
+        
+        bracket: List[Optional[str]] = [None] * (size - 1)
+        advanced: Dict[int, Player] = {}  # nœud -> joueur déjà qualifié (exempt)
         matches = []
-        match_number = 1
         
-        # Créer les matchs
-        for i in range(0, len(players), 2):
-            if i + 1 < len(players):
-                blue_player = players[i]
-                red_player = players[i + 1]
-                
-                # Double vérification que les deux joueurs sont différents
-                if (blue_player.id == red_player.id or 
-                    blue_player.name == red_player.name or
-                    blue_player.name.lower().strip() == red_player.name.lower().strip()):
-                    print(f"ERREUR: Tentative de match entre le même joueur ({blue_player.name} vs {red_player.name})")
-                    continue
+        # Créer les matchs tour par tour, du premier tour à la finale
+        for round_number in range(1, total_rounds + 1):
+            depth = total_rounds - round_number
+            first_slot = (1 << depth) - 1
+            match_number = 1
+            for slot in range(first_slot, 2 * first_slot + 1):
+                if round_number == 1:
+                    blue_player = leaves[2 * slot + 1 - (size - 1)]
+                    red_player = leaves[2 * slot + 2 - (size - 1)]
+                    if blue_player is None or red_player is None:
+                        bye_player = blue_player or red_player
+                        bye_player.wins += 1
+                        advanced[slot] = bye_player
+                        print(f"Joueur {bye_player.name} passe automatiquement au tour suivant (bye)")
+                        continue
+                else:
+                    blue_player = advanced.get(2 * slot + 1)
+                    red_player = advanced.get(2 * slot + 2)
                 
-                match_id = f"{category}_R1_M{match_number}"
+                match_id = f"{category}_R{round_number}_M{match_number}"
                 match = Match(
                     match_id=match_id,
                     blue_player=blue_player,
                     red_player=red_player,
-                    round_number=1,
+                    round_number=round_number,
                     match_number=match_number,
                     category=category
                 )
+                match.bracket_slot = slot
+                bracket[slot] = match_id
                 
-                self.matches[match_id] = match
+                self._register_match(match)
                 matches.append(match)
                 match_number += 1
-                print(f"Match créé: {blue_player.name} vs {red_player.name}")
+                if match.is_ready:
+                    print(f"Match créé: {blue_player.name} vs {red_player.name}")
+        
+        self.brackets[category] = bracket
+        if repechage:
+            self.repechage_categories.add(category)
+        else:
+            self.repechage_categories.discard(category)
+        self.finished_categories.discard(category)
+        self.dirty_categories.add(category)
+        self._journal_round(category, 1, matches, draw_seed, repechage)
+        return matches
+
+    def eligible_players(self, category: str) -> List[Player]:
+        """Joueurs non éliminés d'une catégorie, un seul par identifiant"""
+        # Récupérer les joueurs de cette catégorie
+        player_ids = self.categories.get(category, [])
+        players = [self.players[pid] for pid in player_ids if not self.players[pid].eliminated]
+        
+        # Seul un identifiant répété est retiré : deux noms proches peuvent être deux
+        # athlètes, l'opérateur tranche à partir de la liste des doublons probables
+        unique_players = []
+        seen_ids = set()
+        roster_index = self.roster_index
+        
+        for player in players:
+            if player.id in seen_ids:
+                print(f"Joueur dupliqué ignoré: {player.name} (ID: {player.id})")
+                continue
+            unique_players.append(player)
+            seen_ids.add(player.id)
+            if roster_index.is_duplicate(player.id):
+                print(f"Doublon probable à vérifier: {player.name} (ID: {player.id})")
+        
+        return unique_players
+
+    def generate_pool(self, category: str, draw_seed: Optional[int] = None) -> List[Match]:
+        """Génère une poule (chacun contre chacun) pour une catégorie de 3 à 5 athlètes
+
+        Tous les combats sont au tour 1 de la catégorie, numérotés dans l'ordre calculé
+        (qui évite autant que possible qu'un athlète enchaîne deux combats) : la file
+        des matchs les appelle dans cet ordre sans décaler les tours des autres catégories.
+        """
+        players = self.eligible_players(category)
+        if not POOL_MIN_SIZE <= len(players) <= POOL_MAX_SIZE:
+            print(f"Poule impossible pour {category}: {len(players)} joueur(s) "
+                  f"(de {POOL_MIN_SIZE} à {POOL_MAX_SIZE} requis)")
+            return []
         
-        # Enregistrer les matchs pour ce tour
-        if 1 not in self.rounds:
-            self.rounds[1] = []
+        # Tirage des numéros de poule
+        if draw_seed is None:
+            draw_seed = new_draw_seed()
+        random.Random(draw_seed).shuffle(players)
+        self.draw_seeds[category] = draw_seed
+        print(f"Tirage {category} (poule): graine {draw_seed}")
         
-        self.rounds[1].extend([match.match_id for match in matches])
+        matches = []
+        for number, (blue, red) in enumerate(pool_order(len(players)), start=1):
+            match = Match(
+                match_id=f"{category}_P_M{number}",
+                blue_player=players[blue],
+                red_player=players[red],
+                round_number=1,
+                match_number=number,
+                category=category
+            )
+            match.pool = True
+            self._register_match(match)
+            matches.append(match)
+            print(f"Match créé: {players[blue].name} vs {players[red].name}")
+        
+        self.repechage_categories.discard(category)
+        self.finished_categories.discard(category)
+        self.dirty_categories.add(category)
+        self._journal_round(category, 1, matches, draw_seed)
+        return matches
+
+    @property
+    def pool_standings(self) -> Dict[str, Dict[str, PoolStanding]]:
+        """Bilans des athlètes par poule (reconstruits à la demande, puis tenus à jour)"""
+        if self._pool_standings is None:
+            self._pool_standings = {}
+            for match in self.matches.values():
+                self._add_pool_match(match)
+                if match.completed:
+                    self._record_pool_result(match, 1)
+        return self._pool_standings
+
+    def _add_pool_match(self, match: Match) -> None:
+        """Inscrit les deux athlètes d'un match de poule au classement"""
+        if not match.pool or self._pool_standings is None:
+            return
+        standings = self._pool_standings.setdefault(match.category, {})
+        for player in (match.blue_player, match.red_player):
+            if player.id not in standings:
+                standings[player.id] = PoolStanding(player)
+
+    def _record_pool_result(self, match: Match, sign: int) -> None:
+        """Ajoute (sign = 1) ou retire (sign = -1) le résultat d'un match de poule"""
+        if not match.pool or self._pool_standings is None:
+            return
+        standings = self._pool_standings[match.category]
+        blue, red = standings[match.blue_player.id], standings[match.red_player.id]
+        for standing, scored, received, gam_jeom in (
+                (blue, match.blue_score, match.red_score, match.blue_gam_jeom),
+                (red, match.red_score, match.blue_score, match.red_gam_jeom)):
+            standing.played += sign
+            standing.points_for += sign * scored
+            standing.points_against += sign * received
+            standing.gam_jeom += sign * gam_jeom
+        if match.winner == Corner.BLUE:
+            blue.wins += sign
+            red.losses += sign
+        elif match.winner == Corner.RED:
+            red.wins += sign
+            blue.losses += sign
+
+    def pool_ranking(self, category: str) -> List[PoolStanding]:
+        """Classement d'une poule (vide si la catégorie n'est pas en poule)"""
+        standings = self.pool_standings.get(category, {})
+        return sorted(standings.values(), key=lambda standing: (standing.rank_key, standing.player.name))
+
+    def _register_match(self, match: Match) -> None:
+        """Ajoute un nouveau match au tournoi et aux structures qui en dépendent"""
+        self.matches[match.match_id] = match
+        self.rounds.setdefault(match.round_number, []).append(match.match_id)
+        self._place_in_bracket(match)
+        self._add_pool_match(match)
+        if self._round_progress is not None:
+            self._count_match(self._round_progress, match)
+
+    @property
+    def round_progress(self) -> Dict[str, Dict[int, int]]:
+        """Nombre de matchs restants par catégorie et par tour (reconstruit à la demande)"""
+        if self._round_progress is None:
+            self._round_progress = {}
+            for match in self.matches.values():
+                self._count_match(self._round_progress, match)
+        return self._round_progress
+
+    @staticmethod
+    def _count_match(progress: Dict[str, Dict[int, int]], match: Match) -> None:
+        rounds = progress.setdefault(match.category, {})
+        rounds[match.round_number] = rounds.get(match.round_number, 0) + (0 if match.completed else 1)
+
+    def category_round(self, category: str) -> int:
+        """Tour en cours d'une catégorie : le premier tour non terminé, sinon le dernier tour"""
+        rounds = self.round_progress.get(category)
+        if not rounds:
+            return 1
+        unfinished = [round_number for round_number, remaining in rounds.items() if remaining]
+        return min(unfinished) if unfinished else max(rounds)
+
+    def is_category_finished(self, category: str) -> bool:
+        """Indique si tous les matchs d'une catégorie tirée sont terminés"""
+        rounds = self.round_progress.get(category)
+        return bool(rounds) and not any(rounds.values())
+
+    @property
+    def brackets(self) -> Dict[str, List[Optional[str]]]:
+        """Tableaux à élimination directe par catégorie (tas : nœud 0 = finale)"""
+        if self._brackets is None:
+            self._brackets = {}
+            for match in self.matches.values():
+                self._place_in_bracket(match)
+        return self._brackets
+
+    def _place_in_bracket(self, match: Match) -> None:
+        """Enregistre un match dans le tableau de sa catégorie"""
+        if match.bracket_slot is None or self._brackets is None:
+            # Tableau reconstruit depuis tous les matchs au premier accès
+            return
+        depth = (match.bracket_slot + 1).bit_length() - 1
+        size = 1 << (match.round_number + depth)
+        bracket = self._brackets.setdefault(match.category, [None] * (size - 1))
+        bracket[match.bracket_slot] = match.match_id
+
+    def bracket_parent(self, match: Match) -> Optional[Match]:
+        """Match où se qualifie le vainqueur : nœud parent du tableau ou repêchage suivant"""
+        if match.next_match_id:
+            return self.matches.get(match.next_match_id)
+        if not match.bracket_slot:
+            return None
+        parent_id = self.brackets[match.category][(match.bracket_slot - 1) // 2]
+        return self.matches.get(parent_id) if parent_id else None
+
+    def _advance_winner(self, match: Match) -> None:
+        """Compte victoire et défaite, puis qualifie le vainqueur dans le match parent du tableau"""
+        if (match.bracket_slot is None and not match.repechage and not match.pool) or match.winner_player is None:
+            return
+        winner, loser = match.winner_player, match.loser_player
+        winner.wins += 1
+        loser.losses += 1
+        if match.pool:
+            # Personne n'est éliminé en poule
+            return
+        loser.eliminated = True
+        
+        parent = self.bracket_parent(match)
+        if match.repechage:
+            # Le battu attend déjà dans le coin rouge du repêchage suivant
+            if parent:
+                parent.blue_player = winner
+        elif parent:
+            # Enfant gauche (indice impair) -> coin bleu, enfant droit -> coin rouge
+            if match.bracket_slot % 2:
+                parent.blue_player = winner
+            else:
+                parent.red_player = winner
+
+    def _withdraw_result(self, match: Match) -> None:
+        """Annule les effets d'un résultat avant sa correction (points, bilan, qualification)"""
+        for player, scored, received in ((match.blue_player, match.blue_score, match.red_score),
+                                         (match.red_player, match.red_score, match.blue_score)):
+            if player:
+                player.points_scored -= scored
+                player.points_received -= received
+        if (match.bracket_slot is None and not match.repechage and not match.pool) or match.winner_player is None:
+            return
+        winner, loser = match.winner_player, match.loser_player
+        winner.wins -= 1
+        loser.losses -= 1
+        if match.pool:
+            return
+        loser.eliminated = False
+        
+        # Libérer la place du vainqueur dans le match parent (voir _advance_winner)
+        parent = self.bracket_parent(match)
+        if parent:
+            if match.repechage or match.bracket_slot % 2:
+                parent.blue_player = None
+            else:
+                parent.red_player = None
+
+    def correction_blocked(self, match_id: str, winner: str) -> Optional[str]:
+        """Raison pour laquelle un résultat ne peut plus être corrigé (None si la correction est possible)"""
+        match = self.matches.get(match_id)
+        if match is None or not match.completed or Corner.parse(winner) == match.winner or match.pool:
+            # Premier résultat, mêmes vainqueurs (points seuls) ou poule : rien ne dépend du vainqueur
+            return None
+        if match.bracket_slot is None and not match.repechage:
+            # Ancien mode par tours : le vainqueur est qualifié à la création du tour suivant
+            if match.category in self.finished_categories:
+                return "la finale de la catégorie est déjà comptée"
+            if any(other.category == match.category and other.round_number > match.round_number
+                   for other in self.matches.values()):
+                return "le tour suivant de la catégorie est déjà créé"
+            return None
+        if match.bracket_slot in (1, 2) and match.category in self.repechage_categories:
+            return "les repêchages ont été tirés d'après ce vainqueur"
+        parent = self.bracket_parent(match)
+        if parent and (parent.completed or self.mat_of(parent.match_id) is not None):
+            return f"le match suivant ({parent.match_id}) a déjà commencé"
+        return None
+
+    def _repechage_losers(self, semifinal: Match) -> List[Player]:
+        """Athlètes battus par le vainqueur d'une demi-finale, du premier tour à la demi-finale"""
+        bracket = self.brackets[semifinal.category]
+        finalist = semifinal.winner_player
+        losers = []
+        match = semifinal
+        while match:
+            losers.append(match.loser_player)
+            # Descendre vers le match d'où vient le finaliste (aucun s'il était exempt)
+            children = (2 * match.bracket_slot + 1, 2 * match.bracket_slot + 2)
+            match = next((self.matches[bracket[child]] for child in children
+                          if child < len(bracket) and bracket[child]
+                          and self.matches[bracket[child]].winner_player is finalist), None)
+        losers.reverse()
+        return losers
+
+    def generate_repechage(self, semifinal: Match) -> List[Match]:
+        """Crée la chaîne de repêchage de la moitié de tableau d'une demi-finale terminée
+
+        Les deux premiers battus du finaliste s'affrontent, le vainqueur rencontre
+        le battu suivant, et ainsi de suite jusqu'au battu de la demi-finale :
+        le vainqueur du dernier repêchage obtient la médaille de bronze.
+        """
+        category = semifinal.category
+        losers = self._repechage_losers(semifinal)
+        if len(losers) < 2:
+            # Seul le demi-finaliste a perdu contre le finaliste : bronze direct
+            return []
+        
+        # Repêchages programmés au tour des demi-finales, à la suite de ses matchs :
+        # la médaille de bronze se dispute avant la finale
+        round_number = semifinal.round_number
+        match_number = 1 + sum(1 for match_id in self.rounds.get(round_number, [])
+                               if self.matches[match_id].category == category)
+        half = "A" if semifinal.bracket_slot == 1 else "B"
+        
+        matches = []
+        for index, loser in enumerate(losers[1:], start=1):
+            match = Match(
+                match_id=f"{category}_REP{half}_M{index}",
+                blue_player=losers[0] if index == 1 else None,
+                red_player=loser,
+                round_number=round_number,
+                match_number=match_number,
+                category=category
+            )
+            match.repechage = True
+            if matches:
+                matches[-1].next_match_id = match.match_id
+            matches.append(match)
+            match_number += 1
+        
+        for player in losers:
+            player.eliminated = False
+        for match in matches:
+            self._register_match(match)
+        print(f"Repêchage {category} ({half}): {len(matches)} match(s) pour {len(losers)} athlètes")
+        
+        self.dirty_categories.add(category)
+        self._journal_round(category, round_number, matches)
         return matches
 
     def generate_next_round(self, category: str) -> List[Match]:
         """Génère les matchs du tour suivant en fonction des gagnants du tour précédent"""
-        current_round = self.current_round
+        # Tableau complet créé au tirage : les vainqueurs y avancent à chaque résultat.
+        # Une poule n'a pas de tour suivant.
+        if category in self.brackets or category in self.pool_standings:
+            return []
+        
+        # Chaque catégorie avance à son propre rythme
+        current_round = self.category_round(category)
         next_round = current_round + 1
         
         # Récupérer les matchs du tour actuel pour cette catégorie
@@ -260,6 +1164,9 @@ class Tournament:
         # Vérifier que tous les matchs sont terminés
         if not all(match.completed for match in current_matches):
             return []
+        # Finale déjà comptée : la catégorie est terminée
+        if category in self.finished_categories:
+            return []
         
         # Récupérer les gagnants
         winners = []
@@ -277,6 +1184,14 @@ class Tournament:
                 match.blue_player.losses += 1
                 match.blue_player.eliminated = True
         
+        # Un seul vainqueur (ou finale nulle) : pas de tour suivant ni d'exempt
+        if len(winners) <= 1:
+            self.finished_categories.add(category)
+            self.dirty_categories.add(category)
+            # Tour vide : le journal conserve le bilan des finalistes
+            self._journal_round(category, next_round, [], finished=True)
+            return []
+        
         # Si nombre impair, ajouter un bye
         if len(winners) % 2 != 0:
             # Le dernier joueur passe automatiquement au tour suivant
@@ -302,15 +1217,12 @@ class Tournament:
                     category=category
                 )
                 
-                self.matches[match_id] = match
+                self._register_match(match)
                 matches.append(match)
                 match_number += 1
         
-        # Enregistrer les matchs pour ce tour
-        if next_round not in self.rounds:
-            self.rounds[next_round] = []
-        
-        self.rounds[next_round].extend([match.match_id for match in matches])
+        self.dirty_categories.add(category)
+        self._journal_round(category, next_round, matches)
         return matches
 
     def get_next_match(self, category: Optional[str] = None) -> Optional[Match]:
@@ -318,7 +1230,7 @@ class Tournament:
         for round_num in sorted(self.rounds.keys()):
             for match_id in self.rounds[round_num]:
                 match = self.matches[match_id]
-                if not match.completed and (category is None or match.category == category):
+                if not match.completed and match.is_ready and (category is None or match.category == category):
                     return match
         return None
         
@@ -340,12 +1252,25 @@ class Tournament:
 
     def update_match_result(self, match_id: str, blue_score: int, red_score: int, 
                            blue_gam_jeom: int, red_gam_jeom: int, winner: str, 
-                           round_winners: List[str]) -> None:
-        """Met à jour les résultats d'un match"""
+                           round_winners: List[str]) -> bool:
+        """Met à jour les résultats d'un match (faux si une correction n'est plus possible)"""
         if match_id not in self.matches:
-            return
+            return False
+        blocked = self.correction_blocked(match_id, winner)
+        if blocked:
+            print(f"Correction du match {match_id} refusée: {blocked}")
+            return False
         
         match = self.matches[match_id]
+        was_completed = match.completed
+        # Compter les matchs restants avant de marquer celui-ci terminé
+        round_progress = self.round_progress[match.category]
+        # Classement de poule (construit avant la mise à jour) : retirer l'ancien résultat d'une correction
+        if match.pool and self.pool_standings and was_completed:
+            self._record_pool_result(match, -1)
+        if was_completed:
+            # Correction : le vainqueur a pu changer, requalifier dans le match parent
+            self._withdraw_result(match)
         match.blue_score = blue_score
         match.red_score = red_score
         match.blue_gam_jeom = blue_gam_jeom
@@ -353,6 +1278,7 @@ class Tournament:
         match.winner = winner
         match.round_winners = round_winners
         match.completed = True
+        self.dirty_categories.add(match.category)
         
         # Mettre à jour les statistiques des joueurs
         if match.blue_player:
@@ -362,24 +1288,152 @@ class Tournament:
         if match.red_player:
             match.red_player.points_scored += red_score
             match.red_player.points_received += blue_score
+        
+        self._advance_winner(match)
+        if not was_completed:
+            round_progress[match.round_number] -= 1
+        if match.pool:
+            self._record_pool_result(match, 1)
+        
+        self._journal("result", {
+            "match_id": match_id,
+            "blue_score": blue_score,
+            "red_score": red_score,
+            "blue_gam_jeom": blue_gam_jeom,
+            "red_gam_jeom": red_gam_jeom,
+            "winner": winner,
+            "round_winners": list(round_winners)
+        })
+        
+        # Dernier match du tour : la catégorie génère seule son tour suivant
+        # (pendant une relecture, ce tour figure déjà dans le journal)
+        if (not was_completed and not self._replaying and not match.pool
+                and match.category not in self.brackets and not round_progress[match.round_number]):
+            self.generate_next_round(match.category)
+        
+        # Demi-finale décidée : les battus du finaliste entrent en repêchage
+        if (not was_completed and not self._replaying and match.bracket_slot in (1, 2)
+                and match.category in self.repechage_categories):
+            self.generate_repechage(match)
+        return True
+
+    def header_to_dict(self) -> Dict[str, Any]:
+        """Retourne les informations générales du tournoi (hors joueurs et matchs)"""
+        return {
+            "name": self.name,
+            "date": self.date,
+            "location": self.location,
+            "tournament_id": self.tournament_id,
+            "format_version": TOURNAMENT_FORMAT_VERSION,
+            "current_round": self.current_round,
+            "journal_seq": self.journal_seq,
+            "draw_seeds": dict(self.draw_seeds),
+            "repechage_categories": sorted(self.repechage_categories),
+            "finished_categories": sorted(self.finished_categories),
+            "mat_current": {str(mat): list(current) for mat, current in self.mat_current.items()},
+            "last_bout_end": dict(self.last_bout_end),
+            "category_order": dict(self.category_order)
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Résumé du tournoi pour l'index des tournois récents"""
+        return {
+            "tournament_id": self.tournament_id,
+            "name": self.name,
+            "date": self.date,
+            "location": self.location,
+            "categories": len(self.categories) + len(self.unloaded_shards),
+            "players": len(self.players),
+            "matches": len(self.matches),
+            "completed_matches": sum(1 for match in self.matches.values() if match.completed)
+        }
+
+    @classmethod
+    def from_header(cls, data: Dict[str, Any]) -> 'Tournament':
+        """Crée un tournoi vide à partir de ses informations générales"""
+        tournament = cls(data["name"], data["date"], data["location"])
+        tournament.tournament_id = data["tournament_id"]
+        tournament.current_round = data["current_round"]
+        tournament.journal_seq = data.get("journal_seq", 0)
+        tournament.draw_seeds = dict(data.get("draw_seeds", {}))
+        tournament.repechage_categories = set(data.get("repechage_categories", []))
+        tournament.finished_categories = set(data.get("finished_categories", []))
+        tournament.mat_current = {int(mat): (current[0], current[1])
+                                  for mat, current in data.get("mat_current", {}).items()}
+        tournament.last_bout_end = dict(data.get("last_bout_end", {}))
+        tournament.category_order = dict(data.get("category_order", {}))
+        return tournament
+
+    @staticmethod
+    def _serialized_entries(objects: Dict[str, TrackedModel],
+                            cache: Dict[str, Tuple[TrackedModel, int, str]]) -> List[str]:
+        """Retourne les entrées JSON des objets en ne resérialisant que ceux modifiés"""
+        if len(cache) > len(objects):
+            # Des objets ont été retirés : repartir d'un cache propre
+            cache.clear()
+        
+        entries = []
+        for key, obj in objects.items():
+            cached = cache.get(key)
+            if cached is None or cached[0] is not obj or cached[1] != obj._version:
+                entry = f"{json.dumps(key, ensure_ascii=False)}: {json.dumps(obj.to_dict(), ensure_ascii=False)}"
+                cache[key] = (obj, obj._version, entry)
+            else:
+                entry = cached[2]
+            entries.append(entry)
+        return entries
+
+    def build_snapshot(self) -> Dict[str, Any]:
+        """Construit une copie indépendante de l'état complet, prête à être écrite"""
+        # Appelée depuis le thread Tk : l'écriture peut ensuite se faire ailleurs.
+        # Seuls les joueurs et matchs modifiés depuis la dernière fois sont resérialisés.
+        return {
+            "header": self.header_to_dict(),
+            "players": self._serialized_entries(self.players, self._player_fragments),
+            "matches": self._serialized_entries(self.matches, self._match_fragments),
+            "categories": {category: list(pids) for category, pids in self.categories.items()},
+            "rounds": {round_number: list(mids) for round_number, mids in self.rounds.items()}
+        }
+
+    @staticmethod
+    def render_snapshot(snapshot: Dict[str, Any]) -> str:
+        """Assemble le texte JSON d'un instantané à partir des entrées déjà sérialisées"""
+        fields = [f"{json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}"
+                  for key, value in snapshot["header"].items()]
+        fields.append('"players": {\n' + ",\n".join(snapshot["players"]) + "\n}")
+        fields.append('"matches": {\n' + ",\n".join(snapshot["matches"]) + "\n}")
+        fields.append(f'"categories": {json.dumps(snapshot["categories"], ensure_ascii=False)}')
+        fields.append(f'"rounds": {json.dumps(snapshot["rounds"], ensure_ascii=False)}')
+        return "{\n" + ",\n".join(fields) + "\n}\n"
+
+    def write_snapshot(self, snapshot: Dict[str, Any], file_path: str) -> None:
+        """Écrit un instantané de façon atomique puis retire du journal ce qu'il contient"""
+        write_file_atomic(file_path, self.render_snapshot(snapshot))
+        if self.journal_path and self.journal_path == self.journal_path_for(file_path):
+            self.compact_journal(snapshot["header"]["journal_seq"])
+
+    def compact_journal(self, upto_seq: int) -> None:
+        """Supprime du journal les événements déjà inclus dans l'instantané"""
+        with self._journal_lock:
+            if not os.path.exists(self.journal_path):
+                return
+            
+            # Des événements ont pu être ajoutés pendant l'écriture de l'instantané
+            kept = []
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        if json.loads(line)["seq"] > upto_seq:
+                            kept.append(line)
+                    except json.JSONDecodeError:
+                        break
+            write_file_atomic(self.journal_path, "".join(kept))
+            self.journal_pending = len(kept)
 
     def save_to_file(self, file_path: str) -> bool:
         """Sauvegarde le tournoi dans un fichier JSON"""
         try:
-            data = {
-                "name": self.name,
-                "date": self.date,
-                "location": self.location,
-                "tournament_id": self.tournament_id,
-                "current_round": self.current_round,
-                "players": {pid: player.to_dict() for pid, player in self.players.items()},
-                "matches": {mid: match.to_dict() for mid, match in self.matches.items()},
-                "categories": self.categories,
-                "rounds": self.rounds
-            }
-            
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4, ensure_ascii=False)
+            self.write_snapshot(self.build_snapshot(), file_path)
             return True
         except Exception as e:
             print(f"Erreur lors de la sauvegarde du tournoi: {e}")
@@ -387,32 +1441,157 @@ class Tournament:
 
     @classmethod
     def load_from_file(cls, file_path: str) -> Optional['Tournament']:
-        """Charge un tournoi depuis un fichier JSON"""
+        """Charge un tournoi depuis un fichier JSON et rejoue son journal d'événements"""
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
             
-            tournament = cls(data["name"], data["date"], data["location"])
-            tournament.tournament_id = data["tournament_id"]
-            tournament.current_round = data["current_round"]
+            tournament = cls.from_header(data)
             
             # Charger les joueurs
             for pid, player_data in data["players"].items():
                 tournament.players[pid] = Player.from_dict(player_data)
             
-            # Charger les matchs
+            # Charger les matchs en les reliant aux joueurs déjà chargés
             for mid, match_data in data["matches"].items():
-                tournament.matches[mid] = Match.from_dict(match_data)
+                tournament.matches[mid] = Match.from_dict(match_data, tournament.players)
             
             # Charger les catégories et les tours
             tournament.categories = data["categories"]
             tournament.rounds = {int(k): v for k, v in data["rounds"].items()}
             
+            # Reconstruire l'état depuis l'instantané puis les événements journalisés
+            tournament.attach_journal(file_path)
+            replayed = tournament.replay_journal()
+            if replayed:
+                print(f"{replayed} événement(s) du journal rejoué(s)")
+            
             return tournament
         except Exception as e:
             print(f"Erreur lors du chargement du tournoi: {e}")
             return None
 
+    @staticmethod
+    def shard_file_name(category: str) -> str:
+        """Nom de fichier (sans caractère interdit) du fragment d'une catégorie"""
+        safe_name = re.sub(r'[^\w\-]+', '_', category).strip('_') or "categorie"
+        digest = hashlib.md5(category.encode('utf-8')).hexdigest()[:8]
+        return f"{safe_name}_{digest}.json"
+
+    def build_sharded_snapshot(self, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Construit le manifeste et les fragments des catégories demandées (modifiées par défaut)"""
+        if categories is None:
+            categories = [category for category in self.categories if category in self.dirty_categories]
+        
+        # Répartir les matchs et les tours par catégorie
+        category_set = set(categories)
+        matches_by_category: Dict[str, Dict[str, Match]] = {category: {} for category in categories}
+        rounds_by_category: Dict[str, Dict[int, List[str]]] = {category: {} for category in categories}
+        for round_number, match_ids in self.rounds.items():
+            for mid in match_ids:
+                match = self.matches[mid]
+                if match.category in category_set:
+                    matches_by_category[match.category][mid] = match
+                    rounds_by_category[match.category].setdefault(round_number, []).append(mid)
+        
+        shards = {}
+        for category in categories:
+            players = {pid: self.players[pid] for pid in self.categories.get(category, []) if pid in self.players}
+            shards[self.shard_file_name(category)] = {
+                "category": category,
+                "player_ids": list(self.categories.get(category, [])),
+                "players": self._serialized_entries(players, {}),
+                "matches": self._serialized_entries(matches_by_category[category], {}),
+                "rounds": rounds_by_category[category]
+            }
+        self.dirty_categories.difference_update(categories)
+        
+        manifest = self.header_to_dict()
+        manifest["shards"] = dict(self.unloaded_shards)
+        manifest["shards"].update({category: self.shard_file_name(category) for category in self.categories})
+        return {"manifest": manifest, "shards": shards}
+
+    def write_sharded_snapshot(self, snapshot: Dict[str, Any], directory: str) -> None:
+        """Écrit les fragments modifiés puis le manifeste (chaque fichier de façon atomique)"""
+        shard_dir = os.path.join(directory, SHARD_DIRECTORY_NAME)
+        os.makedirs(shard_dir, exist_ok=True)
+        try:
+            for file_name, shard in snapshot["shards"].items():
+                fields = [
+                    f'"category": {json.dumps(shard["category"], ensure_ascii=False)}',
+                    f'"player_ids": {json.dumps(shard["player_ids"], ensure_ascii=False)}',
+                    '"players": {\n' + ",\n".join(shard["players"]) + "\n}",
+                    '"matches": {\n' + ",\n".join(shard["matches"]) + "\n}",
+                    f'"rounds": {json.dumps(shard["rounds"], ensure_ascii=False)}'
+                ]
+                write_file_atomic(os.path.join(shard_dir, file_name), "{\n" + ",\n".join(fields) + "\n}\n")
+        except Exception:
+            # Les catégories non écrites devront l'être à la prochaine sauvegarde
+            self.dirty_categories.update(shard["category"] for shard in snapshot["shards"].values())
+            raise
+        
+        write_file_atomic(os.path.join(directory, SHARD_MANIFEST_NAME),
+                          json.dumps(snapshot["manifest"], indent=4, ensure_ascii=False))
+
+    def save_sharded(self, directory: str, categories: Optional[List[str]] = None) -> bool:
+        """Sauvegarde le tournoi en un manifeste et un fichier par catégorie"""
+        try:
+            if categories is None:
+                categories = list(self.categories)
+            self.write_sharded_snapshot(self.build_sharded_snapshot(categories), directory)
+            return True
+        except Exception as e:
+            print(f"Erreur lors de la sauvegarde fragmentée du tournoi: {e}")
+            return False
+
+    @classmethod
+    def load_sharded(cls, directory: str, categories: Optional[List[str]] = None) -> Optional['Tournament']:
+        """Charge un tournoi fragmenté, éventuellement limité à quelques catégories"""
+        try:
+            with open(os.path.join(directory, SHARD_MANIFEST_NAME), 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+            
+            tournament = cls.from_header(manifest)
+            wanted = manifest["shards"] if categories is None else {
+                category: manifest["shards"][category] for category in categories if category in manifest["shards"]
+            }
+            tournament.unloaded_shards = {category: file_name for category, file_name in manifest["shards"].items()
+                                          if category not in wanted}
+            
+            for category, file_name in wanted.items():
+                shard_path = os.path.join(directory, SHARD_DIRECTORY_NAME, file_name)
+                if not os.path.exists(shard_path):
+                    # Catégorie déclarée mais jamais écrite (aucun joueur sauvegardé)
+                    tournament.categories[category] = []
+                    continue
+                with open(shard_path, 'r', encoding='utf-8') as file:
+                    shard = json.load(file)
+                
+                for pid, player_data in shard["players"].items():
+                    tournament.players[pid] = Player.from_dict(player_data)
+                tournament.categories[category] = shard["player_ids"]
+                for mid, match_data in shard["matches"].items():
+                    tournament.matches[mid] = Match.from_dict(match_data, tournament.players)
+                for round_number, match_ids in shard["rounds"].items():
+                    tournament.rounds.setdefault(int(round_number), []).extend(match_ids)
+            
+            return tournament
+        except Exception as e:
+            print(f"Erreur lors du chargement du tournoi fragmenté: {e}")
+            return None
+
+    @classmethod
+    def convert_file(cls, file_path: str, output_path: Optional[str] = None) -> bool:
+        """Convertit un fichier de tournoi existant au format à références par identifiant"""
+        tournament = cls.load_from_file(file_path)
+        if not tournament:
+            return False
+        
+        output_path = output_path or file_path
+        if output_path != file_path:
+            tournament.attach_journal(None)
+        return tournament.save_to_file(output_path)
+
 class TournamentManager:
     """Gestionnaire de tournoi avec interface utilisateur"""
     def __init__(self, parent):
@@ -422,12 +1601,221 @@ class TournamentManager:
         os.makedirs(self.data_dir, exist_ok=True)
         # Ordre de passage des catégories (catégorie -> ordre)
         self.category_order = {}
+        # File de priorité des matchs prêts (import local : le module dépend de celui-ci)
+        from match_scheduler import MatchScheduler
+        from mat_scheduler import MatScheduler
+        self.scheduler = MatchScheduler(self.category_order)
+        # Répartition des matchs prêts sur les tapis
+        self.mats = MatScheduler(self.scheduler)
+        # Mode journal : chaque résultat, tirage ou tour est ajouté au journal
+        # au lieu de réécrire tout le fichier du tournoi
+        self.journal_mode = True
+        # Nombre d'événements au-delà duquel un nouvel instantané complet est écrit
+        self.journal_compact_threshold = 200
+        # Stockage : "json" (instantané + journal), "sqlite" (base indexée)
+        # ou "sharded" (manifeste + un fichier par catégorie)
+        self.storage_backend = "json"
+        self.store = None
+        # Fichier (ou dossier des catégories) du tournoi ouvert depuis le disque ou copié
+        # d'une archive ; None pour un tournoi créé ici, rangé d'après son identifiant
+        self.working_path: Optional[str] = None
+        # Sauvegarde automatique en arrière-plan : les demandes rapprochées sont
+        # regroupées en une seule écriture après autosave_delay_ms
+        self.autosave_delay_ms = 1500
+        self.autosave_worker = AutosaveWorker()
+        self._autosave_after_id = None
+        self._autosave_polling = False
+        # Rappel (état, message) pour afficher l'état de la sauvegarde sans boîte modale
+        self.on_save_status: Optional[Callable[[str, str], None]] = None
+        # Index des tournois enregistrés (chargé à la première utilisation)
+        self._index: Optional[TournamentIndex] = None
     
-    def create_new_tournament(self, name: str, date: str, location: str) -> Tournament:
-        """Crée un nouveau tournoi"""
+    @property
+    def index(self) -> TournamentIndex:
+        """Index des tournois récents du dossier de données"""
+        if self._index is None:
+            self._index = TournamentIndex(self.data_dir)
+        return self._index
+    
+    def get_index_path(self) -> Optional[str]:
+        """Chemin à ouvrir pour recharger le tournoi actuel"""
+        file_path = self.get_tournament_file_path()
+        if file_path and self.storage_backend == "sharded":
+            return os.path.join(file_path, SHARD_MANIFEST_NAME)
+        return file_path
+    
+    def _update_index(self) -> None:
+        """Met à jour les métadonnées du tournoi actuel dans l'index (écriture en arrière-plan)"""
+        if not self.tournament:
+            return
+        self.index.update(self.get_index_path(), self.tournament.summary())
+        entries = dict(self.index.entries)
+        self.autosave_worker.submit(lambda: self.index.save(entries), key="index")
+        self._start_autosave_polling()
+    
+    def _get_root(self):
+        """Fenêtre Tk utilisée pour planifier les tâches différées (None hors interface)"""
+        return getattr(self.parent, 'root', None)
+    
+    def request_autosave(self) -> None:
+        """Demande une sauvegarde en arrière-plan (regroupée avec les demandes suivantes)"""
+        if not self.tournament or self.store:
+            # La base SQLite est déjà à jour après chaque événement
+            return
+        
+        root = self._get_root()
+        if root is None:
+            self._submit_autosave()
+        elif self._autosave_after_id is None:
+            self._autosave_after_id = root.after(self.autosave_delay_ms, self._submit_autosave)
+    
+    def _submit_autosave(self) -> None:
+        """Capture l'état du tournoi et confie son écriture au thread de sauvegarde"""
+        self._autosave_after_id = None
+        if not self.tournament or self.store:
+            return
+        
+        tournament = self.tournament
+        file_path = self.get_tournament_file_path()
+        # L'instantané est construit ici (thread Tk) ; sérialisation et écriture
+        # disque se font dans le thread de sauvegarde
+        if self.storage_backend == "sharded":
+            # Seules les catégories modifiées sont réécrites
+            data = tournament.build_sharded_snapshot()
+            self.autosave_worker.submit(lambda: tournament.write_sharded_snapshot(data, file_path))
+        else:
+            data = tournament.build_snapshot()
+            self.autosave_worker.submit(lambda: tournament.write_snapshot(data, file_path))
+        self._update_index()
+    
+    def _start_autosave_polling(self) -> None:
+        """Relaie périodiquement l'état de la sauvegarde vers l'interface"""
+        root = self._get_root()
+        if root is None or self._autosave_polling:
+            return
+        self._autosave_polling = True
+        root.after(100, self._poll_autosave_status)
+    
+    def _poll_autosave_status(self) -> None:
+        while not self.autosave_worker.events.empty():
+            state, message = self.autosave_worker.events.get_nowait()
+            if self.on_save_status:
+                self.on_save_status(state, message)
+        
+        if self.autosave_worker.is_idle and self.autosave_worker.events.empty():
+            self._autosave_polling = False
+        else:
+            self._get_root().after(100, self._poll_autosave_status)
+    
+    def flush_autosave(self, timeout: Optional[float] = None) -> bool:
+        """Écrit immédiatement la sauvegarde en attente et attend sa fin"""
+        if self._autosave_after_id is not None:
+            self._get_root().after_cancel(self._autosave_after_id)
+            self._submit_autosave()
+        return self.autosave_worker.flush(timeout)
+    
+    def _cancel_autosave(self) -> None:
+        """Abandonne les sauvegardes automatiques qui n'ont pas encore commencé"""
+        if self._autosave_after_id is not None:
+            self._get_root().after_cancel(self._autosave_after_id)
+            self._autosave_after_id = None
+        self.autosave_worker.cancel_pending()
+        self.autosave_worker.flush()
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Termine les sauvegardes en cours avant la fermeture de l'application"""
+        self.flush_autosave(timeout)
+        self.autosave_worker.stop(timeout)
+        self._close_store()
+    
+    def get_tournament_file_path(self) -> Optional[str]:
+        """Retourne le chemin du fichier du tournoi actuel"""
+        if not self.tournament:
+            return None
+        if self.working_path:
+            return self.working_path
+        if self.storage_backend == "sharded":
+            # Dossier contenant le manifeste et un fichier par catégorie
+            return os.path.join(self.data_dir, self.tournament.tournament_id)
+        extension = ".db" if self.storage_backend == "sqlite" else ".json"
+        return os.path.join(self.data_dir, f"{self.tournament.tournament_id}{extension}")
+    
+    def _open_store(self, db_path: str):
+        """Ouvre la base SQLite du tournoi (en fermant la précédente)"""
+        from tournament_store import SQLiteTournamentStore
+        self._close_store()
+        try:
+            # Un seul poste à la fois : la base est verrouillée tant qu'elle est ouverte ici
+            self.store = SQLiteTournamentStore(db_path, exclusive=True)
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'ouverture de la base {db_path}: {e}")
+            messagebox.showerror("Erreur", "Base du tournoi inaccessible : "
+                                 "elle est peut-être ouverte sur un autre poste")
+            return None
+        return self.store
+    
+    def _close_store(self) -> None:
+        """Ferme la base SQLite éventuellement ouverte"""
+        if self.store:
+            self.store.close()
+            self.store = None
+    
+    def create_new_tournament(self, name: str, date: str, location: str,
+                              storage_backend: Optional[str] = None) -> Tournament:
+        """Crée un nouveau tournoi (dans le format de stockage donné, sinon le format actuel)"""
+        self.flush_autosave()
+        self._close_store()
+        self.working_path = None
+        if storage_backend:
+            self.storage_backend = storage_backend
         self.tournament = Tournament(name, date, location)
+        self._write_storage()
+        self._bind_schedulers(self.tournament)
+        self._update_index()
         return self.tournament
     
+    def _write_storage(self) -> bool:
+        """Écrit le tournoi actuel dans le format self.storage_backend et y rattache ses événements"""
+        tournament = self.tournament
+        tournament.attach_journal(None)
+        file_path = self.get_tournament_file_path()
+        if self.storage_backend == "sqlite":
+            store = self._open_store(file_path)
+            if store is None:
+                return False
+            success = store.save_tournament(tournament)
+            store.bind(tournament)
+            return success
+        if self.storage_backend == "sharded":
+            return tournament.save_sharded(file_path)
+        if self.journal_mode:
+            # Instantané initial sur lequel le journal viendra s'appuyer
+            tournament.attach_journal(file_path)
+        return tournament.save_to_file(file_path)
+    
+    def change_storage_backend(self, storage_backend: str) -> bool:
+        """Enregistre le tournoi actuel dans un autre format, utilisé ensuite pour ses sauvegardes"""
+        if not self.tournament or storage_backend == self.storage_backend:
+            return False
+        if self.tournament.unloaded_shards:
+            messagebox.showerror("Erreur", "Chargez toutes les catégories avant de changer de format")
+            return False
+        
+        self.flush_autosave()
+        self._close_store()
+        previous, previous_path = self.storage_backend, self.working_path
+        # Le nouveau format est rangé dans le dossier des tournois
+        self.storage_backend, self.working_path = storage_backend, None
+        if not self._write_storage():
+            # Revenir au format précédent, toujours à jour
+            self._close_store()
+            self.storage_backend, self.working_path = previous, previous_path
+            self._write_storage()
+            messagebox.showerror("Erreur", "Impossible d'enregistrer le tournoi dans ce format")
+            return False
+        self._update_index()
+        return True
+    
     def import_players(self) -> int:
         """Ouvre une boîte de dialogue pour importer des joueurs depuis un CSV"""
         if not self.tournament:
@@ -456,103 +1844,290 @@ class TournamentManager:
             messagebox.showerror("Erreur", "Aucun tournoi à sauvegarder")
             return False
         
-        file_path = os.path.join(self.data_dir, f"{self.tournament.tournament_id}.json")
-        success = self.tournament.save_to_file(file_path)
+        # Une sauvegarde automatique plus ancienne ne doit pas écraser celle-ci
+        self._cancel_autosave()
+        if self.store:
+            success = self.store.save_tournament(self.tournament)
+        elif self.storage_backend == "sharded":
+            success = self.tournament.save_sharded(self.get_tournament_file_path())
+        else:
+            success = self.tournament.save_to_file(self.get_tournament_file_path())
         
         if success:
+            self._update_index()
             messagebox.showinfo("Sauvegarde", "Tournoi sauvegardé avec succès")
         else:
             messagebox.showerror("Erreur", "Erreur lors de la sauvegarde du tournoi")
         
         return success
     
-    def load_tournament(self) -> Optional[Tournament]:
-        """Charge un tournoi existant"""
-        file_path = filedialog.askopenfilename(
+    def checkpoint(self) -> bool:
+        """Rend les dernières modifications durables sans réécrire tout le tournoi si possible"""
+        if not self.tournament:
+            return False
+        
+        # La base SQLite est mise à jour à chaque événement
+        if self.store:
+            self._update_index()
+            return True
+        
+        # En mode journal, les événements sont déjà sur disque : on ne réécrit
+        # l'instantané complet que lorsque le journal devient trop long
+        if (self.storage_backend == "json" and self.journal_mode and self.tournament.journal_path
+                and self.tournament.journal_pending < self.journal_compact_threshold):
+            self._update_index()
+            return True
+        
+        # Réécriture complète confiée au thread de sauvegarde
+        self.request_autosave()
+        return True
+    
+    def choose_tournament_file(self) -> Optional[str]:
+        """Propose les tournois récents de l'index, ou un fichier quelconque"""
+        entries = self.index.recent()
+        if entries:
+            dialog = RecentTournamentsDialog(self._get_root(), entries)
+            dialog.wait_window()
+            if dialog.result != RecentTournamentsDialog.BROWSE:
+                return dialog.result
+        
+        return filedialog.askopenfilename(
             title="Charger un tournoi",
             initialdir=self.data_dir,
-            filetypes=[("Fichiers JSON", "*.json"), ("Tous les fichiers", "*.*")]
+            filetypes=[("Tournois", f"*.json;*.db;*{ARCHIVE_EXTENSION}"), ("Fichiers JSON", "*.json"),
+                       ("Bases SQLite", "*.db"), ("Archives", f"*{ARCHIVE_EXTENSION}"),
+                       ("Tous les fichiers", "*.*")]
         )
+    
+    def load_tournament(self, file_path: Optional[str] = None) -> Optional[Tournament]:
+        """Charge un tournoi existant"""
+        if file_path is None:
+            file_path = self.choose_tournament_file()
         
         if not file_path:
             return None
         
-        tournament = Tournament.load_from_file(file_path)
+        self.flush_autosave()
+        working_path = None
+        if file_path.lower().endswith(".db"):
+            self.storage_backend = "sqlite"
+            store = self._open_store(file_path)
+            tournament = store.load_tournament() if store else None
+            if tournament:
+                store.bind(tournament)
+                working_path = file_path
+            else:
+                self._close_store()
+        elif os.path.basename(file_path) == SHARD_MANIFEST_NAME:
+            self.storage_backend = "sharded"
+            self._close_store()
+            tournament = Tournament.load_sharded(os.path.dirname(file_path))
+            working_path = os.path.dirname(file_path)
+        elif file_path.lower().endswith(ARCHIVE_EXTENSION):
+            # L'archive reste intacte : on travaille sur une copie JSON dans le dossier des tournois
+            from tournament_archive import import_archive
+            self.storage_backend = "json"
+            self._close_store()
+            tournament = import_archive(file_path)
+            if tournament:
+                working_path = self._fresh_working_path(tournament.tournament_id)
+                tournament.attach_journal(working_path if self.journal_mode else None)
+                tournament.save_to_file(working_path)
+        else:
+            self.storage_backend = "json"
+            self._close_store()
+            tournament = Tournament.load_from_file(file_path)
+            if tournament and not self.journal_mode:
+                tournament.attach_journal(None)
+            # Sauvegardes et journal restent sur le fichier ouvert (copie d'archive, autre dossier)
+            working_path = file_path
+        
         if tournament:
             self.tournament = tournament
+            self.working_path = working_path
+            self._bind_schedulers(tournament)
+            self._update_index()
             messagebox.showinfo("Chargement", "Tournoi chargé avec succès")
         else:
             messagebox.showerror("Erreur", "Erreur lors du chargement du tournoi")
         
         return tournament
     
+    def _fresh_working_path(self, tournament_id: str) -> str:
+        """Fichier de travail inutilisé pour la copie d'une archive (sans écraser un tournoi en cours)"""
+        # Ni l'instantané ni son journal ne doivent exister : un journal restant
+        # serait rejoué sur l'état plus ancien de l'archive au prochain chargement
+        base = os.path.join(self.data_dir, f"{tournament_id}_archive")
+        working_path, number = f"{base}.json", 1
+        while os.path.exists(working_path) or os.path.exists(Tournament.journal_path_for(working_path)):
+            number += 1
+            working_path = f"{base}_{number}.json"
+        return working_path
+
+    def export_archive(self, file_path: Optional[str] = None, compression: str = "lzma") -> bool:
+        """Exporte le tournoi actuel dans une archive compressée"""
+        if not self.tournament:
+            messagebox.showerror("Erreur", "Aucun tournoi à archiver")
+            return False
+        
+        if file_path is None:
+            file_path = filedialog.asksaveasfilename(
+                title="Archiver le tournoi",
+                initialdir=self.data_dir,
+                initialfile=f"{self.tournament.tournament_id}{ARCHIVE_EXTENSION}",
+                defaultextension=ARCHIVE_EXTENSION,
+                filetypes=[("Archives", f"*{ARCHIVE_EXTENSION}"), ("Tous les fichiers", "*.*")]
+            )
+            if not file_path:
+                return False
+        
+        from tournament_archive import export_archive
+        try:
+            export_archive(self.tournament, file_path, compression)
+        except Exception as e:
+            print(f"Erreur lors de l'archivage du tournoi: {e}")
+            messagebox.showerror("Erreur", f"Erreur lors de l'archivage du tournoi: {e}")
+            return False
+        
+        messagebox.showinfo("Archivage", "Tournoi archivé avec succès")
+        return True
+    
     def get_next_match(self, category: Optional[str] = None) -> Optional[Match]:
         """Récupère le prochain match non terminé"""
         if not self.tournament:
             return None
         
-        return self.tournament.get_next_match(category)
+        return self.scheduler.next_match(category)
+    
+    def start_next_match(self, mat: int = 1) -> Optional[Match]:
+        """Lance sur un tapis le prochain match de sa file d'attente dont les athlètes sont reposés"""
+        if not self.tournament:
+            return None
+        
+        return self.mats.start_next(mat)
         
+    def _bind_schedulers(self, tournament: Tournament) -> None:
+        """Branche les files d'attente sur un tournoi, dans son ordre de passage enregistré"""
+        self.category_order = dict(tournament.category_order)
+        self.scheduler.category_order = dict(self.category_order)
+        self.scheduler.bind(tournament)
+        self.mats.reset()
+    
     def set_category_order(self, category_order: Dict[str, int]):
         """Définit l'ordre de passage des catégories"""
         self.category_order = category_order
+        self.scheduler.set_category_order(category_order)
         print(f"Ordre des catégories défini: {category_order}")
-        # Sauvegarder immédiatement l'ordre
+        # L'ordre fait partie du tournoi (en-tête et journal) ; sauvegarde en arrière-plan
         if self.tournament:
-            self.save_tournament()
+            self.tournament.set_category_order(category_order)
+            self.request_autosave()
     
     def get_matches_by_category(self) -> Dict[str, List[Match]]:
-        """Récupère les matchs organisés par catégorie"""
+        """Récupère les matchs non terminés par catégorie, dans l'ordre de passage"""
         if not self.tournament:
             return {}
         
-        # Récupérer les matchs par catégorie
-        matches_by_category = self.tournament.get_matches_by_category()
-        
-        # Si un ordre de catégories est défini, trier le dictionnaire selon cet ordre
-        if self.category_order:
-            # Créer un nouveau dictionnaire trié
-            sorted_matches = {}
-            
-            # Trier les catégories selon l'ordre défini
-            sorted_categories = sorted(
-                matches_by_category.keys(),
-                key=lambda cat: self.category_order.get(cat, float('inf'))
-            )
-            
-            # Reconstruire le dictionnaire dans l'ordre
-            for category in sorted_categories:
-                sorted_matches[category] = matches_by_category[category]
-                
-            return sorted_matches
-        
-        return matches_by_category
+        return self.scheduler.pending_by_category()
     
     def update_match_result(self, match_id: str, blue_score: int, red_score: int, 
                            blue_gam_jeom: int, red_gam_jeom: int, winner: str, 
-                           round_winners: List[str]) -> None:
-        """Met à jour les résultats d'un match"""
+                           round_winners: List[str]) -> bool:
+        """Met à jour les résultats d'un match (faux si la correction est refusée)"""
         if not self.tournament:
-            return
+            return False
         
+        blocked = self.tournament.correction_blocked(match_id, winner)
+        if blocked:
+            messagebox.showerror("Correction impossible", f"Le vainqueur ne peut plus être changé : {blocked}")
+            return False
         self.tournament.update_match_result(
             match_id, blue_score, red_score, blue_gam_jeom, red_gam_jeom, winner, round_winners
         )
+        # Libérer le tapis et démarrer le repos des deux athlètes
+        self.mats.complete(match_id)
+        return True
     
     def generate_next_round(self, category: str) -> List[Match]:
         """Génère les matchs du tour suivant pour une catégorie"""
         if not self.tournament:
             return []
         
-        if self.tournament.current_round == 1:
-            matches = self.tournament.generate_first_round(category)
-        else:
-            matches = self.tournament.generate_next_round(category)
+        # Chaque catégorie suit sa propre progression (tirage puis tours successifs)
+        if category not in self.tournament.round_progress:
+            return self.tournament.generate_first_round(category)
+        return self.tournament.generate_next_round(category)
+
+class RecentTournamentsDialog(tk.Toplevel):
+    """Liste des tournois récents lue depuis l'index (aucun fichier de tournoi n'est ouvert)"""
+    BROWSE = "__browse__"
+
+    def __init__(self, parent, entries: List[Dict[str, Any]]):
+        super().__init__(parent)
+        self.entries = entries
+        self.result: Optional[str] = None
+        self.title("Tournois récents")
+        self.geometry("760x420")
+        if parent is not None:
+            self.transient(parent)
+        self.grab_set()
         
-        if matches:
-            self.tournament.current_round += 1
+        self.create_widgets()
+    
+    def create_widgets(self):
+        """Crée les widgets de la boîte de dialogue"""
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
         
-        return matches
+        ttk.Label(main_frame, text="Tournois récents", font=("Arial", 14, "bold")).pack(pady=(0, 10))
+        
+        table_frame = ttk.Frame(main_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("name", "date", "location", "categories", "progress", "modified")
+        headings = ("Nom", "Date", "Lieu", "Catégories", "Progression", "Modifié le")
+        scrollbar = ttk.Scrollbar(table_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings",
+                                 yscrollcommand=scrollbar.set, selectmode="browse")
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.tree.yview)
+        
+        for column, heading in zip(columns, headings):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=110, anchor=tk.W)
+        self.tree.column("name", width=180)
+        
+        for position, entry in enumerate(self.entries):
+            progress = f"{entry.get('completed_matches', 0)}/{entry.get('matches', 0)} matchs"
+            modified = time.strftime("%d/%m/%Y %H:%M", time.localtime(entry["last_modified"]))
+            self.tree.insert("", tk.END, iid=str(position), values=(
+                entry.get("name", ""), entry.get("date", ""), entry.get("location", ""),
+                entry.get("categories", 0), progress, modified
+            ))
+        
+        if self.entries:
+            self.tree.selection_set("0")
+        self.tree.bind("<Double-1>", lambda event: self.open_selected())
+        
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(btn_frame, text="Ouvrir", command=self.open_selected).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Parcourir...", command=self.browse).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Annuler", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+    
+    def open_selected(self):
+        """Ouvre le tournoi sélectionné"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        self.result = self.entries[int(selection[0])]["path"]
+        self.destroy()
+    
+    def browse(self):
+        """Choisit un fichier hors de l'index"""
+        self.result = self.BROWSE
+        self.destroy()
 
 class TournamentDialog(tk.Toplevel):
     """Boîte de dialogue pour créer ou charger un tournoi"""
@@ -617,8 +2192,13 @@ class TournamentDialog(tk.Toplevel):
         self.location_var = tk.StringVar()
         ttk.Entry(self.create_frame, textvariable=self.location_var, width=30).grid(row=2, column=1, sticky=tk.W, pady=5)
         
+        ttk.Label(self.create_frame, text="Stockage:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.storage_var = tk.StringVar(value=STORAGE_BACKENDS[self.tournament_manager.storage_backend])
+        ttk.Combobox(self.create_frame, textvariable=self.storage_var, values=list(STORAGE_BACKENDS.values()),
+                     state="readonly", width=28).grid(row=3, column=1, sticky=tk.W, pady=5)
+        
         btn_frame2 = ttk.Frame(self.create_frame)
-        btn_frame2.grid(row=3, column=0, columnspan=2, pady=10)
+        btn_frame2.grid(row=4, column=0, columnspan=2, pady=10)
         
         create_tournament_btn = ttk.Button(btn_frame2, text="Créer", command=self.create_tournament)
         create_tournament_btn.pack(side=tk.LEFT, padx=5)
@@ -640,7 +2220,8 @@ class TournamentDialog(tk.Toplevel):
             messagebox.showerror("Erreur", "Veuillez remplir tous les champs")
             return
         
-        tournament = self.tournament_manager.create_new_tournament(name, date, location)
+        storage_backend = next(key for key, label in STORAGE_BACKENDS.items() if label == self.storage_var.get())
+        tournament = self.tournament_manager.create_new_tournament(name, date, location, storage_backend)
         if tournament:
             messagebox.showinfo("Succès", "Tournoi créé avec succès")
             self.show_import_players()
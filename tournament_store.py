@@ -0,0 +1,237 @@
+import json
+import sqlite3
+from typing import List, Dict, Any, Optional
+
+from tournament_manager import Player, Match, Tournament
+
+# Attente maximale (secondes) du verrou d'une base déjà ouverte par un autre poste
+LOCK_TIMEOUT = 1.0
+
+# Schéma de la base : les colonnes indexées servent aux recherches,
+# la colonne "data" conserve l'enregistrement complet (to_dict)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tournament (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    club TEXT NOT NULL,
+    country TEXT NOT NULL,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_club ON players (club);
+CREATE INDEX IF NOT EXISTS idx_players_category ON players (category);
+CREATE TABLE IF NOT EXISTS category_players (
+    category TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    PRIMARY KEY (category, position)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    match_id TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    round_number INTEGER NOT NULL,
+    match_number INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    blue_player_id TEXT,
+    red_player_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_category_round ON matches (category, round_number, completed);
+"""
+
+
+class SQLiteTournamentStore:
+    """Stockage d'un tournoi dans une base SQLite indexée"""
+    # Le magasin s'abonne aux événements du tournoi : chaque résultat, tirage
+    # ou ajout de joueur ne met à jour que les lignes concernées
+    # exclusive : la base reste verrouillée jusqu'à sa fermeture ; sqlite3.Error si un
+    # autre poste la tient encore après timeout secondes
+    def __init__(self, db_path: str, exclusive: bool = False, timeout: float = LOCK_TIMEOUT):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=timeout)
+        try:
+            if exclusive:
+                # Chaque poste écrit des lignes complètes depuis sa propre copie du tournoi :
+                # un second poste sur la même base écraserait les résultats du premier
+                self.conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+            if exclusive:
+                # Prendre le verrou dès l'ouverture plutôt qu'à la première écriture
+                self.conn.execute("BEGIN EXCLUSIVE")
+                self.conn.execute("COMMIT")
+        except sqlite3.Error:
+            self.conn.close()
+            raise
+        self.tournament: Optional[Tournament] = None
+
+    def close(self) -> None:
+        """Ferme la connexion à la base"""
+        self.unbind()
+        self.conn.close()
+
+    def bind(self, tournament: Tournament) -> None:
+        """Synchronise la base avec les événements du tournoi"""
+        self.unbind()
+        self.tournament = tournament
+        tournament.add_journal_listener(self.apply_records)
+
+    def unbind(self) -> None:
+        """Cesse de suivre les événements du tournoi"""
+        if self.tournament:
+            self.tournament.remove_journal_listener(self.apply_records)
+            self.tournament = None
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def save_tournament(self, tournament: Tournament) -> bool:
+        """Écrit l'intégralité du tournoi dans la base (une seule transaction)"""
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM players")
+                self.conn.execute("DELETE FROM category_players")
+                self.conn.execute("DELETE FROM matches")
+                self._write_header(tournament)
+                self._write_players(tournament.players.values())
+                for category, player_ids in tournament.categories.items():
+                    self.conn.executemany(
+                        "INSERT INTO category_players (category, position, player_id) VALUES (?, ?, ?)",
+                        [(category, position, pid) for position, pid in enumerate(player_ids)]
+                    )
+                # Insérer les matchs dans l'ordre des tours pour conserver l'ordre de passage
+                for round_number in sorted(tournament.rounds):
+                    self._write_matches(tournament.matches[mid] for mid in tournament.rounds[round_number])
+            return True
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la sauvegarde SQLite du tournoi: {e}")
+            return False
+
+    def apply_records(self, records: List[Dict[str, Any]]) -> None:
+        """Applique un lot d'événements du tournoi dans une seule transaction"""
+        tournament = self.tournament
+        if not tournament:
+            return
+
+        try:
+            with self.conn:
+                for record in records:
+                    event, data = record["event"], record["data"]
+                    if event == "add_player":
+                        player = tournament.players[data["id"]]
+                        self._write_players([player])
+                        self.conn.execute(
+                            "INSERT INTO category_players (category, position, player_id) "
+                            "SELECT ?, COALESCE(MAX(position) + 1, 0), ? FROM category_players WHERE category = ?",
+                            (player.category, player.id, player.category)
+                        )
+                    elif event == "update_player":
+                        player = tournament.players[data["id"]]
+                        self._write_players([player])
+                        # Changement de catégorie : placer le joueur à la fin de la nouvelle liste
+                        moved = self.conn.execute(
+                            "DELETE FROM category_players WHERE player_id = ? AND category != ?",
+                            (player.id, player.category)
+                        ).rowcount
+                        if moved:
+                            self.conn.execute(
+                                "INSERT INTO category_players (category, position, player_id) "
+                                "SELECT ?, COALESCE(MAX(position) + 1, 0), ? FROM category_players WHERE category = ?",
+                                (player.category, player.id, player.category)
+                            )
+                    elif event == "remove_player":
+                        self.conn.execute("DELETE FROM players WHERE id = ?", (data["id"],))
+                        self.conn.execute("DELETE FROM category_players WHERE player_id = ?", (data["id"],))
+                    elif event == "round":
+                        self._write_matches(tournament.matches[m["match_id"]] for m in data["matches"])
+                        self._write_players(tournament.players[pid] for pid in data["players"])
+                    elif event == "result":
+                        match = tournament.matches[data["match_id"]]
+                        # Le match parent du tableau reçoit le vainqueur
+                        parent = tournament.bracket_parent(match)
+                        self._write_matches([match, parent] if parent else [match])
+                        self._write_players([p for p in (match.blue_player, match.red_player) if p])
+                    self._write_header(tournament)
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la mise à jour SQLite du tournoi: {e}")
+
+    def _write_header(self, tournament: Tournament) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO tournament (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in tournament.header_to_dict().items()]
+        )
+
+    def _write_players(self, players) -> None:
+        self.conn.executemany(
+            "INSERT INTO players (id, name, club, country, category, data) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name, club = excluded.club, "
+            "country = excluded.country, category = excluded.category, data = excluded.data",
+            [(p.id, p.name, p.club, p.country, p.category, json.dumps(p.to_dict(), ensure_ascii=False))
+             for p in players]
+        )
+
+    def _write_matches(self, matches) -> None:
+        # ON CONFLICT ... DO UPDATE conserve le rowid, donc l'ordre d'insertion
+        self.conn.executemany(
+            "INSERT INTO matches (match_id, category, round_number, match_number, completed, "
+            "blue_player_id, red_player_id, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(match_id) DO UPDATE SET completed = excluded.completed, "
+            "blue_player_id = excluded.blue_player_id, red_player_id = excluded.red_player_id, "
+            "data = excluded.data",
+            [(m.match_id, m.category, m.round_number, m.match_number, int(m.completed),
+              m.blue_player.id if m.blue_player else None,
+              m.red_player.id if m.red_player else None,
+              json.dumps(m.to_dict(), ensure_ascii=False))
+             for m in matches]
+        )
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def load_tournament(self) -> Optional[Tournament]:
+        """Reconstruit le tournoi complet depuis la base"""
+        try:
+            header = {key: json.loads(value) for key, value in
+                      self.conn.execute("SELECT key, value FROM tournament")}
+            if not header:
+                return None
+
+            tournament = Tournament.from_header(header)
+            for pid, data in self.conn.execute("SELECT id, data FROM players"):
+                tournament.players[pid] = Player.from_dict(json.loads(data))
+
+            for category, pid in self.conn.execute(
+                    "SELECT category, player_id FROM category_players ORDER BY category, position"):
+                tournament.categories.setdefault(category, []).append(pid)
+
+            for mid, round_number, data in self.conn.execute(
+                    "SELECT match_id, round_number, data FROM matches ORDER BY round_number, rowid"):
+                tournament.matches[mid] = Match.from_dict(json.loads(data), tournament.players)
+                tournament.rounds.setdefault(round_number, []).append(mid)
+
+            return tournament
+        except (sqlite3.Error, KeyError, ValueError) as e:
+            print(f"Erreur lors du chargement SQLite du tournoi: {e}")
+            return None
+
+    def match_ids_for_category(self, category: str, round_number: Optional[int] = None) -> List[str]:
+        """Matchs d'une catégorie (éventuellement d'un seul tour)"""
+        if round_number is None:
+            rows = self.conn.execute(
+                "SELECT match_id FROM matches WHERE category = ? ORDER BY round_number, match_number",
+                (category,)
+            )
+        else:
+            rows = self.conn.execute(
+                "SELECT match_id FROM matches WHERE category = ? AND round_number = ? ORDER BY match_number",
+                (category, round_number)
+            )
+        return [row[0] for row in rows]
+
+    def player_ids_by_club(self, club: str) -> List[str]:
+        """Identifiants des joueurs d'un club"""
+        return [row[0] for row in self.conn.execute("SELECT id FROM players WHERE club = ?", (club,))]
@@ -0,0 +1,169 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import List, Dict, Any, Optional, Tuple
+
+class VirtualTreeview(ttk.Frame):
+    """Tableau qui ne crée des lignes Treeview que pour la partie visible d'une grande liste"""
+    # Les données restent dans self.rows ; self.view liste les indices filtrés et triés
+    # et quelques dizaines d'éléments Treeview sont réutilisés pendant le défilement
+    BUFFER = 10  # lignes créées en plus des lignes visibles
+    DEFAULT_ROW_HEIGHT = 20
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.columns: List[str] = []
+        self.rows: List[Dict[str, Any]] = []
+        self.view: List[int] = []
+        self.offset = 0  # indice dans view de la première ligne affichée
+        self.visible_count = 20
+        self.sort_column: Optional[str] = None
+        self.sort_descending = False
+        self.filter_text = ""
+        # Index en mémoire, construits à la demande puis conservés jusqu'au prochain set_rows
+        self._sorted: Dict[str, List[int]] = {}  # colonne -> indices triés par ordre croissant
+        self._search: Optional[List[str]] = None  # texte en minuscules de chaque ligne
+
+        self.tree = ttk.Treeview(self, show="headings", selectmode="browse")
+        self.y_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        x_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscrollcommand=x_scrollbar.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.y_scrollbar.grid(row=0, column=1, sticky="ns")
+        x_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.yview("scroll", int(-1 * (e.delta / 120)) * 3, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+        self.tree.bind("<Prior>", lambda e: self.yview("scroll", -1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.yview("scroll", 1, "pages"))
+
+    @property
+    def row_count(self) -> int:
+        """Nombre de lignes après filtrage"""
+        return len(self.view)
+
+    def set_rows(self, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+        """Remplace les données affichées (les index de tri et de recherche sont reconstruits à la demande)"""
+        self.columns = list(columns)
+        self.rows = rows
+        self._sorted = {}
+        self._search = None
+        if self.sort_column not in self.columns:
+            self.sort_column, self.sort_descending = None, False
+
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = self.columns
+        for column in self.columns:
+            self.tree.heading(column, command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=100, anchor=tk.W)
+        self.refresh_view()
+
+    def set_filter(self, text: str) -> None:
+        """N'affiche que les lignes contenant le texte (toutes colonnes, sans casse)"""
+        self.filter_text = text.strip().casefold()
+        self.refresh_view()
+
+    def sort_by(self, column: str) -> None:
+        """Trie par une colonne ; un second clic inverse l'ordre"""
+        if self.sort_column == column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column, self.sort_descending = column, False
+        self.refresh_view()
+
+    @staticmethod
+    def _sort_key(value: Any) -> Tuple[int, Any]:
+        """Nombres d'abord et par valeur, puis texte sans casse"""
+        try:
+            return (0, float(value))
+        except (TypeError, ValueError):
+            return (1, str(value).casefold())
+
+    def _order(self) -> List[int]:
+        """Indices de toutes les lignes dans l'ordre de tri courant"""
+        if self.sort_column is None:
+            return list(range(len(self.rows)))
+        order = self._sorted.get(self.sort_column)
+        if order is None:
+            column = self.sort_column
+            keys = [self._sort_key(row.get(column, "")) for row in self.rows]
+            order = sorted(range(len(self.rows)), key=keys.__getitem__)
+            self._sorted[column] = order
+        return order[::-1] if self.sort_descending else order
+
+    def refresh_view(self) -> None:
+        """Recalcule la liste filtrée et triée puis revient en haut"""
+        order = self._order()
+        if self.filter_text:
+            if self._search is None:
+                self._search = [" ".join(str(row.get(column, "")) for column in self.columns).casefold()
+                                for row in self.rows]
+            search, needle = self._search, self.filter_text
+            order = [index for index in order if needle in search[index]]
+        self.view = order
+
+        for column in self.columns:
+            arrow = ""
+            if column == self.sort_column:
+                arrow = " ▼" if self.sort_descending else " ▲"
+            self.tree.heading(column, text=column.capitalize() + arrow)
+        self.offset = 0
+        self.render()
+
+    def on_resize(self, event=None) -> None:
+        """Adapte le nombre de lignes visibles à la hauteur du tableau"""
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            row_height = int(row_height) or self.DEFAULT_ROW_HEIGHT
+        except (TypeError, ValueError):
+            row_height = self.DEFAULT_ROW_HEIGHT
+        # Une ligne est occupée par les en-têtes
+        visible_count = max(1, self.tree.winfo_height() // row_height - 1)
+        if visible_count != self.visible_count:
+            self.visible_count = visible_count
+            self.render()
+
+    def yview(self, *args) -> None:
+        """Défilement (commande de la barre de défilement, molette, pages)"""
+        if not args:
+            return
+        max_offset = max(0, len(self.view) - self.visible_count)
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * len(self.view))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= self.visible_count
+            offset = self.offset + step
+        else:
+            return
+        offset = min(max(offset, 0), max_offset)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def render(self) -> None:
+        """Remplit les éléments Treeview réutilisés avec les lignes de la fenêtre courante"""
+        needed = max(0, min(self.visible_count + self.BUFFER, len(self.view) - self.offset))
+        items = list(self.tree.get_children())
+        if len(items) > needed:
+            self.tree.delete(*items[needed:])
+            items = items[:needed]
+        while len(items) < needed:
+            items.append(self.tree.insert("", tk.END))
+
+        columns, rows, view = self.columns, self.rows, self.view
+        for position, item in enumerate(items):
+            row = rows[view[self.offset + position]]
+            self.tree.item(item, values=[row.get(column, "") for column in columns])
+        # Les lignes tampon sont sous le bord : le Treeview lui-même ne défile jamais
+        self.tree.yview_moveto(0)
+
+        total = len(self.view)
+        if total:
+            self.y_scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_count) / total))
+        else:
+            self.y_scrollbar.set(0, 1)